@@ -0,0 +1,211 @@
+"""
+End-to-end scraper throughput against the local fixture server
+- Starts benchmarks/fixture_server.py with --jobs cards and --latency per response
+- Runs each engine (sync = scrape_wwr_professional, async, http, crawl) in
+  its own process, so peak RSS is per engine, inside a scratch directory
+- Reports jobs/sec, p50/p95 per-job latency, peak RSS (Python + browser) and
+  export time, all taken from the run's wwr_metrics.Metrics
+- --save-baseline writes the results; --baseline compares against them and
+  exits 1 when any engine regresses by more than --threshold
+
+Usage: python benchmarks/end_to_end.py --jobs 100 --latency 0.05 --engines sync async http crawl
+       python benchmarks/end_to_end.py --save-baseline bench_baseline.json
+       python benchmarks/end_to_end.py --baseline bench_baseline.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from fixture_server import FixtureServer
+
+ENGINES = ['sync', 'async', 'http', 'crawl']
+RESULT_MARKER = 'BENCH_RESULT '
+
+# Jobs whose latency includes a detail page fetch
+FETCHED_SOURCES = ('detail', 'http', 'browser')
+
+# metric -> True when bigger is better
+REGRESSION_METRICS = {
+    'jobs_per_sec': True,
+    'p95_job_seconds': False,
+    'export_seconds': False,
+    'peak_rss_mb': False,
+}
+
+
+def _peak_rss_mb(who):
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = resource.getrusage(who).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+# ============================================================
+# Child process: one engine, one run
+# ============================================================
+
+def run_engine(engine, base_url, workers, rate, load_profile):
+    import asyncio
+
+    import wwr
+    from wwr_checkpoint import Checkpoint
+    from wwr_metrics import Metrics, percentile
+    from wwr_ratelimit import RateLimiter
+    from wwr_store import JobStore
+
+    metrics = Metrics()
+    checkpoint = JobStore('bench_store.sqlite3') if engine == 'crawl' else Checkpoint('bench_checkpoint.jsonl')
+    limiter = RateLimiter(rate=rate, max_rate=rate)
+    options = wwr.ScrapeOptions(base_url=base_url, metrics=metrics, limiter=limiter, load_profile=load_profile)
+
+    start = time.perf_counter()
+    if engine == 'crawl':
+        wwr.scrape_wwr_crawl(processes=workers, store=checkpoint, options=options)
+    elif engine == 'async':
+        asyncio.run(wwr.scrape_wwr_async(workers=workers, per_host_limit=workers, checkpoint=checkpoint,
+                                         options=options))
+    elif engine == 'http':
+        wwr.scrape_wwr_http(workers=workers, checkpoint=checkpoint, options=options)
+    else:
+        wwr.scrape_wwr_professional(checkpoint=checkpoint, options=options)
+    wall = time.perf_counter() - start
+
+    summary = metrics.summary()
+    export_seconds = sum(stats['sum'] for name, stats in summary['stages'].items() if name.startswith('export.'))
+    fetched = sorted(job['seconds'] for job in summary['job_latencies'] if job['source'] in FETCHED_SOURCES)
+
+    return {
+        'engine': engine,
+        'jobs': checkpoint.count,
+        'scrape_seconds': wall - export_seconds,
+        'jobs_per_sec': checkpoint.count / (wall - export_seconds) if wall > export_seconds else 0.0,
+        'p50_job_seconds': percentile(fetched, 50),
+        'p95_job_seconds': percentile(fetched, 95),
+        'export_seconds': export_seconds,
+        'peak_rss_mb': _peak_rss_mb(resource.RUSAGE_SELF),
+        'browser_peak_rss_mb': _peak_rss_mb(resource.RUSAGE_CHILDREN),
+        'counters': summary['counters'],
+    }
+
+
+def run_engine_in_subprocess(engine, base_url, args):
+    """Run one engine in a fresh interpreter inside a scratch directory."""
+    with tempfile.TemporaryDirectory(prefix=f'wwr_bench_{engine}_') as workdir:
+        command = [sys.executable, str(Path(__file__).resolve()), '--child', engine, '--base-url', base_url,
+                   '--workers', str(args.workers), '--rate', str(args.rate),
+                   '--load-profile', args.load_profile]
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(ROOT), os.environ.get('PYTHONPATH')])))
+        proc = subprocess.run(command, cwd=workdir, env=env, capture_output=True, text=True)
+
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+            if result['jobs']:
+                return result
+            break
+
+    print(f"❌ {engine} engine failed (exit {proc.returncode}):")
+    print(proc.stdout[-2000:])
+    print(proc.stderr[-2000:])
+    return None
+
+
+# ============================================================
+# Parent process: server, report, regression gate
+# ============================================================
+
+def _fmt(value, pattern):
+    return '-' if value is None else pattern.format(value)
+
+
+def print_report(results, jobs, latency):
+    print(f"\n{jobs} jobs, {latency * 1000:.0f} ms simulated latency")
+    print(f"{'engine':<8} {'jobs':>5} {'jobs/s':>8} {'p50 job':>9} {'p95 job':>9} "
+          f"{'export':>8} {'RSS MB':>8} {'browser MB':>11}")
+    for r in results:
+        print(f"{r['engine']:<8} {r['jobs']:>5} {r['jobs_per_sec']:>8.2f} "
+              f"{_fmt(r['p50_job_seconds'], '{:.3f}s'):>9} {_fmt(r['p95_job_seconds'], '{:.3f}s'):>9} "
+              f"{r['export_seconds']:>7.2f}s {r['peak_rss_mb']:>8.0f} {r['browser_peak_rss_mb']:>11.0f}")
+
+
+def regressions(results, baseline, threshold):
+    """Human-readable list of every metric that got worse than baseline by more than threshold."""
+    previous = {r['engine']: r for r in baseline['results']}
+    found = []
+    for r in results:
+        old = previous.get(r['engine'])
+        if not old:
+            continue
+        for metric, higher_is_better in REGRESSION_METRICS.items():
+            before, after = old.get(metric), r.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if (-change if higher_is_better else change) > threshold:
+                found.append(f"{r['engine']}: {metric} {before:.3f} -> {after:.3f} ({change:+.0%})")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end scraper benchmark against a local fixture server')
+    parser.add_argument('--jobs', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.05, help='Seconds added to every fixture response')
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=ENGINES)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=1000.0,
+                        help='Fixed rate-limiter pace in pages/second (the real polite pace would dominate every run)')
+    parser.add_argument('--load-profile', default='full')
+    parser.add_argument('--baseline', help='Fail if results regress against this file')
+    parser.add_argument('--save-baseline', help='Write results to this file')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='Allowed relative regression before failing (0.2 = 20%%)')
+    parser.add_argument('--child', choices=ENGINES, help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        result = run_engine(args.child, args.base_url, args.workers, args.rate, args.load_profile)
+        print(RESULT_MARKER + json.dumps(result))
+        return 0
+
+    results = []
+    with FixtureServer(args.jobs, args.latency, args.jitter) as server:
+        for engine in args.engines:
+            print(f"▶️  {engine} engine against {server.base_url} ...")
+            result = run_engine_in_subprocess(engine, server.base_url, args)
+            if result is None:
+                return 1
+            results.append(result)
+
+    print_report(results, args.jobs, args.latency)
+
+    report = {'jobs': args.jobs, 'latency': args.latency, 'workers': args.workers, 'results': results}
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baseline saved: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            found = regressions(results, json.load(f), args.threshold)
+        if found:
+            print(f"\n❌ Regressions beyond {args.threshold:.0%}:")
+            for line in found:
+                print(f"   • {line}")
+            return 1
+        print(f"\n✅ No regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
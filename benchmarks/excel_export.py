@@ -0,0 +1,135 @@
+"""
+Excel export: pandas write + reload-and-restyle vs single-pass write-only writer
+- Rows are synthetic job records with realistic long descriptions
+- The reload-and-restyle baseline is the Excel step wwr.py used before wwr_excel
+- Reports wall time and file size per writer and row count; --memory adds a
+  second, traced run for peak Python memory (tracing slows the writers down)
+
+Usage: python benchmarks/excel_export.py --rows 1000 10000 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+from openpyxl.utils import get_column_letter
+from selectolax.lexbor import LexborHTMLParser
+
+from fixtures import card_html, detail_page_html
+from wwr_excel import COLUMN_WIDTHS, write_excel
+from wwr_extract import CARD_FIELDS, COLUMN_ORDER, card_from_payload, extract_static, parse_detail_html
+
+TEMPLATE_JOBS = 50
+
+
+def sample_records(n):
+    """n job records cycled from TEMPLATE_JOBS parsed fixture pages."""
+    templates = []
+    for i in range(1, TEMPLATE_JOBS + 1):
+        card = LexborHTMLParser(card_html(i)).css_first('li.feature')
+        job_data, _ = card_from_payload(extract_static(card, CARD_FIELDS))
+        templates.append(parse_detail_html(detail_page_html(i), job_data))
+    return [templates[i % TEMPLATE_JOBS] for i in range(n)]
+
+
+def legacy_excel(records, excel_filename):
+    df = pd.DataFrame(list(records))
+    existing_columns = [col for col in COLUMN_ORDER if col in df.columns]
+    df = df[existing_columns]
+
+    with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='Remote Jobs')
+
+    wb = load_workbook(excel_filename)
+    ws = wb['Remote Jobs']
+
+    header_fill = PatternFill(start_color='1F4E78', end_color='1F4E78', fill_type='solid')
+    header_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
+    cell_font = Font(name='Calibri', size=10)
+    cell_alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
+    thin_border = Border(
+        left=Side(style='thin', color='D3D3D3'),
+        right=Side(style='thin', color='D3D3D3'),
+        top=Side(style='thin', color='D3D3D3'),
+        bottom=Side(style='thin', color='D3D3D3')
+    )
+
+    for cell in ws[1]:
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = Alignment(horizontal='center', vertical='center')
+        cell.border = thin_border
+    ws.row_dimensions[1].height = 25
+
+    for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
+        for cell in row:
+            cell.font = cell_font
+            cell.alignment = cell_alignment
+            cell.border = thin_border
+
+    for idx, column in enumerate(existing_columns, 1):
+        ws.column_dimensions[get_column_letter(idx)].width = COLUMN_WIDTHS.get(column, 15)
+
+    ws.freeze_panes = 'A2'
+    ws.auto_filter.ref = ws.dimensions
+
+    light_gray_fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
+    for row_idx in range(3, ws.max_row + 1, 2):
+        for cell in ws[row_idx]:
+            if cell.fill.start_color.rgb != header_fill.start_color.rgb:
+                cell.fill = light_gray_fill
+
+    wb.save(excel_filename)
+
+
+def measure(writer, records, excel_filename, trace_memory=False):
+    start = time.perf_counter()
+    writer(iter(records), excel_filename)
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        writer(iter(records), excel_filename)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return elapsed, peak, os.path.getsize(excel_filename)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--skip-legacy-above', type=int, default=None,
+                        help='Only run the reload-and-restyle baseline up to this many rows')
+    parser.add_argument('--memory', action='store_true', help='Also report peak traced memory')
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("📊 EXCEL EXPORT BENCHMARK")
+    print("=" * 80)
+    print(f"{'rows':>8}  {'writer':<18}{'seconds':>10}{'peak MB':>10}{'file MB':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.rows:
+            records = sample_records(n)
+            writers = [('single-pass', write_excel)]
+            if args.skip_legacy_above is None or n <= args.skip_legacy_above:
+                writers.insert(0, ('reload+restyle', legacy_excel))
+
+            for label, writer in writers:
+                elapsed, peak, size = measure(writer, records, os.path.join(tmp, f'{label}_{n}.xlsx'), args.memory)
+                peak_mb = f"{peak / 1024 / 1024:.1f}" if peak is not None else '-'
+                print(f"{n:>8}  {label:<18}{elapsed:>10.2f}{peak_mb:>10}{size / 1024 / 1024:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Local WeWorkRemotely stand-in for offline benchmarks
+- Serves front_page_html() at /, category_page_html() at /categories/<slug>,
+  detail_page_html(i) at /remote-jobs/<slug> and feed_xml() at
+  /remote-jobs.rss and /categories/<slug>.rss
+- front_page_jobs < jobs leaves some jobs reachable only through categories
+- Every response waits `latency` seconds (+/- `jitter`) to mimic the network
+- Threaded, so concurrent engines really overlap their requests
+
+Usage: python benchmarks/fixture_server.py --jobs 200 --latency 0.05 --port 8000
+       python wwr.py --base-url http://127.0.0.1:8000
+"""
+import argparse
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from fixtures import CATEGORY_SLUGS, category_page_html, detail_page_html, feed_xml, front_page_html, job_fields
+
+
+class FixtureServer:
+    """Context manager running the fixture site on a background thread."""
+
+    def __init__(self, jobs=100, latency=0.0, jitter=0.0, port=0, paragraphs=12, front_page_jobs=None):
+        self.jobs = jobs
+        self.latency = latency
+        self.jitter = jitter
+        self.requests = 0
+
+        front_page = front_page_html(jobs if front_page_jobs is None else front_page_jobs).encode('utf-8')
+        categories = {f'/categories/{slug}': category_page_html(slug, jobs).encode('utf-8') for slug in CATEGORY_SLUGS}
+        details = {f"/remote-jobs/{job_fields(i)['slug']}": i for i in range(1, jobs + 1)}
+        feeds = {}  # built once the port is known, feeds carry absolute links
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # keep-alive, like the real site
+
+            def do_GET(self):
+                server.requests += 1
+                delay = server.latency + random.uniform(-server.jitter, server.jitter)
+                if delay > 0:
+                    time.sleep(delay)
+
+                path = self.path.split('?')[0]
+                content_type = 'text/html; charset=utf-8'
+                if path == '/':
+                    body = front_page
+                elif path in feeds:
+                    body = feeds[path]
+                    content_type = 'application/rss+xml; charset=utf-8'
+                elif path in categories:
+                    body = categories[path]
+                elif path in details:
+                    body = detail_page_html(details[path], paragraphs).encode('utf-8')
+                else:
+                    self.send_error(404)
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        feeds['/remote-jobs.rss'] = feed_xml(jobs, self.base_url).encode('utf-8')
+        for slug in CATEGORY_SLUGS:
+            feeds[f'/categories/{slug}.rss'] = feed_xml(jobs, self.base_url, slug).encode('utf-8')
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve synthetic WeWorkRemotely pages locally')
+    parser.add_argument('--jobs', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Random +/- seconds on top of --latency')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--front-page-jobs', type=int, help='Cards on the homepage (default: all of --jobs)')
+    args = parser.parse_args()
+
+    with FixtureServer(args.jobs, args.latency, args.jitter, args.port, front_page_jobs=args.front_page_jobs) as server:
+        print(f"🌐 Serving {args.jobs} jobs at {server.base_url} (latency {args.latency * 1000:.0f} ms) - Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,165 @@
+"""
+Synthetic WeWorkRemotely pages for offline benchmarks
+- front_page_html(n): main page with n li.feature cards and the category links
+- category_page_html(slug, n): listing page with every job up to n in that category
+- detail_page_html(i): the matching job detail page
+- feed_xml(n, base_url, slug): RSS feed of the same jobs, in card order
+Markup mirrors the selectors in wwr_extract.py.
+"""
+import html
+
+TITLES = ['Senior Python Engineer', 'Product Designer', 'DevOps Engineer', 'Customer Success Manager',
+          'Full-Stack Developer', 'Data Analyst', 'Technical Writer', 'Marketing Lead']
+COMPANIES = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Stark', 'Wayne']
+REGIONS = ['Anywhere in the World', 'USA Only', 'Europe Only', 'Americas Only']
+JOB_TYPES = ['Full-Time', 'Contract', 'Part-Time']
+CATEGORIES = ['Full-Stack Programming', 'Design', 'DevOps and Sysadmin', 'Customer Support',
+              'Back-End Programming', 'Sales and Marketing']
+SALARY_BANDS = ['$25,000 - $48,999 USD', '$50,000 - $74,999 USD', '$75,000 - $99,999 USD', '$100,000 or more USD']
+
+LOCKED_EVERY = 10
+
+
+def category_slug(category):
+    return 'remote-' + category.lower().replace(' ', '-') + '-jobs'
+
+
+CATEGORY_SLUGS = [category_slug(category) for category in CATEGORIES]
+
+
+def job_fields(i):
+    """Deterministic field values for job number i (1-based)."""
+    company = COMPANIES[i % len(COMPANIES)]
+    title = TITLES[i % len(TITLES)]
+    slug = f"{company.lower()}-{title.lower().replace(' ', '-')}-{i}"
+    return {
+        'slug': slug,
+        'title': title,
+        'company': company,
+        'company_slug': company.lower(),
+        'headquarters': ['Berlin', 'New York', 'Lagos', 'Toronto'][i % 4],
+        'region': REGIONS[i % len(REGIONS)],
+        'job_type': JOB_TYPES[i % len(JOB_TYPES)],
+        'category': CATEGORIES[i % len(CATEGORIES)],
+        'salary_band': SALARY_BANDS[i % len(SALARY_BANDS)],
+        'locked': i % LOCKED_EVERY == 0,
+    }
+
+
+def card_html(i):
+    f = {k: html.escape(v) if isinstance(v, str) else v for k, v in job_fields(i).items()}
+    link_class = 'listing-link--locked' if f['locked'] else 'listing-link--unlocked'
+    return f"""
+<li class="feature">
+  <div class="tooltip--flag-logo">
+    <a href="/company/{f['company_slug']}">
+      <div class="tooltip--flag-logo__flag-logo"
+           style="background-image:url(https://we-work-remotely.imgix.net/logos/{f['company_slug']}.png)"></div>
+    </a>
+  </div>
+  <a class="{link_class}" href="/remote-jobs/{f['slug']}">
+    <div class="new-listing">
+      <div class="new-listing__header"><h4 class="new-listing__header__title">{f['title']}</h4></div>
+      <p class="new-listing__company-name">{f['company']}</p>
+      <p class="new-listing__company-headquarters">{f['headquarters']}</p>
+      <div class="new-listing__categories">
+        <p class="new-listing__categories__category">Featured</p>
+        <p class="new-listing__categories__category">{f['job_type']}</p>
+        <p class="new-listing__categories__category">{f['salary_band']}</p>
+      </div>
+    </div>
+  </a>
+</li>"""
+
+
+def _categories_nav():
+    links = ''.join(f'<li><a href="/categories/{slug}">{html.escape(category)}</a></li>'
+                    for category, slug in zip(CATEGORIES, CATEGORY_SLUGS))
+    return f'<nav class="categories"><ul>{links}</ul></nav>'
+
+
+def front_page_html(n):
+    cards = ''.join(card_html(i) for i in range(1, n + 1))
+    return f"""<!DOCTYPE html>
+<html><head><title>We Work Remotely</title></head>
+<body>{_categories_nav()}<section class="jobs"><ul>{cards}
+</ul></section></body></html>"""
+
+
+def category_page_html(slug, n):
+    category = CATEGORIES[CATEGORY_SLUGS.index(slug)]
+    cards = ''.join(card_html(i) for i in range(1, n + 1) if job_fields(i)['category'] == category)
+    return f"""<!DOCTYPE html>
+<html><head><title>Remote {html.escape(category)} Jobs</title></head>
+<body>{_categories_nav()}<section class="jobs"><ul>{cards}
+</ul></section></body></html>"""
+
+
+def feed_item_xml(i, base_url):
+    f = job_fields(i)
+    description = (f"<img src=\"https://we-work-remotely.imgix.net/logos/{f['company_slug']}.png\" alt=\"\" />"
+                   f"<p><strong>Headquarters:</strong> {f['headquarters']} <br />"
+                   f"<strong>URL:</strong> <a href=\"https://{f['company_slug']}.example.com\">"
+                   f"https://{f['company_slug']}.example.com</a><br />"
+                   f"<strong>Salary:</strong> {f['salary_band']}</p><p>About the {f['title']} role.</p>")
+    return f"""
+<item>
+  <title>{html.escape(f['company'])}: {html.escape(f['title'])}</title>
+  <region>{html.escape(f['region'])}</region>
+  <category>{html.escape(f['category'])}</category>
+  <type>{f['job_type']}</type>
+  <description>{html.escape(description)}</description>
+  <pubDate>Mon, 27 Oct 2025 19:43:58 +0000</pubDate>
+  <guid>{base_url}/remote-jobs/{f['slug']}</guid>
+  <link>{base_url}/remote-jobs/{f['slug']}</link>
+  <media:content url="https://we-work-remotely.imgix.net/logos/{f['company_slug']}.png" type="image/png"/>
+</item>"""
+
+
+def feed_xml(n, base_url, slug=None):
+    """All-jobs RSS feed, or one category's feed when slug is given."""
+    category = CATEGORIES[CATEGORY_SLUGS.index(slug)] if slug else None
+    items = ''.join(feed_item_xml(i, base_url) for i in range(1, n + 1)
+                    if category is None or job_fields(i)['category'] == category)
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+<channel>
+  <title>We Work Remotely: Remote jobs</title>
+  <link>{base_url}/</link>{items}
+</channel>
+</rss>"""
+
+
+def detail_page_html(i, paragraphs=12):
+    f = {k: html.escape(v) if isinstance(v, str) else v for k, v in job_fields(i).items()}
+    body = ''.join(
+        f"<p>Paragraph {p} about the {f['title']} role at {f['company']}: we ship small, review carefully "
+        f"and write things down. Salary range $90,000 - $120,000 per year.</p>"
+        for p in range(paragraphs)
+    )
+    return f"""<!DOCTYPE html>
+<html><head><title>{f['title']} at {f['company']}</title></head>
+<body>
+<div class="lis-container">
+  <div class="lis-container__header__hero__company-info">
+    <ul><li class="lis-container__header__hero__company-info__icons__item"><span>Posted {i % 30} days ago</span></li></ul>
+    <p class="lis-container__header__hero__company-info__description">{f['company']} builds tools for remote teams.</p>
+  </div>
+  <div class="lis-container__job">
+    <div class="lis-container__job__content__description">{body}
+      <ul><li>Python</li><li>PostgreSQL</li><li>Playwright</li></ul>
+      <p><a href="https://{f['company_slug']}.example.com/careers/{i}">Apply here</a></p>
+    </div>
+    <div class="lis-container__job__sidebar">
+      <a class="apply-btn" href="/register">Apply for this position</a>
+      <ul>
+        <li class="lis-container__job__sidebar__job-about__list__item">Apply before <span>Dec {i % 28 + 1}th, 2026</span></li>
+        <li class="lis-container__job__sidebar__job-about__list__item">Job type <span class="box box--jobType">{f['job_type']}</span></li>
+        <li class="lis-container__job__sidebar__job-about__list__item">Category <span class="box box--blue">{f['category']}</span></li>
+        <li class="lis-container__job__sidebar__job-about__list__item">Region <span class="box box--region">{f['region']}</span></li>
+      </ul>
+      <div class="lis-container__job__sidebar__companyDetails__info__jobs-posted">Jobs posted: {i % 50 + 1}</div>
+    </div>
+  </div>
+</div>
+</body></html>"""
@@ -0,0 +1,151 @@
+"""
+Playwright round-trips per job: per-element calls vs batched page.evaluate()
+- Renders synthetic pages with page.set_content() - no network needed
+- Counts every IPC call (query_selector, inner_text, get_attribute, evaluate...)
+- The per-element baseline is the extraction loop wwr.py used before field specs
+
+Usage: python benchmarks/roundtrips.py --jobs 50
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+from urllib.parse import urljoin
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from playwright.sync_api import sync_playwright
+
+from fixtures import detail_page_html, front_page_html
+from wwr import extract_cards, extract_detail
+from wwr_extract import BASE_URL, EXTERNAL_APPLY_SELECTOR
+
+IPC_METHODS = {'query_selector', 'query_selector_all', 'inner_text', 'get_attribute', 'evaluate'}
+
+
+class Counting:
+    """Proxy a page or element handle and count Playwright IPC calls."""
+
+    def __init__(self, target, counter):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name not in IPC_METHODS:
+            return attr
+
+        def call(*args, **kwargs):
+            self._counter[0] += 1
+            result = attr(*args, **kwargs)
+            if name == 'query_selector_all':
+                return [Counting(handle, self._counter) for handle in result]
+            if name == 'query_selector' and result is not None:
+                return Counting(result, self._counter)
+            return result
+
+        return call
+
+
+# ============================================================
+# Per-element baseline
+# ============================================================
+
+def legacy_cards(page):
+    jobs = []
+    for card in page.query_selector_all('li.feature'):
+        job_data = {}
+        link_elem = card.query_selector('a[href^="/remote-jobs/"]')
+        if not link_elem:
+            continue
+        link_elem.get_attribute('class')
+        job_data['Job URL'] = urljoin(BASE_URL, link_elem.get_attribute('href'))
+        for field, selector in [('Job Title', '.new-listing__header__title'),
+                                ('Company Name', '.new-listing__company-name'),
+                                ('Company Headquarters', '.new-listing__company-headquarters')]:
+            elem = card.query_selector(selector)
+            job_data[field] = elem.inner_text().strip() if elem else 'N/A'
+        logo_elem = card.query_selector('.tooltip--flag-logo__flag-logo')
+        if logo_elem:
+            logo_elem.get_attribute('style')
+        company_link_elem = card.query_selector('a[href^="/company/"]')
+        if company_link_elem:
+            company_link_elem.get_attribute('href')
+        job_data['Tags'] = ', '.join(
+            cat.inner_text().strip() for cat in card.query_selector_all('.new-listing__categories__category'))
+        jobs.append(job_data)
+    return jobs
+
+
+def legacy_detail(detail_page):
+    job_data = {}
+    for field, selector in [('Date Posted', '.lis-container__header__hero__company-info__icons__item span'),
+                            ('Company Description', '.lis-container__header__hero__company-info__description'),
+                            ('Job Description', '.lis-container__job__content__description')]:
+        elem = detail_page.query_selector(selector)
+        job_data[field] = elem.inner_text().strip() if elem else 'N/A'
+    apply_btn = detail_page.query_selector('a.apply-btn:not(.apply-btn--locked)')
+    if apply_btn:
+        apply_href = apply_btn.get_attribute('href')
+        if not apply_href or 'register' in apply_href:
+            external_link = detail_page.query_selector(EXTERNAL_APPLY_SELECTOR)
+            if external_link:
+                job_data['Application URL'] = external_link.get_attribute('href')
+    for item in detail_page.query_selector_all('.lis-container__job__sidebar__job-about__list__item'):
+        text = item.inner_text().strip()
+        for label, selector in [('Apply before', 'span'), ('Job type', '.box--jobType'),
+                                ('Category', '.box--blue'), ('Region', '.box--region')]:
+            if label in text:
+                elem = item.query_selector(selector)
+                job_data[label] = elem.inner_text().strip() if elem else 'N/A'
+                break
+    jobs_posted_elem = detail_page.query_selector('.lis-container__job__sidebar__companyDetails__info__jobs-posted')
+    if jobs_posted_elem:
+        jobs_posted_elem.inner_text()
+    return job_data
+
+
+def measure(page, fn):
+    counter = [0]
+    start = time.perf_counter()
+    result = fn(Counting(page, counter))
+    return counter[0], time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--jobs', type=int, default=50, help='Cards on the synthetic front page')
+    args = parser.parse_args()
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+
+        page.set_content(front_page_html(args.jobs))
+        legacy_card_calls, legacy_card_time, _ = measure(page, legacy_cards)
+        card_calls, card_time, _ = measure(page, lambda pg: extract_cards(pg))
+
+        page.set_content(detail_page_html(1))
+        legacy_detail_calls, legacy_detail_time, _ = measure(page, legacy_detail)
+        detail_calls, detail_time, _ = measure(page, lambda pg: extract_detail(pg, {}))
+
+        browser.close()
+
+    n = args.jobs
+    rows = [
+        ('Cards (per job)', legacy_card_calls / n, card_calls / n, legacy_card_time / n, card_time / n),
+        ('Detail (per job)', legacy_detail_calls, detail_calls, legacy_detail_time, detail_time),
+        ('Total (per job)', legacy_card_calls / n + legacy_detail_calls, card_calls / n + detail_calls,
+         legacy_card_time / n + legacy_detail_time, card_time / n + detail_time),
+    ]
+
+    print("=" * 80)
+    print(f"📊 PLAYWRIGHT ROUND-TRIPS ({n} cards)")
+    print("=" * 80)
+    print(f"{'':<18}{'per-element':>14}{'batched':>10}{'per-element ms':>18}{'batched ms':>14}")
+    for label, legacy_calls, calls, legacy_time, batched_time in rows:
+        print(f"{label:<18}{legacy_calls:>14.1f}{calls:>10.2f}{legacy_time * 1000:>18.2f}{batched_time * 1000:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
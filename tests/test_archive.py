@@ -0,0 +1,64 @@
+import zlib
+
+import pytest
+
+import wwr_archive
+from wwr_archive import DETAIL, FEED, LISTING, PageArchive, compress, decompress
+
+HOME = 'https://weworkremotely.com'
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = PageArchive(str(tmp_path / 'archive.sqlite3'))
+    yield archive
+    archive.close()
+
+
+def blobs(archive):
+    return archive.conn.execute('SELECT COUNT(*) FROM blobs').fetchone()[0]
+
+
+def test_identical_pages_share_one_blob(archive):
+    page = '<html><body>Same page</body></html>'
+    archive.put(f'{HOME}/remote-jobs/a', DETAIL, page)
+    archive.put(f'{HOME}/remote-jobs/b', DETAIL, page)
+    archive.put(f'{HOME}/remote-jobs/c', DETAIL, '<html><body>Another page</body></html>')
+
+    assert blobs(archive) == 2
+    assert (archive.stored, archive.deduplicated) == (2, 1)
+    assert archive.get(f'{HOME}/remote-jobs/b') == page
+    assert archive.count(DETAIL) == 3
+
+
+def test_re_put_keeps_the_first_archived_position(archive):
+    archive.put(HOME, LISTING, 'homepage v1')
+    archive.put(f'{HOME}/categories/remote-programming-jobs', LISTING, 'programming')
+    archive.put(f'{HOME}/remote-jobs.rss', FEED, '<rss/>')
+    archive.put(f'{HOME}/remote-jobs/a', DETAIL, 'detail')
+    archive.put(HOME, LISTING, 'homepage v2')
+
+    assert list(archive.pages(LISTING, FEED)) == [
+        (HOME, LISTING, 'homepage v2'),
+        (f'{HOME}/categories/remote-programming-jobs', LISTING, 'programming'),
+        (f'{HOME}/remote-jobs.rss', FEED, '<rss/>'),
+    ]
+    assert archive.count(LISTING, FEED) == 3
+
+
+def test_zlib_round_trip(archive, monkeypatch):
+    monkeypatch.setattr(wwr_archive, 'zstandard', None)
+    page = '<html><body>Café – ünïcode ' + 'x' * 5000 + '</body></html>'
+    codec, data = compress(page.encode('utf-8'))
+    assert codec == 'zlib' and len(data) < len(page)
+    assert decompress(codec, data) == page.encode('utf-8')
+
+    archive.put(f'{HOME}/remote-jobs/a', DETAIL, page)
+    assert archive.conn.execute('SELECT codec FROM blobs').fetchone()[0] == 'zlib'
+    assert archive.get(f'{HOME}/remote-jobs/a') == page
+    assert zlib.decompress(archive.conn.execute('SELECT data FROM blobs').fetchone()[0]).decode('utf-8') == page
+
+
+def test_get_unknown_url(archive):
+    assert archive.get(f'{HOME}/remote-jobs/never-archived') is None
+    assert list(archive.pages(LISTING)) == []
@@ -0,0 +1,111 @@
+from wwr_cache import JobCache, refresh_posted
+
+HOUR = 3600
+
+
+def job(url='https://weworkremotely.com/remote-jobs/acme-python', posted='Posted 1 hour ago'):
+    return {'Job URL': url, 'Job Title': 'Python Engineer', 'Date Posted': posted, 'Job Description': 'Build things'}
+
+
+def age(cache, url, seconds):
+    with cache.conn:
+        cache.conn.execute('UPDATE jobs SET fetched_at = fetched_at - ? WHERE url = ?', (seconds, url))
+
+
+def test_refresh_posted():
+    fetched_at = 1_000_000_000
+    assert refresh_posted('Posted 1 hour ago', fetched_at, fetched_at + 5 * HOUR) == 'Posted 6 hours ago'
+    assert refresh_posted('Posted 20 hours ago', fetched_at, fetched_at + 5 * HOUR) == 'Posted 1 day ago'
+    assert refresh_posted('Posted 6 days ago', fetched_at, fetched_at + 23 * HOUR) == 'Posted 6 days ago'
+    assert refresh_posted('Posted 6 days ago', fetched_at, fetched_at + 24 * HOUR) == 'Posted 7 days ago'
+    assert refresh_posted('Posted 10 minutes ago', fetched_at, fetched_at + 600) == 'Posted 20 minutes ago'
+    assert refresh_posted('Nov 21th, 2025', fetched_at, fetched_at + HOUR) == 'Nov 21th, 2025'
+    assert refresh_posted('N/A', fetched_at, fetched_at + HOUR) == 'N/A'
+
+
+def test_cached_date_posted_is_aged(tmp_path):
+    cache = JobCache(str(tmp_path / 'cache.sqlite3'))
+    cache.put(job())
+    age(cache, job()['Job URL'], 5 * HOUR)
+
+    card = {'Job URL': job()['Job URL'], 'Job Title': 'Python Engineer'}
+    assert cache.fill(card)
+    assert card['Date Posted'] == 'Posted 6 hours ago'
+    assert card['Job Description'] == 'Build things'
+    cache.close()
+
+
+def test_fill_serves_fresh_records_only(tmp_path):
+    cache = JobCache(str(tmp_path / 'cache.sqlite3'), ttl_hours=24)
+    cache.put(job('fresh'))
+    cache.put(job('stale'))
+    age(cache, 'stale', 25 * HOUR)
+
+    assert cache.fill({'Job URL': 'fresh', 'Job Title': 'Live title'})
+    assert not cache.fill({'Job URL': 'stale'})
+    assert not cache.fill({'Job URL': 'unknown'})
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # Re-fetching a stale job makes it fresh again
+    cache.put(job('stale'))
+    assert cache.fill({'Job URL': 'stale'})
+    cache.close()
+
+
+def test_fill_keeps_live_card_fields(tmp_path):
+    cache = JobCache(str(tmp_path / 'cache.sqlite3'))
+    cache.put(dict(job('a'), **{'Tags': 'Full-Time'}))
+
+    card = {'Job URL': 'a', 'Job Title': 'Senior Python Engineer', 'Tags': 'Featured, Full-Time'}
+    assert cache.fill(card)
+    assert card['Job Title'] == 'Senior Python Engineer'
+    assert card['Tags'] == 'Featured, Full-Time'
+    assert card['Job Description'] == 'Build things'
+    assert card['Region'] == 'N/A'  # detail field missing from the cached record
+    cache.close()
+
+
+def test_full_refresh_records_but_never_serves(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    cache = JobCache(path, full_refresh=True)
+    cache.put(job('a'))
+    assert not cache.fill({'Job URL': 'a'})
+    cache.close()
+
+    cache = JobCache(path)
+    assert cache.fill({'Job URL': 'a'})
+    cache.close()
+
+
+def test_evict_drops_jobs_not_seen_for_max_age(tmp_path):
+    cache = JobCache(str(tmp_path / 'cache.sqlite3'))
+    cache.put(job('gone'))
+    cache.put(job('listed'))
+    with cache.conn:
+        cache.conn.execute("UPDATE jobs SET last_seen = last_seen - ? WHERE url = 'gone'", (31 * 24 * HOUR,))
+
+    assert cache.evict(max_age_days=30) == 1
+    assert [url for url, in cache.conn.execute('SELECT url FROM jobs')] == ['listed']
+    cache.close()
+
+
+def test_evict_vacuums_once_enough_space_is_free(tmp_path):
+    cache = JobCache(str(tmp_path / 'cache.sqlite3'))
+    for i in range(200):
+        cache.put(dict(job(f'job-{i}'), **{'Job Description': 'x' * 2000}))
+
+    def free_pages():
+        return cache.conn.execute('PRAGMA freelist_count').fetchone()[0]
+
+    # A few evicted rows leave free pages behind
+    with cache.conn:
+        cache.conn.execute("UPDATE jobs SET last_seen = 0 WHERE url IN ('job-0', 'job-1')")
+    assert cache.evict() == 2
+    assert free_pages() > 0
+
+    # Most of the file freed: compacted
+    with cache.conn:
+        cache.conn.execute("UPDATE jobs SET last_seen = 0 WHERE url != 'job-199'")
+    assert cache.evict() == 197
+    assert free_pages() == 0
+    cache.close()
@@ -0,0 +1,114 @@
+import json
+
+from wwr_checkpoint import Checkpoint
+
+
+def record(url):
+    return {'Job URL': url, 'Job Title': f'Job {url}'}
+
+
+def lines(path):
+    return [json.loads(line)['Job URL'] for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_out_of_order_results_are_written_in_card_order(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    checkpoint = Checkpoint(str(path))
+    checkpoint.submit(3, record('c'))
+    checkpoint.submit(2, None)  # card without a record
+    assert lines(path) == []
+
+    checkpoint.submit(1, record('a'))
+    assert lines(path) == ['a', 'c']
+    checkpoint.submit(4, record('d'))
+    assert lines(path) == ['a', 'c', 'd']
+    assert checkpoint.count == 3
+    checkpoint.close()
+
+
+def test_close_flushes_cards_that_never_reported_in(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    checkpoint = Checkpoint(str(path))
+    checkpoint.submit(4, record('d'))
+    checkpoint.submit(2, record('b'))
+    checkpoint.close()
+    assert lines(path) == ['b', 'd']
+    assert [job_data['Job URL'] for job_data in checkpoint.records()] == ['b', 'd']
+
+
+def test_resume_keeps_done_urls(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    first = Checkpoint(str(path))
+    first.submit(1, record('a'))
+    first.submit(2, record('b'))
+    first.close()
+
+    resumed = Checkpoint(str(path), resume=True)
+    assert resumed.count == 2
+    assert resumed.has('a') and resumed.has('b') and not resumed.has('c')
+    resumed.keep(1, 'a')
+    resumed.keep(2, 'b')
+    resumed.submit(3, record('c'))
+    resumed.close()
+    assert lines(path) == ['a', 'b', 'c']
+
+
+def test_without_resume_the_file_starts_over(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    Checkpoint(str(path)).close()
+    path.write_text(json.dumps(record('old')) + '\n', encoding='utf-8')
+
+    checkpoint = Checkpoint(str(path))
+    assert not checkpoint.has('old')
+    checkpoint.close()
+    assert path.read_text(encoding='utf-8') == ''
+
+
+def test_resume_after_a_torn_last_line(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    path.write_text(json.dumps(record('a')) + '\n{"Job URL": "b", "Job Ti', encoding='utf-8')
+
+    resumed = Checkpoint(str(path), resume=True)
+    assert resumed.count == 1
+    assert resumed.has('a') and not resumed.has('b')
+    resumed.keep(1, 'a')
+    resumed.submit(2, record('b'))
+    resumed.close()
+    # The torn line is skipped and the new record starts on a line of its own
+    assert [job_data['Job URL'] for job_data in resumed.records()] == ['a', 'b']
+
+
+def test_records_are_indexed_as_they_are_written(tmp_path):
+    class Index:
+        def __init__(self):
+            self.urls = []
+
+        def add(self, job_data):
+            self.urls.append(job_data['Job URL'])
+
+    search = Index()
+    checkpoint = Checkpoint(str(tmp_path / 'checkpoint.jsonl'), search=search)
+    checkpoint.submit(2, record('b'))
+    assert search.urls == []
+    checkpoint.submit(1, record('a'))
+    assert search.urls == ['a', 'b']
+    checkpoint.close()
+
+
+def test_resume_puts_the_file_back_in_card_order(tmp_path):
+    path = tmp_path / 'checkpoint.jsonl'
+    first = Checkpoint(str(path))
+    first.submit(1, record('a'))
+    first.submit(2, None)  # b's detail page failed
+    first.submit(3, record('c'))
+    first.submit(4, record('gone'))
+    first.close()
+
+    resumed = Checkpoint(str(path), resume=True)
+    resumed.keep(1, 'a')
+    resumed.submit(2, record('b'))
+    resumed.keep(3, 'c')
+    assert lines(path) == ['a', 'c', 'gone', 'b']
+    resumed.close()
+    # Jobs no longer listed stay, after the ones that are
+    assert lines(path) == ['a', 'b', 'c', 'gone']
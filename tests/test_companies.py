@@ -0,0 +1,111 @@
+from wwr_companies import (COMPANY_COLUMNS, JOB_COMPANY_COLUMNS, CompanyRegistry, CompanyTable, detail_fields,
+                           job_columns)
+from wwr_extract import COLUMN_ORDER, DETAIL_FIELDS, JOB_DETAIL_FIELDS
+
+PROFILE = 'https://weworkremotely.com/company/acme'
+HOUR = 3600
+
+
+def job(description='Tools for remote teams', total='7', **fields):
+    return dict({'Job URL': 'https://weworkremotely.com/remote-jobs/acme-python', 'Company Name': 'Acme',
+                 'Company Profile URL': PROFILE, 'Company Description': description,
+                 'Company Total Jobs Posted': total}, **fields)
+
+
+def card():
+    return {'Company Name': 'Acme', 'Company Profile URL': PROFILE}
+
+
+def age(path, seconds):
+    registry = CompanyRegistry(path)
+    with registry.conn:
+        registry.conn.execute('UPDATE companies SET fetched_at = fetched_at - ?', (seconds,))
+    registry.close()
+
+
+def test_fill_serves_fresh_companies_only(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    registry = CompanyRegistry(path, ttl_hours=24)
+    assert not registry.fill(card())
+    registry.put(job())
+    later = card()
+    assert registry.fill(later)
+    assert (later['Company Description'], later['Company Total Jobs Posted']) == ('Tools for remote teams', '7')
+    assert (registry.hits, registry.misses) == (1, 1)
+    registry.close()
+
+    age(path, 25 * HOUR)
+    registry = CompanyRegistry(path, ttl_hours=24)
+    assert not registry.fill(card())
+    registry.close()
+
+
+def test_put_is_a_no_op_while_fresh_and_refreshes_once_stale(tmp_path):
+    path = str(tmp_path / 'cache.sqlite3')
+    registry = CompanyRegistry(path)
+    registry.put(job())
+    registry.put(job('Rewritten description', '8'))
+    later = card()
+    registry.fill(later)
+    assert later['Company Total Jobs Posted'] == '7'
+    registry.close()
+
+    age(path, 8 * 24 * HOUR)
+    registry = CompanyRegistry(path)
+    registry.put(job('Rewritten description', '8'))
+    later = card()
+    assert registry.fill(later)
+    assert (later['Company Description'], later['Company Total Jobs Posted']) == ('Rewritten description', '8')
+    registry.close()
+
+
+def test_ttl_zero_always_refreshes(tmp_path):
+    registry = CompanyRegistry(str(tmp_path / 'cache.sqlite3'), ttl_hours=0)
+    registry.put(job())
+    assert not registry.fill(card())
+    registry.close()
+
+
+def test_locked_jobs_and_jobs_without_a_company_register_nothing(tmp_path):
+    registry = CompanyRegistry(str(tmp_path / 'cache.sqlite3'))
+    registry.put(job('N/A', 'N/A'))
+    registry.put({'Company Name': 'N/A', 'Company Profile URL': 'N/A', 'Company Description': 'Orphan'})
+    assert registry.conn.execute('SELECT COUNT(*) FROM companies').fetchone()[0] == 0
+    assert not registry.fill({'Company Name': 'N/A', 'Company Profile URL': 'N/A'})
+    registry.close()
+
+
+def test_detail_fields_skip_company_fields_the_registry_has(tmp_path):
+    registry = CompanyRegistry(str(tmp_path / 'cache.sqlite3'))
+    assert detail_fields(None, card()) is DETAIL_FIELDS
+    assert detail_fields(registry, card()) is DETAIL_FIELDS
+
+    registry.put(job())
+    later = card()
+    assert detail_fields(registry, later) is JOB_DETAIL_FIELDS
+    assert later['Company Description'] == 'Tools for remote teams'
+    registry.close()
+
+    assert 'Company Description' in DETAIL_FIELDS and 'Company Description' not in JOB_DETAIL_FIELDS
+
+
+def test_job_columns_keep_only_the_company_link():
+    columns = job_columns()
+    assert [column for column in columns if column in COMPANY_COLUMNS] == JOB_COMPANY_COLUMNS
+    assert [column for column in COLUMN_ORDER if column not in columns] == [
+        column for column in COLUMN_ORDER if column in COMPANY_COLUMNS and column not in JOB_COMPANY_COLUMNS]
+
+
+def test_company_table_keeps_the_first_real_value():
+    locked = job('N/A', 'N/A', **{'Company Headquarters': 'Berlin'})
+    table = CompanyTable()
+    passed = list(table.collect([locked, job(), job('Later description', '9'),
+                                 {'Company Name': 'Globex', 'Company Profile URL': 'N/A'}]))
+    assert len(passed) == 4
+
+    acme, globex = table.records()
+    assert acme['Company Description'] == 'Tools for remote teams'
+    assert acme['Company Total Jobs Posted'] == '7'
+    assert acme['Company Headquarters'] == 'Berlin'
+    assert list(acme) == COMPANY_COLUMNS
+    assert (globex['Company Name'], globex['Company Description']) == ('Globex', 'N/A')
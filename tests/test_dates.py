@@ -0,0 +1,37 @@
+import json
+import os
+from datetime import date, datetime
+
+import pytest
+
+from wwr_dates import parse_date, parse_posted
+
+# Real export committed with the repository
+EXPORT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'WeWorkRemotely_Jobs_20251028_193043.json')
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Nov 21th, 2025', date(2025, 11, 21)),
+    ('Nov 7th, 2025', date(2025, 11, 7)),
+    ('Dec 1st, 2026', date(2026, 12, 1)),
+    ('Dec 31, 2026', date(2026, 12, 31)),
+    ('2026-12-31', date(2026, 12, 31)),
+    ('N/A', None),
+    ('soon', None),
+])
+def test_parse_date(text, expected):
+    assert parse_date(text) == expected
+
+
+def test_every_deadline_in_the_committed_export_parses():
+    with open(EXPORT, encoding='utf-8') as f:
+        deadlines = [job['Apply Deadline'] for job in json.load(f) if job['Apply Deadline'] != 'N/A']
+    assert deadlines
+    assert [text for text in deadlines if parse_date(text) is None] == []
+
+
+def test_parse_posted_counts_back_from_now():
+    now = datetime(2025, 10, 28, 19, 30)
+    assert parse_posted('Posted 6 days ago', now) == datetime(2025, 10, 22, 19, 30)
+    assert parse_posted('Posted 1 hours ago', now) == datetime(2025, 10, 28, 18, 30)
+    assert parse_posted('N/A', now) is None
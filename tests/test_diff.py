@@ -0,0 +1,47 @@
+import json
+
+from wwr_diff import ChangeFeed
+
+
+def record(url, title='Python Engineer'):
+    return {'Job URL': url, 'Job Title': title, 'Company Name': 'Acme', 'Date Posted': 'Posted 1 hour ago'}
+
+
+def run(tmp_path, name, records, discovered):
+    feed = ChangeFeed(str(tmp_path / 'snapshot.sqlite3'))
+    feed.discover(discovered)
+    feed_path = tmp_path / name
+    for _ in feed.collect(iter(records), str(feed_path)):
+        pass
+    counts = feed.commit()
+    feed.close()
+    changes = [json.loads(line) for line in feed_path.read_text(encoding='utf-8').splitlines()]
+    return counts, [(change['change'], change['Job URL']) for change in changes]
+
+
+def test_failed_jobs_are_not_removed(tmp_path):
+    run(tmp_path, 'first.jsonl', [record('a'), record('b'), record('c')], ['a', 'b', 'c'])
+
+    # b's detail page failed: still listed, so neither removed now nor added next time
+    counts, changes = run(tmp_path, 'second.jsonl', [record('a', 'Senior Python Engineer')], ['a', 'b'])
+    assert changes == [('updated', 'a'), ('removed', 'c')]
+    assert counts == {'added': 0, 'updated': 1, 'removed': 1, 'unchanged': 0}
+
+    counts, changes = run(tmp_path, 'third.jsonl', [record('a', 'Senior Python Engineer'), record('b')], ['a', 'b'])
+    assert changes == []
+    assert counts['unchanged'] == 2
+
+
+def test_nothing_discovered_removes_nothing(tmp_path):
+    run(tmp_path, 'first.jsonl', [record('a'), record('b')], ['a', 'b'])
+    counts, changes = run(tmp_path, 'second.jsonl', [record('a')], [])
+    assert changes == []
+    assert counts['removed'] == 0
+
+
+def test_date_posted_is_ignored(tmp_path):
+    run(tmp_path, 'first.jsonl', [record('a')], ['a'])
+    later = dict(record('a'), **{'Date Posted': 'Posted 2 days ago'})
+    counts, changes = run(tmp_path, 'second.jsonl', [later], ['a'])
+    assert changes == []
+    assert counts['unchanged'] == 1
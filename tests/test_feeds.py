@@ -0,0 +1,63 @@
+import pytest
+
+from fixtures import front_page_html, feed_xml, job_fields
+from wwr_companies import CompanyRegistry, CompanyTable
+from wwr_feeds import card_from_item, parse_feed
+
+BASE_URL = 'http://127.0.0.1:8000'
+
+# Card fields the feed carries exactly as the homepage card shows them
+SHARED_FIELDS = ['Job URL', 'Job Title', 'Company Name', 'Company Headquarters', 'Company Logo URL']
+
+
+def feed_cards(n, chunk_size=None):
+    raw = feed_xml(n, BASE_URL).encode('utf-8')
+    chunk_size = chunk_size or len(raw)
+    return list(parse_feed((raw[i:i + chunk_size] for i in range(0, len(raw), chunk_size)), BASE_URL))
+
+
+def test_feed_cards_follow_homepage_order():
+    pytest.importorskip('selectolax')
+    from wwr_extract import parse_cards_html
+
+    homepage = parse_cards_html(front_page_html(30), BASE_URL)
+    feed = feed_cards(30)
+    assert [card[0]['Job URL'] for card in feed] == [card[0]['Job URL'] for card in homepage]
+    for (feed_job, _), (card_job, _) in zip(feed, homepage):
+        assert {field: feed_job[field] for field in SHARED_FIELDS} == {field: card_job[field] for field in SHARED_FIELDS}
+        assert set(feed_job) == set(card_job)
+
+
+def test_feed_is_parsed_incrementally():
+    assert feed_cards(25, chunk_size=7) == feed_cards(25)
+
+
+def test_feed_tags_keep_type_category_and_salary_band():
+    job_data, is_locked = feed_cards(3)[0]
+    fields = job_fields(1)
+    assert job_data['Tags'] == f"{fields['job_type']}, {fields['category']}, {fields['salary_band']}"
+    assert job_data['Company Profile URL'] == 'N/A'
+    assert is_locked is False
+
+
+def test_item_without_salary_or_job_link():
+    item = {'title': 'Acme: Writer', 'link': f'{BASE_URL}/remote-jobs/acme-writer', 'type': 'Contract',
+            'description': '<p>Backed by $5 million</p>'}
+    job_data, _ = card_from_item(item, BASE_URL)
+    assert (job_data['Company Name'], job_data['Job Title'], job_data['Tags']) == ('Acme', 'Writer', 'Contract')
+    assert card_from_item({'title': 'Acme: Writer', 'link': f'{BASE_URL}/blog/post'}, BASE_URL) is None
+
+
+def test_companies_without_profile_url_are_keyed_by_name(tmp_path):
+    registry = CompanyRegistry(str(tmp_path / 'cache.sqlite3'))
+    job = {'Company Name': 'Acme', 'Company Profile URL': 'N/A',
+           'Company Description': 'Tools for remote teams', 'Company Total Jobs Posted': '7'}
+    registry.put(job)
+    later = {'Company Name': 'Acme', 'Company Profile URL': 'N/A'}
+    assert registry.fill(later)
+    assert later['Company Description'] == 'Tools for remote teams'
+    registry.close()
+
+    table = CompanyTable()
+    list(table.collect([job, dict(job, **{'Job URL': 'other'})]))
+    assert list(table.rows) == ['Acme']
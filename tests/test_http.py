@@ -0,0 +1,70 @@
+import pytest
+
+from fixtures import detail_page_html, job_fields
+from wwr_extract import parse_cards_html, parse_detail_html
+from wwr_ratelimit import RateLimiter
+
+BASE_URL = 'http://127.0.0.1:8000'
+
+
+@pytest.mark.parametrize('i', range(1, 13))
+def test_static_parser_reads_fixture_detail_pages(i):
+    pytest.importorskip('selectolax')
+    f = job_fields(i)
+    job_data = {}
+    assert parse_detail_html(detail_page_html(i), job_data, BASE_URL) is job_data
+
+    assert job_data['Date Posted'] == f'Posted {i % 30} days ago'
+    assert job_data['Apply Deadline'] == f'Dec {i % 28 + 1}th, 2026'
+    assert job_data['Job Type'] == f['job_type']
+    assert job_data['Job Category'] == f['category']
+    assert job_data['Region'] == f['region']
+    assert job_data['Company Description'] == f"{f['company']} builds tools for remote teams."
+    assert job_data['Company Total Jobs Posted'] == str(i % 50 + 1)
+    # The sidebar button points at /register, so the link in the description wins
+    assert job_data['Application URL'] == f"https://{f['company_slug']}.example.com/careers/{i}"
+    assert job_data['Job Description'].startswith(f"Paragraph 0 about the {f['title']} role at {f['company']}")
+    assert job_data['Job Description'].endswith('Python\nPostgreSQL\nPlaywright\n\nApply here')
+    assert job_data['Salary'] == '$90,000 - $120,000 per year'
+
+
+def test_static_parser_rejects_pages_that_are_not_job_details():
+    pytest.importorskip('selectolax')
+    assert parse_detail_html('<html><body><h1>Sign in</h1></body></html>', {}, BASE_URL) is None
+    assert parse_cards_html('<html><body></body></html>', BASE_URL) == []
+
+
+def client_for(status, calls):
+    httpx = pytest.importorskip('httpx')
+
+    def handler(request):
+        calls.append(request.url)
+        # A streamed body, like a real transport's, so the client times the response
+        return httpx.Response(status, stream=httpx.ByteStream(b'<html></html>'))
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.parametrize('status, attempts', [(404, 1), (410, 1), (500, 3)])
+def test_fetch_html_only_retries_server_errors(status, attempts):
+    pytest.importorskip('httpx')
+    from wwr_http import fetch_html
+
+    calls = []
+    limiter = RateLimiter(rate=1000, max_rate=1000, backoff_cap=0)
+    with client_for(status, calls) as client, pytest.raises(Exception):
+        fetch_html(client, f'{BASE_URL}/remote-jobs/gone', limiter=limiter)
+    assert len(calls) == attempts
+
+
+def test_removed_jobs_skip_the_browser_fallback():
+    pytest.importorskip('httpx')
+    from wwr_http import fetch_details
+
+    calls = []
+    limiter = RateLimiter(rate=1000, max_rate=1000, backoff_cap=0)
+    jobs = [(1, {'Job URL': f'{BASE_URL}/remote-jobs/gone', 'Job Title': 'Gone', 'Company Name': 'Acme'})]
+    with client_for(404, calls) as client:
+        results = list(fetch_details(client, jobs, workers=1, limiter=limiter, base_url=BASE_URL))
+    assert [(index, parsed) for index, _, parsed in results] == [(1, None)]
+    assert len(calls) == 1
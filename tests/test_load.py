@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+import pytest
+
+from wwr_load import LoadProfile
+
+
+def request(url, resource_type='document'):
+    return SimpleNamespace(url=url, resource_type=resource_type)
+
+
+@pytest.mark.parametrize('url, resource_type, blocked', [
+    ('https://weworkremotely.com/remote-jobs/acme-python', 'document', False),
+    ('https://weworkremotely.com/assets/app.js', 'script', False),
+    ('https://weworkremotely.com/assets/app.css', 'stylesheet', True),
+    ('https://weworkremotely.com/logo.png', 'image', True),
+    ('https://weworkremotely.com/font.woff2', 'font', True),
+    ('https://www.google-analytics.com/analytics.js', 'script', True),
+    ('https://google-analytics.com/collect', 'xhr', True),
+    ('https://we-work-remotely.imgix.net/logos/acme.png', 'other', True),
+    # Suffix match is on whole host labels only
+    ('https://notgoogle-analytics.com/script.js', 'script', False),
+    ('https://google-analytics.com.example.org/script.js', 'script', False),
+])
+def test_lite_profile_blocks(url, resource_type, blocked):
+    assert LoadProfile('lite').should_block(request(url, resource_type)) is blocked
+
+
+def test_full_profile_blocks_nothing():
+    profile = LoadProfile('full')
+    assert not profile.should_block(request('https://www.google-analytics.com/analytics.js', 'script'))
+    assert not profile.should_block(request('https://weworkremotely.com/logo.png', 'image'))
@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+from wwr_ratelimit import RateLimiter, Throttled, parse_retry_after
+
+
+def test_fast_healthy_responses_speed_up_to_max_rate():
+    limiter = RateLimiter(rate=1.0, max_rate=1.25, increase=0.1)
+    limiter.response(200, elapsed=0.2)
+    assert limiter.rate == pytest.approx(1.1)
+    limiter.response(304, elapsed=0.2)
+    limiter.response(200, elapsed=0.2)
+    assert limiter.rate == 1.25
+    assert limiter.peak_rate == 1.25
+
+
+def test_slow_and_client_error_responses_earn_no_speed_up():
+    limiter = RateLimiter(rate=1.0)
+    limiter.response(200, elapsed=10.0)
+    limiter.response(404, elapsed=0.2)
+    assert limiter.rate == 1.0
+    assert limiter.throttled == 0
+
+
+def test_throttling_halves_the_rate_down_to_min_rate():
+    limiter = RateLimiter(rate=1.0, min_rate=0.3)
+    with pytest.raises(Throttled) as caught:
+        limiter.response(429)
+    assert caught.value.status == 429
+    assert limiter.rate == 0.5
+
+    with pytest.raises(Throttled):
+        limiter.response(503)
+    assert limiter.rate == 0.3
+    assert limiter.throttled == 2
+
+
+def test_only_timeouts_slow_down_on_failure():
+    limiter = RateLimiter(rate=1.0)
+    limiter.failure(ValueError('parse error'))
+    assert limiter.rate == 1.0
+    limiter.failure(TimeoutError('timed out'))
+    assert limiter.rate == 0.5
+
+
+def test_retry_after_pauses_every_request(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr('wwr_ratelimit.time.sleep', sleeps.append)
+    limiter = RateLimiter(rate=100, max_rate=100)
+    with pytest.raises(Throttled) as caught:
+        limiter.response(429, headers={'retry-after': '30'})
+    assert caught.value.retry_after == 30
+
+    limiter.wait()
+    assert 29 < sleeps[0] <= 30
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('120') == 120
+    assert parse_retry_after(' 5 ') == 5
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('soon') is None
+
+    later = datetime.now(timezone.utc) + timedelta(seconds=90)
+    assert 80 < parse_retry_after(format_datetime(later, usegmt=True)) <= 90
+    earlier = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert parse_retry_after(format_datetime(earlier, usegmt=True)) == 0
+
+
+def test_backoff_is_capped_and_respects_retry_after():
+    limiter = RateLimiter(backoff_base=1.0, backoff_cap=4.0)
+    for attempt in range(10):
+        assert 0 <= limiter.backoff(attempt) <= min(4.0, 2 ** attempt)
+    assert limiter.backoff(0, Throttled(429, retry_after=30)) == 30
+    assert limiter.backoff(0, Throttled(503)) <= 1.0
@@ -0,0 +1,117 @@
+import pytest
+
+from wwr_extract import detail_from_payload
+from wwr_salary import SALARY_COLUMNS, add_salary_columns, parse_salary, salary_fields, salary_text, with_salary
+
+
+def salary(low, high, currency, period):
+    return {'Salary Min': low, 'Salary Max': high, 'Salary Currency': currency, 'Salary Period': period}
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('$25,000 - $48,999 USD', salary(25000, 48999, 'USD', 'year')),
+    ('$100,000 or more USD', salary(100000, None, 'USD', 'year')),
+    ('€60k-€75k per year', salary(60000, 75000, 'EUR', 'year')),
+    ('$120k-$150k annually', salary(120000, 150000, 'USD', 'year')),
+    ('$120K to $150K a year', salary(120000, 150000, 'USD', 'year')),
+    ('$45/hour', salary(93600, 93600, 'USD', 'hour')),
+    ('$50 - 60 per hour', salary(104000, 124800, 'USD', 'hour')),
+    ('£4,000 - £5,000 monthly', salary(48000, 60000, 'GBP', 'month')),
+    ('$90,000 CAD', salary(90000, 90000, 'CAD', 'year')),
+    ('$90,000 CADENCE', salary(90000, 90000, 'USD', 'year')),
+    ('Salary range $90,000 - $120,000 per year.', salary(90000, 120000, 'USD', 'year')),
+    ('$60-75k', salary(60000, 75000, 'USD', 'year')),
+    ('$60-$75k per year', salary(60000, 75000, 'USD', 'year')),
+    ('$500 - $2k per month', salary(6000, 24000, 'USD', 'month')),
+])
+def test_parse_salary(text, expected):
+    assert parse_salary(text) == expected
+
+
+@pytest.mark.parametrize('text', [
+    None,
+    '',
+    'N/A',
+    'No salary mentioned',
+    'Backed by $5 million from top investors',
+    'We use $40 Kubernetes clusters',
+    'A $500 home office budget',
+])
+def test_parse_salary_rejects_non_salaries(text):
+    assert parse_salary(text) is None
+
+
+def test_parse_salary_skips_amounts_before_the_salary():
+    text = 'Backed by $5 million in funding. Pay: $120k-$150k annually.'
+    assert parse_salary(text) == salary(120000, 150000, 'USD', 'year')
+    assert salary_text(text) == '$120k-$150k annually'
+
+
+def test_k_suffix_only_ends_a_word():
+    assert parse_salary('$40 Kubernetes nodes, $80k salary') == salary(80000, 80000, 'USD', 'year')
+
+
+def test_salary_text():
+    assert salary_text('Pay is $50 - 60 per hour, paid weekly') == '$50 - 60 per hour'
+    assert salary_text('Backed by $5 million') == 'N/A'
+    assert salary_text('N/A') == 'N/A'
+
+
+def test_salary_fields_prefers_card_tags():
+    job_data = {'Tags': 'Featured, Full-Time, $50,000 - $74,999 USD',
+                'Job Description': 'Pay: $120k-$150k annually'}
+    assert salary_fields(job_data) == salary(50000, 74999, 'USD', 'year')
+
+
+def test_raw_salary_agrees_with_structured_columns():
+    # Card band and description band differ: both come from the card
+    job_data = {'Tags': 'Featured, Full-Time, $50,000 - $74,999 USD'}
+    raw = {'Date Posted': 'Posted 2 days ago', 'Job Description': 'Salary: $90,000 - $120,000 per year',
+           'apply_btn': False, 'apply_href': None, 'external_apply_href': None, 'sidebar': []}
+    detail_from_payload(raw, job_data)
+    assert job_data['Salary'] == '$50,000 - $74,999 USD'
+
+    job_data['Salary'] = 'N/A'  # e.g. a locked listing or an older cached record
+    exported, = with_salary([job_data])
+    assert exported['Salary'] == '$50,000 - $74,999 USD'
+    assert exported['Salary Min'] == 50000 and exported['Salary Max'] == 74999
+
+
+def test_salary_fields_reads_the_description():
+    job_data = {'Tags': 'Featured, Full-Time', 'Job Description': 'Pay: $120k-$150k annually'}
+    assert salary_fields(job_data) == salary(120000, 150000, 'USD', 'year')
+    assert salary_fields({'Tags': 'N/A', 'Job Description': 'N/A'}) == dict.fromkeys(SALARY_COLUMNS)
+
+
+RECORDS = [
+    {'Tags': 'Featured, Full-Time, $50,000 - $74,999 USD', 'Job Description': 'Pay: $120k-$150k annually'},
+    {'Tags': 'Featured, Contract', 'Job Description': 'Pay: $120k-$150k annually'},
+    {'Tags': 'Part-Time', 'Job Description': 'Backed by $5 million. $50 - 60 per hour.'},
+    {'Tags': 'Full-Time', 'Job Description': 'We use $40 Kubernetes clusters'},
+    {'Tags': '$100,000 or more USD', 'Job Description': 'N/A'},
+    {'Tags': 'N/A', 'Job Description': '£4,000 - £5,000 monthly, €60k-€75k per year elsewhere'},
+    {'Tags': None, 'Job Description': None},
+    {'Tags': 'Full-Time', 'Job Description': '$90,000 CAD'},
+    {'Tags': 'Full-Time, $60-75k', 'Job Description': 'N/A'},
+]
+
+
+def test_add_salary_columns_matches_salary_fields():
+    pd = pytest.importorskip('pandas')
+    df = add_salary_columns(pd.DataFrame(RECORDS, index=range(10, 10 + len(RECORDS))))
+    for position, job_data in enumerate(RECORDS):
+        row = df.iloc[position]
+        vectorized = {column: None if pd.isna(row[column]) else row[column] for column in ['Salary'] + SALARY_COLUMNS}
+        expected, = with_salary([dict(job_data)])
+        assert vectorized == {column: expected[column] for column in ['Salary'] + SALARY_COLUMNS}, job_data
+
+
+def test_add_salary_columns_without_description_column():
+    pd = pytest.importorskip('pandas')
+    df = add_salary_columns(pd.DataFrame({'Tags': ['$25,000 - $48,999 USD', 'Full-Time']}))
+    assert df['Salary Min'].tolist()[0] == 25000
+    assert pd.isna(df['Salary Min'].tolist()[1])
+
+    df = add_salary_columns(pd.DataFrame({'Tags': ['Full-Time', None]}))
+    assert df['Salary'].tolist() == ['N/A', 'N/A']
+    assert df['Salary Min'].isna().all()
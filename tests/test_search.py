@@ -0,0 +1,66 @@
+import pytest
+
+from wwr_search import SearchIndex, fts_query
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('python AND (contract OR part-time)', 'python AND ( contract OR "part-time" )'),
+    ('python -java', 'python NOT java'),
+    ('python AND -java', 'python NOT java'),
+    ('python -"ruby on rails"', 'python NOT "ruby on rails"'),
+    ('full-stack*', '"full-stack"*'),
+    ('pyth*', 'pyth*'),
+    ('node.js c++', '"node.js" "c++"'),
+])
+def test_fts_query(text, expected):
+    assert fts_query(text) == expected
+
+
+@pytest.mark.parametrize('text', ['-java', 'python OR -java', '(-java)'])
+def test_fts_query_rejects_nothing_to_exclude_from(text):
+    with pytest.raises(ValueError):
+        fts_query(text)
+
+
+def job(url, title, description, region='Anywhere in the World', job_type='Full-Time', category='Programming'):
+    return {'Job URL': url, 'Job Title': title, 'Company Name': 'Acme', 'Job Description': description,
+            'Tags': job_type, 'Region': region, 'Job Type': job_type, 'Job Category': category,
+            'Date Posted': 'Posted 1 hour ago'}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SearchIndex(str(tmp_path / 'search.sqlite3'))
+    index.add(job('a', 'Senior Python Engineer', 'Django and Postgres', region='USA Only'))
+    index.add(job('b', 'Backend Engineer', 'Python and Java services', job_type='Contract'))
+    index.add(job('c', 'Full-Stack Developer', 'React and Python', region='Europe Only', category='Full-Stack'))
+    index.add(job('d', 'Java Developer', 'Spring Boot'))
+    yield index
+    index.close()
+
+
+def urls(hits):
+    return sorted(hit['url'] for hit in hits)
+
+
+def test_search_excludes_and_ranks_title_matches_first(index):
+    hits = index.search('python')
+    assert hits[0]['url'] == 'a'
+    assert urls(hits) == ['a', 'b', 'c']
+    assert urls(index.search('python -java')) == ['a', 'c']
+    assert urls(index.search('full-stack*')) == ['c']
+
+
+def test_search_filters(index):
+    assert urls(index.search('python', region='usa')) == ['a']
+    assert urls(index.search('python', job_type='contract')) == ['b']
+    assert urls(index.search('python', job_category='Full-Stack')) == ['c']
+    assert urls(index.search('python', region='Only', job_type='Full-Time')) == ['a', 'c']
+    assert index.search('java', region='Europe') == []
+
+
+def test_search_sees_the_latest_version_of_a_job(index):
+    index.add(job('d', 'Python Developer', 'Spring Boot'))
+    assert index.count == 4
+    assert urls(index.search('python')) == ['a', 'b', 'c', 'd']
+    assert urls(index.search('java')) == ['b']
@@ -0,0 +1,67 @@
+from wwr_store import JobStore
+
+
+def record(url, title='Python Engineer'):
+    return {'Job URL': url, 'Job Title': title}
+
+
+def urls(store):
+    return [job_data['Job URL'] for job_data in store.records()]
+
+
+def test_records_follow_position_whatever_order_puts_arrive(tmp_path):
+    store = JobStore(str(tmp_path / 'store.sqlite3'))
+    for position, url in [(3, 'c'), (1, 'a'), (4, 'd'), (2, 'b')]:
+        store.put(position, record(url))
+    assert urls(store) == ['a', 'b', 'c', 'd']
+    assert store.count == 4
+    store.close()
+
+
+def test_duplicate_url_keeps_its_earliest_position(tmp_path):
+    store = JobStore(str(tmp_path / 'store.sqlite3'))
+    store.put(1, record('a'))
+    store.put(5, record('dup', 'Listed under a category'))
+    store.put(3, record('c'))
+    store.put(2, record('dup', 'Listed on the homepage'))
+    store.put(7, record('dup', 'Listed under another category'))
+
+    assert urls(store) == ['a', 'dup', 'c']
+    assert store.count == 3
+    # The record itself is the latest one put
+    assert [job_data['Job Title'] for job_data in store.records()][1] == 'Listed under another category'
+    store.close()
+
+
+def test_submit_and_keep_mirror_checkpoint(tmp_path):
+    store = JobStore(str(tmp_path / 'store.sqlite3'))
+    store.submit(2, record('b'))
+    store.submit(1, None)
+    store.put(5, record('a'))
+    store.keep(1, 'a')
+    assert urls(store) == ['a', 'b']
+    store.close()
+
+
+def test_resume_keeps_jobs_and_a_fresh_store_clears_them(tmp_path):
+    path = str(tmp_path / 'store.sqlite3')
+    store = JobStore(path)
+    store.put(1, record('a'))
+    store.close()
+
+    resumed = JobStore(path, resume=True)
+    assert resumed.has('a') and not resumed.has('b')
+    resumed.close()
+
+    fresh = JobStore(path)
+    assert not fresh.has('a')
+    assert fresh.count == 0
+    fresh.close()
+
+
+def test_records_still_read_after_close(tmp_path):
+    store = JobStore(str(tmp_path / 'store.sqlite3'))
+    store.put(2, record('b'))
+    store.put(1, record('a'))
+    store.close()
+    assert urls(store) == ['a', 'b']
@@ -1,465 +1,1285 @@
-from playwright.sync_api import sync_playwright
-import json
-import time
-import csv
-import pandas as pd
-from urllib.parse import urljoin
-from datetime import datetime
-import re
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
-
-
-def scrape_wwr_professional():
-    """
-    Professional WeWorkRemotely Scraper
-    - Scrapes in exact sequential order
-    - Exports to beautifully formatted Excel & CSV
-    - Clean, professional output ready for clients
-    """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(
-            headless=False,  # Set to True for background operation
-            args=['--disable-blink-features=AutomationControlled']
-        )
-
-        context = browser.new_context(
-            viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        )
-
-        page = context.new_page()
-        all_jobs = []
-
-        print("=" * 80)
-        print("🔍 PROFESSIONAL WeWorkRemotely SCRAPER")
-        print("=" * 80)
-        print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-
-        try:
-            # Load main page with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    print(f"Loading main page (attempt {attempt + 1}/{max_retries})...")
-                    page.goto('https://weworkremotely.com/', timeout=60000, wait_until='load')
-                    page.wait_for_selector('li.feature', state='visible', timeout=30000)
-                    print("✅ Main page loaded successfully!\n")
-                    break
-                except Exception as e:
-                    if attempt == max_retries - 1:
-                        raise
-                    print(f"⚠️  Retry due to: {e}")
-                    time.sleep(2)
-
-            # Get all job cards IN EXACT ORDER
-            job_cards = page.query_selector_all('li.feature')
-            total_jobs = len(job_cards)
-
-            print(f"📊 Found {total_jobs} total jobs")
-            print(f"🎯 Scraping in exact sequential order as displayed on website\n")
-            print("-" * 80 + "\n")
-
-            # Scrape each job IN ORDER
-            for index, card in enumerate(job_cards, 1):
-                try:
-                    job_data = {}
-
-                    # ============================================================
-                    # STEP 1: Extract data from listing card
-                    # ============================================================
-
-                    # Job URL
-                    link_elem = card.query_selector('a[href^="/remote-jobs/"]')
-                    if not link_elem:
-                        print(f"[{index}/{total_jobs}] ⏭️  Skipping - no valid link found\n")
-                        continue
-
-                    # Check if listing is locked (requires login)
-                    class_attr = link_elem.get_attribute('class') or ''
-                    is_locked = 'listing-link--locked' in class_attr
-
-                    href = link_elem.get_attribute('href')
-                    job_data['Job URL'] = urljoin('https://weworkremotely.com', href)
-
-                    # Job Title
-                    title_elem = card.query_selector('.new-listing__header__title')
-                    job_data['Job Title'] = title_elem.inner_text().strip() if title_elem else 'N/A'
-
-                    # Company Name
-                    company_elem = card.query_selector('.new-listing__company-name')
-                    company_text = company_elem.inner_text().strip() if company_elem else 'N/A'
-                    job_data['Company Name'] = company_text
-
-                    # Company Location/Headquarters
-                    location_elem = card.query_selector('.new-listing__company-headquarters')
-                    job_data['Company Headquarters'] = location_elem.inner_text().strip() if location_elem else 'N/A'
-
-                    # Company Logo URL
-                    logo_elem = card.query_selector('.tooltip--flag-logo__flag-logo')
-                    if logo_elem:
-                        style = logo_elem.get_attribute('style')
-                        if style and 'url(' in style:
-                            logo_url = style.split('url(')[1].split(')')[0]
-                            job_data['Company Logo URL'] = logo_url
-                        else:
-                            job_data['Company Logo URL'] = 'N/A'
-                    else:
-                        job_data['Company Logo URL'] = 'N/A'
-
-                    # Company Profile URL
-                    company_link_elem = card.query_selector('a[href^="/company/"]')
-                    if company_link_elem:
-                        company_href = company_link_elem.get_attribute('href')
-                        job_data['Company Profile URL'] = urljoin('https://weworkremotely.com', company_href)
-                    else:
-                        job_data['Company Profile URL'] = 'N/A'
-
-                    # Categories/Tags (Featured, Top 100, Full-Time, etc.)
-                    categories = []
-                    category_elems = card.query_selector_all('.new-listing__categories__category')
-                    for cat in category_elems:
-                        cat_text = cat.inner_text().strip()
-                        categories.append(cat_text)
-
-                    job_data['Tags'] = ', '.join(categories) if categories else 'N/A'
-
-                    print(f"[{index}/{total_jobs}] 📝 {job_data['Job Title']}")
-                    print(f"              🏢 {job_data['Company Name']}")
-
-                    # ============================================================
-                    # STEP 2: Scrape detail page (if not locked)
-                    # ============================================================
-
-                    if is_locked:
-                        print(f"              🔒 Locked listing - basic info only\n")
-                        # Set default values for locked listings
-                        job_data['Date Posted'] = 'N/A'
-                        job_data['Apply Deadline'] = 'N/A'
-                        job_data['Job Type'] = 'N/A'
-                        job_data['Job Category'] = 'N/A'
-                        job_data['Region'] = 'N/A'
-                        job_data['Salary'] = 'N/A'
-                        job_data['Company Description'] = 'N/A'
-                        job_data['Job Description'] = 'N/A'
-                        job_data['Application URL'] = 'N/A'
-                        job_data['Company Total Jobs Posted'] = 'N/A'
-
-                        all_jobs.append(job_data)
-                        continue
-
-                    print(f"              📄 Fetching full details...")
-
-                    # Open detail page
-                    detail_page = context.new_page()
-
-                    # Load with retry
-                    for attempt in range(3):
-                        try:
-                            detail_page.goto(job_data['Job URL'], timeout=60000, wait_until='load')
-                            detail_page.wait_for_selector('.lis-container__header__hero__company-info', timeout=20000)
-                            break
-                        except Exception as e:
-                            if attempt == 2:
-                                raise
-                            time.sleep(1)
-
-                    # Date Posted
-                    posted_elem = detail_page.query_selector(
-                        '.lis-container__header__hero__company-info__icons__item span')
-                    job_data['Date Posted'] = posted_elem.inner_text().strip() if posted_elem else 'N/A'
-
-                    # Company Description
-                    company_desc_elem = detail_page.query_selector(
-                        '.lis-container__header__hero__company-info__description')
-                    job_data[
-                        'Company Description'] = company_desc_elem.inner_text().strip() if company_desc_elem else 'N/A'
-
-                    # Job Description (Full Text)
-                    job_desc_elem = detail_page.query_selector('.lis-container__job__content__description')
-                    if job_desc_elem:
-                        # Get clean text version
-                        job_desc_text = job_desc_elem.inner_text().strip()
-                        job_data['Job Description'] = job_desc_text
-
-                        # Extract salary if mentioned
-                        salary_match = re.search(
-                            r'\$[\d,]+(?:\s*-\s*\$[\d,]+)?(?:\s*(?:per|/)\s*(?:year|hour|month|annum|annually))?|€[\d,]+(?:\s*-\s*€[\d,]+)?(?:\s*(?:per|/)\s*(?:year|hour|month|annum|annually))?|£[\d,]+(?:\s*-\s*£[\d,]+)?',
-                            job_desc_text, re.IGNORECASE)
-                        job_data['Salary'] = salary_match.group(0) if salary_match else 'N/A'
-                    else:
-                        job_data['Job Description'] = 'N/A'
-                        job_data['Salary'] = 'N/A'
-
-                    # Application URL (Apply Button)
-                    apply_btn = detail_page.query_selector('a.apply-btn:not(.apply-btn--locked)')
-                    if apply_btn:
-                        apply_href = apply_btn.get_attribute('href')
-                        if apply_href and 'register' not in apply_href:
-                            job_data['Application URL'] = urljoin('https://weworkremotely.com', apply_href)
-                        else:
-                            # Try to find external apply link in description
-                            external_link = detail_page.query_selector(
-                                '.lis-container__job__content__description a[href*="apply"], .lis-container__job__content__description a[href*="jobs"], .lis-container__job__content__description a[href*="careers"]')
-                            if external_link:
-                                job_data['Application URL'] = external_link.get_attribute('href')
-                            else:
-                                job_data['Application URL'] = 'See Job Description'
-                    else:
-                        job_data['Application URL'] = 'See Job Description'
-
-                    # Sidebar Details
-                    sidebar_items = detail_page.query_selector_all(
-                        '.lis-container__job__sidebar__job-about__list__item')
-
-                    # Initialize fields
-                    job_data['Apply Deadline'] = 'N/A'
-                    job_data['Job Type'] = 'N/A'
-                    job_data['Job Category'] = 'N/A'
-                    job_data['Region'] = 'N/A'
-
-                    for item in sidebar_items:
-                        text = item.inner_text().strip()
-
-                        if 'Apply before' in text:
-                            span_elem = item.query_selector('span')
-                            job_data['Apply Deadline'] = span_elem.inner_text().strip() if span_elem else 'N/A'
-
-                        elif 'Job type' in text:
-                            job_type_elem = item.query_selector('.box--jobType')
-                            job_data['Job Type'] = job_type_elem.inner_text().strip() if job_type_elem else 'N/A'
-
-                        elif 'Category' in text:
-                            category_elem = item.query_selector('.box--blue')
-                            job_data['Job Category'] = category_elem.inner_text().strip() if category_elem else 'N/A'
-
-                        elif 'Region' in text:
-                            region_elem = item.query_selector('.box--region')
-                            job_data['Region'] = region_elem.inner_text().strip() if region_elem else 'N/A'
-
-                    # Company Total Jobs Posted
-                    jobs_posted_elem = detail_page.query_selector(
-                        '.lis-container__job__sidebar__companyDetails__info__jobs-posted')
-                    if jobs_posted_elem:
-                        jobs_posted_text = jobs_posted_elem.inner_text().strip()
-                        # Extract number from "Jobs posted: 174"
-                        match = re.search(r'\d+', jobs_posted_text)
-                        job_data['Company Total Jobs Posted'] = match.group(0) if match else 'N/A'
-                    else:
-                        job_data['Company Total Jobs Posted'] = 'N/A'
-
-                    detail_page.close()
-
-                    all_jobs.append(job_data)
-                    print(f"              ✅ Complete ({len(all_jobs)} scraped so far)\n")
-
-                    # Be respectful - add delay
-                    time.sleep(1.5)
-
-                except Exception as e:
-                    print(f"              ❌ Error: {str(e)}\n")
-                    continue
-
-        except Exception as e:
-            print(f"\n❌ Fatal error: {str(e)}")
-
-        finally:
-            browser.close()
-
-        # ============================================================
-        # STEP 3: Export to PROFESSIONALLY FORMATTED files
-        # ============================================================
-
-        if all_jobs:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-
-            print("\n" + "=" * 80)
-            print("💾 CREATING PROFESSIONAL EXPORTS")
-            print("=" * 80 + "\n")
-
-            # Define professional column order
-            column_order = [
-                'Job Title',
-                'Company Name',
-                'Company Headquarters',
-                'Date Posted',
-                'Apply Deadline',
-                'Job Type',
-                'Job Category',
-                'Region',
-                'Salary',
-                'Tags',
-                'Company Description',
-                'Job Description',
-                'Job URL',
-                'Application URL',
-                'Company Profile URL',
-                'Company Logo URL',
-                'Company Total Jobs Posted'
-            ]
-
-            # Create DataFrame
-            df = pd.DataFrame(all_jobs)
-
-            # Reorder columns (only include columns that exist)
-            existing_columns = [col for col in column_order if col in df.columns]
-            df = df[existing_columns]
-
-            # ============================================================
-            # 1. PROFESSIONAL EXCEL with FORMATTING
-            # ============================================================
-
-            excel_filename = f'WeWorkRemotely_Jobs_{timestamp}.xlsx'
-
-            # Save initial Excel file
-            with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Remote Jobs')
-
-            # Load workbook for professional formatting
-            wb = load_workbook(excel_filename)
-            ws = wb['Remote Jobs']
-
-            # Define professional color scheme
-            header_fill = PatternFill(start_color='1F4E78', end_color='1F4E78',
-                                      fill_type='solid')  # Professional dark blue
-            header_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')  # White bold text
-
-            # Cell styling
-            cell_font = Font(name='Calibri', size=10)
-            cell_alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
-
-            # Border style
-            thin_border = Border(
-                left=Side(style='thin', color='D3D3D3'),
-                right=Side(style='thin', color='D3D3D3'),
-                top=Side(style='thin', color='D3D3D3'),
-                bottom=Side(style='thin', color='D3D3D3')
-            )
-
-            # Format header row
-            for cell in ws[1]:
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                cell.border = thin_border
-
-            # Set row height for header
-            ws.row_dimensions[1].height = 25
-
-            # Format data cells
-            for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-                for cell in row:
-                    cell.font = cell_font
-                    cell.alignment = cell_alignment
-                    cell.border = thin_border
-
-            # Adjust column widths professionally
-            column_widths = {
-                'Job Title': 35,
-                'Company Name': 25,
-                'Company Headquarters': 20,
-                'Date Posted': 15,
-                'Apply Deadline': 15,
-                'Job Type': 12,
-                'Job Category': 20,
-                'Region': 25,
-                'Salary': 20,
-                'Tags': 30,
-                'Company Description': 50,
-                'Job Description': 60,
-                'Job URL': 40,
-                'Application URL': 40,
-                'Company Profile URL': 35,
-                'Company Logo URL': 35,
-                'Company Total Jobs Posted': 15
-            }
-
-            for idx, column in enumerate(existing_columns, 1):
-                column_letter = get_column_letter(idx)
-                ws.column_dimensions[column_letter].width = column_widths.get(column, 15)
-
-            # Freeze header row
-            ws.freeze_panes = 'A2'
-
-            # Add auto-filter
-            ws.auto_filter.ref = ws.dimensions
-
-            # Alternate row coloring for better readability
-            light_gray_fill = PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid')
-            for row_idx in range(3, ws.max_row + 1, 2):  # Every other row starting from row 3
-                for cell in ws[row_idx]:
-                    if cell.fill.start_color.rgb != header_fill.start_color.rgb:
-                        cell.fill = light_gray_fill
-
-            # Save formatted Excel
-            wb.save(excel_filename)
-            print(f"✅ Professional Excel saved: {excel_filename}")
-            print(f"   • Header: Dark blue with white bold text")
-            print(f"   • Borders: Clean professional borders")
-            print(f"   • Frozen header row for easy scrolling")
-            print(f"   • Auto-filter enabled")
-            print(f"   • Alternating row colors")
-            print(f"   • Optimized column widths")
-
-            # ============================================================
-            # 2. PROFESSIONAL CSV
-            # ============================================================
-
-            csv_filename = f'WeWorkRemotely_Jobs_{timestamp}.csv'
-            df.to_csv(csv_filename, index=False, encoding='utf-8-sig')  # UTF-8 with BOM for Excel compatibility
-            print(f"\n✅ Professional CSV saved: {csv_filename}")
-            print(f"   • UTF-8 encoded with BOM (Excel compatible)")
-            print(f"   • Clean, consistent formatting")
-
-            # ============================================================
-            # 3. CLEAN JSON (for backup/API use)
-            # ============================================================
-
-            json_filename = f'WeWorkRemotely_Jobs_{timestamp}.json'
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(all_jobs, f, indent=2, ensure_ascii=False)
-            print(f"\n✅ JSON saved: {json_filename}")
-
-            # ============================================================
-            # 4. Summary Statistics
-            # ============================================================
-
-            print("\n" + "=" * 80)
-            print("📊 SCRAPING SUMMARY")
-            print("=" * 80)
-            print(f"Total jobs found: {total_jobs}")
-            print(f"Successfully scraped: {len(all_jobs)}")
-            print(f"Success rate: {len(all_jobs) / total_jobs * 100:.1f}%")
-
-            # Job types breakdown
-            job_types = df['Job Type'].value_counts().to_dict()
-            print(f"\nJob Types:")
-            for jtype, count in job_types.items():
-                print(f"  • {jtype}: {count}")
-
-            # Job categories breakdown
-            categories = df['Job Category'].value_counts().head(5).to_dict()
-            print(f"\nTop 5 Categories:")
-            for cat, count in categories.items():
-                print(f"  • {cat}: {count}")
-
-            # Regions breakdown
-            regions = df['Region'].value_counts().head(5).to_dict()
-            print(f"\nTop 5 Regions:")
-            for region, count in regions.items():
-                print(f"  • {region}: {count}")
-
-            print(f"\n⏰ Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            print("=" * 80)
-            print("\n🎉 SCRAPING COMPLETE - Professional files ready for presentation!")
-            print("=" * 80)
-
-        else:
-            print("\n❌ No jobs were scraped successfully")
-
-        return all_jobs
-
-
-if __name__ == "__main__":
-    jobs = scrape_wwr_professional()
\ No newline at end of file
+from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+import csv
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse
+from datetime import datetime
+
+from wwr_extract import (BASE_URL, CARD_FIELDS, CARD_ROOT_SELECTOR, CATEGORY_LINK_FIELDS, CATEGORY_LINK_SELECTOR,
+                         COLUMN_ORDER, DETAIL_FIELDS, DETAIL_READY_SELECTOR, EXTRACT_JS, LOCKED_DEFAULTS,
+                         card_from_payload, category_urls, detail_from_payload, parse_cards_html,
+                         parse_detail_html, require_selectolax)
+from wwr_archive import DEFAULT_ARCHIVE_PATH, DETAIL, FEED, LISTING, PageArchive
+from wwr_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_AGE_DAYS, DEFAULT_TTL_HOURS, JobCache
+from wwr_checkpoint import DEFAULT_CHECKPOINT_PATH, DEFAULT_REPARSE_CHECKPOINT_PATH, Checkpoint
+from wwr_companies import (COMPANY_COLUMNS, DEFAULT_COMPANY_TTL_HOURS, EXPORT_LAYOUTS, CompanyRegistry, CompanyTable,
+                           detail_fields, job_columns)
+from wwr_diff import DEFAULT_SNAPSHOT_PATH, ChangeFeed
+from wwr_excel import write_excel
+from wwr_feeds import DEFAULT_FEED_PATH, discover_cards, parse_feed
+import wwr_http
+from wwr_load import DEFAULT_LOAD_PROFILE, LOAD_PROFILES, LoadProfile
+from wwr_metrics import DEFAULT_METRICS_PATH, Metrics
+from wwr_parquet import require_pyarrow, write_parquet
+from wwr_ratelimit import DEFAULT_MAX_RATE, DEFAULT_MIN_RATE, DEFAULT_RATE, RateLimiter
+from wwr_salary import with_salary
+from wwr_search import DEFAULT_INDEX_PATH, SearchIndex
+from wwr_store import DEFAULT_STORE_PATH, JobStore
+
+
+BROWSER_ARGS = ['--disable-blink-features=AutomationControlled']
+VIEWPORT = {'width': 1920, 'height': 1080}
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# Never hold more than this many detail pages open against one host
+DEFAULT_PER_HOST_LIMIT = 4
+
+
+class ScrapeOptions:
+    """
+    Settings every engine shares, passed around as one object
+    - base_url: site root to scrape, e.g. a local fixture server
+    - cache: optional JobCache; detail pages fetched within its TTL are skipped
+    - headless, load_profile: browser window and page-load profile (see wwr_load.py)
+    - metrics: stage timings and counters (see wwr_metrics.py)
+    - limiter: shared adaptive rate limiter pacing every page load (see wwr_ratelimit.py)
+    - companies: optional CompanyRegistry; company fields already known are
+      skipped in extraction and filled from it (see wwr_companies.py)
+    - export_layout: 'denormalized', or 'normalized' for separate companies files
+    - changes: optional ChangeFeed writing only what changed since the last run (see wwr_diff.py)
+    - archive: optional PageArchive keeping the raw pages for offline re-parsing (see wwr_archive.py)
+    - parquet: also write a typed Parquet export (see wwr_parquet.py)
+    - feeds: RSS feeds to discover cards from instead of the rendered homepage,
+      which stays the fallback (sync, async and http engines; see wwr_feeds.py)
+    """
+
+    def __init__(self, base_url=BASE_URL, cache=None, headless=True, load_profile=DEFAULT_LOAD_PROFILE, metrics=None,
+                 limiter=None, companies=None, export_layout='denormalized', changes=None, archive=None,
+                 parquet=False, feeds=None):
+        self.base_url = base_url
+        self.cache = cache
+        self.headless = headless
+        self.load_profile = load_profile
+        self.metrics = metrics or Metrics()
+        self.limiter = limiter or RateLimiter()
+        self.companies = companies
+        self.export_layout = export_layout
+        self.changes = changes
+        self.archive = archive
+        self.parquet = parquet
+        self.feeds = feeds
+
+
+def extract_cards(page, base_url=BASE_URL):
+    """
+    Extract every li.feature card IN EXACT ORDER with a single page.evaluate().
+    Each entry is (job_data, is_locked), or None when the card has no job link.
+    """
+    payloads = page.evaluate(EXTRACT_JS, {'root': CARD_ROOT_SELECTOR, 'fields': CARD_FIELDS})
+    return [card_from_payload(raw, base_url) for raw in payloads]
+
+
+async def extract_cards_async(page, base_url=BASE_URL):
+    """Async twin of extract_cards()."""
+    payloads = await page.evaluate(EXTRACT_JS, {'root': CARD_ROOT_SELECTOR, 'fields': CARD_FIELDS})
+    return [card_from_payload(raw, base_url) for raw in payloads]
+
+
+def extract_category_urls(page, base_url=BASE_URL):
+    """Every category listing page linked from the loaded page, in link order."""
+    payloads = page.evaluate(EXTRACT_JS, {'root': CATEGORY_LINK_SELECTOR, 'fields': CATEGORY_LINK_FIELDS})
+    return category_urls(payloads, base_url)
+
+
+def extract_detail(detail_page, job_data, base_url=BASE_URL, fields=DETAIL_FIELDS):
+    """Fill job_data from a loaded job detail page with a single page.evaluate()."""
+    raw = detail_page.evaluate(EXTRACT_JS, {'root': None, 'fields': fields})[0]
+    return detail_from_payload(raw, job_data, base_url)
+
+
+async def extract_detail_async(detail_page, job_data, base_url=BASE_URL, fields=DETAIL_FIELDS):
+    """Async twin of extract_detail()."""
+    raw = (await detail_page.evaluate(EXTRACT_JS, {'root': None, 'fields': fields}))[0]
+    return detail_from_payload(raw, job_data, base_url)
+
+
+def load_main_page(page, profile, base_url=BASE_URL, metrics=None, limiter=None):
+    """Load main page with retry logic until the li.feature cards are visible."""
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+
+    def load():
+        with metrics.stage('rate_limit_wait'):
+            limiter.wait()
+        start = time.perf_counter()
+        with metrics.stage('main_page.goto'):
+            response = page.goto(base_url + '/', timeout=60000, wait_until=profile.wait_until)
+        if response:
+            limiter.response(response.status, response.headers, time.perf_counter() - start)
+        with metrics.stage('main_page.wait_for_selector'):
+            page.wait_for_selector('li.feature', state='visible', timeout=30000)
+
+    max_retries = 3
+    for attempt in range(max_retries):
+        try:
+            print(f"Loading main page (attempt {attempt + 1}/{max_retries})...")
+            elapsed, transferred = profile.measure(page, base_url + '/', load)
+            print(f"✅ Main page loaded successfully! ({elapsed:.2f}s, {transferred / 1024:.0f} KB)\n")
+            break
+        except Exception as e:
+            metrics.failure(e, retrying=attempt < max_retries - 1)
+            limiter.failure(e)
+            if attempt == max_retries - 1:
+                raise
+            print(f"⚠️  Retry due to: {e}")
+            with metrics.stage('retry_backoff'):
+                time.sleep(limiter.backoff(attempt, e))
+
+
+async def load_main_page_async(page, profile, base_url=BASE_URL, metrics=None, limiter=None):
+    """Async twin of load_main_page()."""
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+
+    async def load():
+        with metrics.stage('rate_limit_wait'):
+            await limiter.wait_async()
+        start = time.perf_counter()
+        with metrics.stage('main_page.goto'):
+            response = await page.goto(base_url + '/', timeout=60000, wait_until=profile.wait_until)
+        if response:
+            limiter.response(response.status, response.headers, time.perf_counter() - start)
+        with metrics.stage('main_page.wait_for_selector'):
+            await page.wait_for_selector('li.feature', state='visible', timeout=30000)
+
+    max_retries = 3
+    for attempt in range(max_retries):
+        try:
+            print(f"Loading main page (attempt {attempt + 1}/{max_retries})...")
+            elapsed, transferred = await profile.measure_async(page, base_url + '/', load)
+            print(f"✅ Main page loaded successfully! ({elapsed:.2f}s, {transferred / 1024:.0f} KB)\n")
+            break
+        except Exception as e:
+            metrics.failure(e, retrying=attempt < max_retries - 1)
+            limiter.failure(e)
+            if attempt == max_retries - 1:
+                raise
+            print(f"⚠️  Retry due to: {e}")
+            with metrics.stage('retry_backoff'):
+                await asyncio.sleep(limiter.backoff(attempt, e))
+
+
+def load_detail_page(detail_page, url, profile, metrics=None, limiter=None):
+    """Load a job detail page with retry. Returns (seconds, bytes) of the final attempt."""
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+
+    def load():
+        with metrics.stage('rate_limit_wait'):
+            limiter.wait()
+        start = time.perf_counter()
+        with metrics.stage('detail.goto'):
+            response = detail_page.goto(url, timeout=60000, wait_until=profile.wait_until)
+        if response:
+            limiter.response(response.status, response.headers, time.perf_counter() - start)
+        with metrics.stage('detail.wait_for_selector'):
+            detail_page.wait_for_selector(DETAIL_READY_SELECTOR, timeout=20000)
+
+    for attempt in range(3):
+        try:
+            return profile.measure(detail_page, url, load)
+        except Exception as e:
+            metrics.failure(e, retrying=attempt < 2)
+            limiter.failure(e)
+            if attempt == 2:
+                raise
+            with metrics.stage('retry_backoff'):
+                time.sleep(limiter.backoff(attempt, e))
+
+
+async def load_detail_page_async(detail_page, url, profile, metrics=None, limiter=None):
+    """Async twin of load_detail_page()."""
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+
+    async def load():
+        with metrics.stage('rate_limit_wait'):
+            await limiter.wait_async()
+        start = time.perf_counter()
+        with metrics.stage('detail.goto'):
+            response = await detail_page.goto(url, timeout=60000, wait_until=profile.wait_until)
+        if response:
+            limiter.response(response.status, response.headers, time.perf_counter() - start)
+        with metrics.stage('detail.wait_for_selector'):
+            await detail_page.wait_for_selector(DETAIL_READY_SELECTOR, timeout=20000)
+
+    for attempt in range(3):
+        try:
+            return await profile.measure_async(detail_page, url, load)
+        except Exception as e:
+            metrics.failure(e, retrying=attempt < 2)
+            limiter.failure(e)
+            if attempt == 2:
+                raise
+            with metrics.stage('retry_backoff'):
+                await asyncio.sleep(limiter.backoff(attempt, e))
+
+
+def load_listing_page(page, url, profile, metrics=None, limiter=None):
+    """Load a category listing page with retry until its cards are in the DOM."""
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+
+    def load():
+        with metrics.stage('rate_limit_wait'):
+            limiter.wait()
+        start = time.perf_counter()
+        with metrics.stage('listing.goto'):
+            response = page.goto(url, timeout=60000, wait_until=profile.wait_until)
+        if response:
+            limiter.response(response.status, response.headers, time.perf_counter() - start)
+        with metrics.stage('listing.wait_for_selector'):
+            page.wait_for_selector(CARD_ROOT_SELECTOR, state='attached', timeout=20000)
+
+    for attempt in range(3):
+        try:
+            return profile.measure(page, url, load)
+        except Exception as e:
+            metrics.failure(e, retrying=attempt < 2)
+            limiter.failure(e)
+            if attempt == 2:
+                raise
+            with metrics.stage('retry_backoff'):
+                time.sleep(limiter.backoff(attempt, e))
+
+
+# ============================================================
+# Listing cards -> detail pages still to fetch
+# ============================================================
+
+def unique_cards(listings, metrics=None):
+    """
+    Flatten card lists (homepage, category pages, feeds) into unique
+    (job_data, is_locked) cards in discovery order: a Job URL seen before
+    keeps its first position, cards without a link are dropped.
+    """
+    metrics = metrics or Metrics()
+    seen = set()
+    jobs = []
+    for cards in listings:
+        for card_data in cards:
+            if card_data is None:
+                metrics.count('no_link')
+                continue
+            if card_data[0]['Job URL'] in seen:
+                metrics.count('duplicates')
+                continue
+            seen.add(card_data[0]['Job URL'])
+            jobs.append(card_data)
+    return jobs
+
+
+def sort_cards(jobs, checkpoint, options):
+    """
+    Settle every card that needs no detail page, in order
+    - Jobs already in the checkpoint (resume) are skipped
+    - Locked listings get LOCKED_DEFAULTS plus registry company details
+    - Fresh JobCache hits are filled from the cache
+    Each is submitted to the checkpoint under its 1-based position, and
+    every card's Job URL goes to the optional ChangeFeed as discovered.
+    Returns the rest as [(position, job_data), ...] for the detail fetch.
+    """
+    metrics = options.metrics
+    total = len(jobs)
+    pending = []
+    if options.changes:
+        options.changes.discover(job_data['Job URL'] for job_data, _ in jobs)
+    for index, (job_data, is_locked) in enumerate(jobs, 1):
+        job_start = time.perf_counter()
+
+        if checkpoint.has(job_data['Job URL']):
+            print(f"[{index}/{total}] ⏩ {job_data['Job Title']} - already in checkpoint")
+            metrics.count('resumed')
+            checkpoint.keep(index, job_data['Job URL'])
+            continue
+
+        if is_locked:
+            print(f"[{index}/{total}] 🔒 {job_data['Job Title']} - basic info only")
+            job_data.update(LOCKED_DEFAULTS)
+            if options.companies:
+                options.companies.fill(job_data)
+            metrics.count('locked')
+            checkpoint.submit(index, job_data)
+            metrics.job(index, 'locked', time.perf_counter() - job_start)
+            continue
+
+        if options.cache and options.cache.fill(job_data):
+            print(f"[{index}/{total}] 💾 {job_data['Job Title']} - cached")
+            metrics.count('cached')
+            checkpoint.submit(index, job_data)
+            metrics.job(index, 'cached', time.perf_counter() - job_start)
+            continue
+
+        pending.append((index, job_data))
+    return pending
+
+
+def scrape_wwr_professional(checkpoint=None, options=None):
+    """
+    Professional WeWorkRemotely Scraper
+    - Scrapes in exact sequential order
+    - Exports to beautifully formatted Excel & CSV
+    - Clean, professional output ready for clients
+    - Every job is written to the JSONL checkpoint as soon as it's done;
+      returns a generator over the checkpointed records
+    - Cache, load profile, metrics, rate limiter and the rest come from
+      `options` (see ScrapeOptions)
+    """
+    checkpoint = checkpoint or Checkpoint()
+    options = options or ScrapeOptions()
+    base_url, metrics, limiter, archive = options.base_url, options.metrics, options.limiter, options.archive
+    total_jobs = 0
+    profile = LoadProfile(options.load_profile)
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=options.headless,  # Pass headless=False (--headed) to watch the browser
+            args=BROWSER_ARGS
+        )
+
+        context = browser.new_context(
+            viewport=VIEWPORT,
+            user_agent=USER_AGENT
+        )
+        profile.install(context)
+
+        page = context.new_page()
+
+        print("=" * 80)
+        print("🔍 PROFESSIONAL WeWorkRemotely SCRAPER")
+        print("=" * 80)
+        print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+        try:
+            # Get all job cards IN EXACT ORDER
+            job_cards = None
+            if options.feeds:
+                job_cards = discover_cards(options.feeds, USER_AGENT, base_url, metrics, limiter, archive)
+            if job_cards is None:
+                load_main_page(page, profile, base_url, metrics, limiter)
+                if archive:
+                    archive.put(base_url, LISTING, page.content())
+                with metrics.stage('extract.cards'):
+                    job_cards = extract_cards(page, base_url)
+            jobs = unique_cards([job_cards], metrics)
+            total_jobs = len(jobs)
+
+            print(f"📊 Found {total_jobs} total jobs")
+            print(f"🎯 Scraping in exact sequential order as displayed on website\n")
+            print("-" * 80 + "\n")
+
+            # ============================================================
+            # STEP 1: Data from listing cards (resumed, locked, cached)
+            # ============================================================
+
+            pending = sort_cards(jobs, checkpoint, options)
+
+            # ============================================================
+            # STEP 2: Scrape each remaining detail page IN ORDER
+            # ============================================================
+
+            for index, job_data in pending:
+                job_start = time.perf_counter()
+                try:
+                    print(f"[{index}/{total_jobs}] 📝 {job_data['Job Title']}")
+                    print(f"              🏢 {job_data['Company Name']}")
+                    print(f"              📄 Fetching full details...")
+
+                    # Open detail page
+                    detail_page = context.new_page()
+                    elapsed, transferred = load_detail_page(detail_page, job_data['Job URL'], profile, metrics, limiter)
+                    if archive:
+                        archive.put(job_data['Job URL'], DETAIL, detail_page.content())
+                    fields = detail_fields(options.companies, job_data)
+                    with metrics.stage('extract.detail'):
+                        extract_detail(detail_page, job_data, base_url, fields)
+                    detail_page.close()
+
+                    if options.cache:
+                        options.cache.put(job_data)
+                    if options.companies:
+                        options.companies.put(job_data)
+                    checkpoint.submit(index, job_data)
+                    metrics.job(index, 'detail', time.perf_counter() - job_start)
+                    print(f"              ⏱️  Loaded in {elapsed:.2f}s, {transferred / 1024:.0f} KB")
+                    print(f"              ✅ Complete ({checkpoint.count} scraped so far)\n")
+
+                except Exception as e:
+                    print(f"              ❌ Error: {str(e)}\n")
+                    metrics.count('errors')
+                    checkpoint.submit(index, None)
+                    continue
+
+        except Exception as e:
+            print(f"\n❌ Fatal error: {str(e)}")
+
+        finally:
+            browser.close()
+            checkpoint.close()
+
+    profile.print_summary()
+    limiter.print_summary()
+    export_jobs(checkpoint, total_jobs, options)
+    return checkpoint.records()
+
+
+async def scrape_wwr_async(workers=4, per_host_limit=DEFAULT_PER_HOST_LIMIT, checkpoint=None, options=None):
+    """
+    Concurrent WeWorkRemotely Scraper (playwright.async_api)
+    - Reads every li.feature card from the main page first
+    - A pool of `workers` reusable detail pages drains a queue of detail URLs
+    - At most `per_host_limit` detail pages hit the same host at once
+    - Results are checkpointed by card index, so output order matches the website
+    - Everything else comes from `options` (see ScrapeOptions)
+    """
+    checkpoint = checkpoint or Checkpoint()
+    options = options or ScrapeOptions()
+    base_url, metrics, limiter, archive = options.base_url, options.metrics, options.limiter, options.archive
+    total_jobs = 0
+    profile = LoadProfile(options.load_profile)
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(
+            headless=options.headless,  # Pass headless=False (--headed) to watch the browser
+            args=BROWSER_ARGS
+        )
+
+        context = await browser.new_context(
+            viewport=VIEWPORT,
+            user_agent=USER_AGENT
+        )
+        await profile.install_async(context)
+
+        page = await context.new_page()
+
+        print("=" * 80)
+        print(f"🔍 PROFESSIONAL WeWorkRemotely SCRAPER (async, {workers} workers)")
+        print("=" * 80)
+        print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+        try:
+            # Get all job cards IN EXACT ORDER
+            job_cards = None
+            if options.feeds:
+                job_cards = await asyncio.to_thread(discover_cards, options.feeds, USER_AGENT, base_url, metrics,
+                                                    limiter, archive)
+            if job_cards is None:
+                await load_main_page_async(page, profile, base_url, metrics, limiter)
+                if archive:
+                    archive.put(base_url, LISTING, await page.content())
+                with metrics.stage('extract.cards'):
+                    job_cards = await extract_cards_async(page, base_url)
+            jobs = unique_cards([job_cards], metrics)
+            total_jobs = len(jobs)
+
+            print(f"📊 Found {total_jobs} total jobs")
+            print(f"🎯 Fetching details with {workers} workers, order preserved\n")
+            print("-" * 80 + "\n")
+
+            # ============================================================
+            # STEP 1: Queue the cards that need a detail page
+            # ============================================================
+
+            queue = asyncio.Queue()
+            for job in sort_cards(jobs, checkpoint, options):
+                queue.put_nowait(job)
+
+            # ============================================================
+            # STEP 2: Worker pool over the detail queue
+            # ============================================================
+
+            host_slots = {}
+
+            def host_slot(url):
+                host = urlparse(url).netloc
+                if host not in host_slots:
+                    host_slots[host] = asyncio.Semaphore(per_host_limit)
+                return host_slots[host]
+
+            async def worker(detail_page):
+                while True:
+                    try:
+                        index, job_data = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    try:
+                        with metrics.stage('host_slot_wait'):
+                            await host_slot(job_data['Job URL']).acquire()
+                        try:
+                            job_start = time.perf_counter()
+                            await load_detail_page_async(detail_page, job_data['Job URL'], profile, metrics, limiter)
+                            if archive:
+                                archive.put(job_data['Job URL'], DETAIL, await detail_page.content())
+                            fields = detail_fields(options.companies, job_data)
+                            with metrics.stage('extract.detail'):
+                                await extract_detail_async(detail_page, job_data, base_url, fields)
+                            if options.cache:
+                                options.cache.put(job_data)
+                            if options.companies:
+                                options.companies.put(job_data)
+                            checkpoint.submit(index, job_data)
+                            metrics.job(index, 'detail', time.perf_counter() - job_start)
+                            print(f"[{index}/{total_jobs}] ✅ {job_data['Job Title']} @ {job_data['Company Name']}")
+                        finally:
+                            host_slot(job_data['Job URL']).release()
+
+                    except Exception as e:
+                        print(f"[{index}/{total_jobs}] ❌ Error: {str(e)}")
+                        metrics.count('errors')
+                        checkpoint.submit(index, None)
+
+            detail_pages = [await context.new_page() for _ in range(max(1, workers))]
+            await asyncio.gather(*(worker(detail_page) for detail_page in detail_pages))
+
+        except Exception as e:
+            print(f"\n❌ Fatal error: {str(e)}")
+
+        finally:
+            await browser.close()
+            checkpoint.close()
+
+    profile.print_summary()
+    limiter.print_summary()
+    export_jobs(checkpoint, total_jobs, options)
+    return checkpoint.records()
+
+
+def scrape_wwr_http(workers=4, checkpoint=None, options=None):
+    """
+    Browserless WeWorkRemotely Scraper
+    - Main page is still rendered once to read the li.feature cards, unless
+      feed discovery finds them; Chromium only starts when a page needs it
+    - Detail pages are fetched over a pooled keep-alive HTTP client and
+      parsed statically with the browser engine's selectors
+    - Only pages the static parser can't handle are opened in Playwright
+    - options.load_profile applies to the main page and browser fallbacks;
+      everything else comes from `options` too (see ScrapeOptions)
+    """
+    checkpoint = checkpoint or Checkpoint()
+    options = options or ScrapeOptions()
+    base_url, metrics, limiter, archive = options.base_url, options.metrics, options.limiter, options.archive
+    total_jobs = 0
+    profile = LoadProfile(options.load_profile)
+
+    with sync_playwright() as p:
+        browser = None
+        context = None
+
+        def browser_context():
+            # Chromium is only launched once a page really needs rendering
+            nonlocal browser, context
+            if context is None:
+                browser = p.chromium.launch(
+                    headless=options.headless,  # Pass headless=False (--headed) to watch the browser
+                    args=BROWSER_ARGS
+                )
+                context = browser.new_context(
+                    viewport=VIEWPORT,
+                    user_agent=USER_AGENT
+                )
+                profile.install(context)
+            return context
+
+        print("=" * 80)
+        print(f"🔍 PROFESSIONAL WeWorkRemotely SCRAPER (http, {workers} connections)")
+        print("=" * 80)
+        print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+        try:
+            # Get all job cards IN EXACT ORDER
+            job_cards = None
+            if options.feeds:
+                job_cards = discover_cards(options.feeds, USER_AGENT, base_url, metrics, limiter, archive)
+            if job_cards is None:
+                page = browser_context().new_page()
+                load_main_page(page, profile, base_url, metrics, limiter)
+                if archive:
+                    archive.put(base_url, LISTING, page.content())
+                with metrics.stage('extract.cards'):
+                    job_cards = extract_cards(page, base_url)
+                page.close()
+            jobs = unique_cards([job_cards], metrics)
+            total_jobs = len(jobs)
+
+            print(f"📊 Found {total_jobs} total jobs")
+            print(f"⚡ Fetching details over HTTP, order preserved\n")
+            print("-" * 80 + "\n")
+
+            # ============================================================
+            # STEP 1: Collect the cards that need a detail page
+            # ============================================================
+
+            pending = sort_cards(jobs, checkpoint, options)
+
+            # ============================================================
+            # STEP 2: Static fetch + parse, browser fallback
+            # ============================================================
+
+            fallback = []
+            with wwr_http.make_client(USER_AGENT, max_connections=workers) as client:
+                for index, job_data, parsed in wwr_http.fetch_details(
+                        client, pending, workers=workers, limiter=limiter, base_url=base_url, metrics=metrics,
+                        companies=options.companies, archive=archive):
+                    if parsed is None:
+                        metrics.count('errors')
+                        checkpoint.submit(index, None)
+                        continue
+                    if not parsed:
+                        metrics.count('http_fallbacks')
+                        fallback.append((index, job_data))
+                        continue
+                    if options.cache:
+                        options.cache.put(job_data)
+                    checkpoint.submit(index, job_data)
+
+            if fallback:
+                print(f"\n🌐 {len(fallback)} pages need the browser\n")
+
+            for index, job_data in fallback:
+                try:
+                    job_start = time.perf_counter()
+                    detail_page = browser_context().new_page()
+                    load_detail_page(detail_page, job_data['Job URL'], profile, metrics, limiter)
+                    if archive:
+                        archive.put(job_data['Job URL'], DETAIL, detail_page.content())
+                    fields = detail_fields(options.companies, job_data)
+                    with metrics.stage('extract.detail'):
+                        extract_detail(detail_page, job_data, base_url, fields)
+                    detail_page.close()
+                    if options.cache:
+                        options.cache.put(job_data)
+                    if options.companies:
+                        options.companies.put(job_data)
+                    checkpoint.submit(index, job_data)
+                    metrics.job(index, 'browser', time.perf_counter() - job_start)
+                    print(f"[{index}/{total_jobs}] ✅ {job_data['Job Title']} @ {job_data['Company Name']}")
+
+                except Exception as e:
+                    print(f"[{index}/{total_jobs}] ❌ Error: {str(e)}")
+                    metrics.count('errors')
+                    checkpoint.submit(index, None)
+
+        except Exception as e:
+            print(f"\n❌ Fatal error: {str(e)}")
+
+        finally:
+            if browser:
+                browser.close()
+            checkpoint.close()
+
+    profile.print_summary()
+    limiter.print_summary()
+    export_jobs(checkpoint, total_jobs, options)
+    return checkpoint.records()
+
+
+def crawl_shard(shard, store_path, base_url, headless, load_profile, cache_settings, rate_settings,
+                company_settings=None, archive_path=None, search_path=None):
+    """
+    Worker process of the crawl engine
+    - Opens its own browser context and one reusable detail page
+    - Fetches the detail pages of its shard [(position, job_data), ...]
+      and puts each finished record into the shared JobStore
+    - Returns (metrics snapshot, throttled responses) for the parent to merge
+    """
+    search = SearchIndex(search_path) if search_path else None
+    store = JobStore(store_path, resume=True, search=search)
+    cache = JobCache(*cache_settings) if cache_settings else None
+    companies = CompanyRegistry(*company_settings) if company_settings else None
+    archive = PageArchive(archive_path) if archive_path else None
+    metrics = Metrics()
+    limiter = RateLimiter(*rate_settings)
+    profile = LoadProfile(load_profile)
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless, args=BROWSER_ARGS)
+        context = browser.new_context(viewport=VIEWPORT, user_agent=USER_AGENT)
+        profile.install(context)
+        detail_page = context.new_page()
+
+        try:
+            for position, job_data in shard:
+                try:
+                    job_start = time.perf_counter()
+                    load_detail_page(detail_page, job_data['Job URL'], profile, metrics, limiter)
+                    if archive:
+                        archive.put(job_data['Job URL'], DETAIL, detail_page.content())
+                    fields = detail_fields(companies, job_data)
+                    with metrics.stage('extract.detail'):
+                        extract_detail(detail_page, job_data, base_url, fields)
+                    store.put(position, job_data)
+                    metrics.job(position, 'detail', time.perf_counter() - job_start)
+                    print(f"[{position}] ✅ {job_data['Job Title']} @ {job_data['Company Name']}")
+
+                except Exception as e:
+                    print(f"[{position}] ❌ Error: {str(e)}")
+                    metrics.count('errors')
+                    continue
+
+                # The job is already stored; a busy cache only costs a re-fetch next run
+                try:
+                    if cache:
+                        cache.put(job_data)
+                    if companies:
+                        companies.put(job_data)
+                except Exception as e:
+                    print(f"[{position}] ⚠️  Cache not updated: {str(e)}")
+                    metrics.count('cache_errors')
+
+        finally:
+            browser.close()
+            store.close()
+            if cache:
+                cache.close()
+            if companies:
+                companies.close()
+            if archive:
+                archive.close()
+            if search:
+                search.close()
+
+    return metrics.snapshot(), limiter.throttled
+
+
+def scrape_wwr_crawl(processes=4, store=None, options=None):
+    """
+    Full-site WeWorkRemotely Crawler
+    - Reads the homepage cards plus every category listing page it links to
+    - Jobs listed in several categories are crawled once (deduplicated by Job URL)
+    - Detail pages are sharded round-robin across `processes` worker processes,
+      each with its own browser and its share of the limiter's rate
+    - Results meet in one shared JobStore; exports follow discovery order
+      (homepage first, then categories in link order), however shards finish
+    - Everything else comes from `options` (see ScrapeOptions); options.feeds
+      is not used, categories are read from their listing pages
+    """
+    store = store or JobStore()
+    options = options or ScrapeOptions()
+    base_url, metrics, limiter, archive = options.base_url, options.metrics, options.limiter, options.archive
+    cache, companies = options.cache, options.companies
+    processes = max(1, processes)
+    total_jobs = 0
+    profile = LoadProfile(options.load_profile)
+    listings = []
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch(
+            headless=options.headless,  # Pass headless=False (--headed) to watch the browser
+            args=BROWSER_ARGS
+        )
+
+        context = browser.new_context(
+            viewport=VIEWPORT,
+            user_agent=USER_AGENT
+        )
+        profile.install(context)
+
+        page = context.new_page()
+
+        print("=" * 80)
+        print(f"🔍 PROFESSIONAL WeWorkRemotely SCRAPER (crawl, {processes} processes)")
+        print("=" * 80)
+        print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+
+        try:
+            # ============================================================
+            # STEP 1: Homepage + every category listing page
+            # ============================================================
+
+            load_main_page(page, profile, base_url, metrics, limiter)
+            if archive:
+                archive.put(base_url, LISTING, page.content())
+            with metrics.stage('extract.cards'):
+                listings.append(extract_cards(page, base_url))
+                categories = extract_category_urls(page, base_url)
+            print(f"🗂️  Found {len(categories)} category pages\n")
+
+            for url in categories:
+                try:
+                    load_listing_page(page, url, profile, metrics, limiter)
+                    if archive:
+                        archive.put(url, LISTING, page.content())
+                    with metrics.stage('extract.cards'):
+                        listings.append(extract_cards(page, base_url))
+                    print(f"   • {url}: {len(listings[-1])} jobs")
+                except Exception as e:
+                    print(f"   • {url}: ❌ {str(e)}")
+                    metrics.count('errors')
+
+        except Exception as e:
+            print(f"\n❌ Fatal error: {str(e)}")
+
+        finally:
+            browser.close()
+
+    # ============================================================
+    # STEP 2: Deduplicate in discovery order
+    # ============================================================
+
+    jobs = unique_cards(listings, metrics)
+    total_jobs = len(jobs)
+    print(f"\n📊 Found {total_jobs} unique jobs ({metrics.counters['duplicates']} duplicates across categories)\n")
+    pending = sort_cards(jobs, store, options)
+    print(f"\n🎯 Fetching {len(pending)} detail pages with {processes} processes\n")
+    print("-" * 80 + "\n")
+
+    # ============================================================
+    # STEP 3: Shard detail pages across worker processes
+    # ============================================================
+
+    if pending:
+        shards = [pending[i::processes] for i in range(processes) if pending[i::processes]]
+        cache_settings = (cache.path, cache.ttl / 3600, cache.full_refresh) if cache else None
+        company_settings = (companies.path, companies.ttl / 3600) if companies else None
+        rate_settings = (limiter.rate / len(shards), limiter.min_rate / len(shards), limiter.max_rate / len(shards))
+
+        # Playwright isn't fork-safe, so every worker starts from a fresh interpreter
+        with ProcessPoolExecutor(max_workers=len(shards), mp_context=multiprocessing.get_context('spawn')) as pool:
+            futures = [pool.submit(crawl_shard, shard, store.path, base_url, options.headless, options.load_profile,
+                                   cache_settings, rate_settings, company_settings,
+                                   archive.path if archive else None,
+                                   store.search.path if store.search else None) for shard in shards]
+            for future in futures:
+                try:
+                    snapshot, throttled = future.result()
+                    metrics.merge(snapshot)
+                    limiter.throttled += throttled
+                except Exception as e:
+                    print(f"\n❌ Worker process failed: {str(e)}")
+                    metrics.count('errors')
+
+    profile.print_summary()
+    limiter.print_summary()
+    export_jobs(store, total_jobs, options)
+    return store.records()
+
+
+def reparse_archive(checkpoint=None, options=None):
+    """
+    Offline re-parse of options.archive (a PageArchive)
+    - No browser, no network: listing and detail pages come from the archive
+      and go through the static parser with the current field specs
+    - Listing pages are read in archived order and deduplicated by Job URL,
+      like the crawl engine
+    - Jobs whose detail page was never archived (e.g. served from the
+      JobCache at the time) are skipped and counted as not_archived
+    - options.cache should be None: every detail page is re-parsed
+    - options.companies should be None too: archived company details are
+      as old as their pages and mustn't count as fresh in the registry
+    """
+    checkpoint = checkpoint or Checkpoint()
+    options = options or ScrapeOptions()
+    base_url, metrics, archive = options.base_url, options.metrics, options.archive
+
+    print("=" * 80)
+    print("🗄️  WeWorkRemotely RE-PARSE (offline)")
+    print("=" * 80)
+    print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"📦 {archive.count(LISTING, FEED)} listing pages and feeds, {archive.count(DETAIL)} detail pages "
+          f"in {archive.path}\n")
+
+    listings = []
+    total_jobs = 0
+    try:
+        for url, kind, html in archive.pages(LISTING, FEED):
+            with metrics.stage('extract.cards'):
+                if kind == FEED:
+                    listings.append(list(parse_feed([html.encode('utf-8')], base_url)))
+                else:
+                    listings.append(parse_cards_html(html, base_url))
+            print(f"   • {url}: {len(listings[-1])} jobs")
+
+        jobs = unique_cards(listings, metrics)
+        total_jobs = len(jobs)
+        print()
+
+        for index, job_data in sort_cards(jobs, checkpoint, options):
+            job_start = time.perf_counter()
+            try:
+                detail_html = archive.get(job_data['Job URL'])
+                if detail_html is None:
+                    metrics.count('not_archived')
+                    checkpoint.submit(index, None)
+                    continue
+                with metrics.stage('extract.detail_static'):
+                    parsed = parse_detail_html(detail_html, job_data, base_url)
+                if parsed is None:
+                    raise ValueError("archived page doesn't look like a job detail page")
+                checkpoint.submit(index, job_data)
+                metrics.job(index, 'archive', time.perf_counter() - job_start)
+
+            except Exception as e:
+                print(f"[{index}] ❌ {job_data['Job URL']}: {str(e)}")
+                metrics.count('errors')
+                checkpoint.submit(index, None)
+
+    finally:
+        checkpoint.close()
+
+    print(f"\n📊 Re-parsed {checkpoint.count} of {total_jobs} unique jobs "
+          f"({metrics.counters['not_archived']} without an archived detail page)")
+    export_jobs(checkpoint, total_jobs, options)
+    return checkpoint.records()
+
+
+def write_csv(records, csv_filename, columns=COLUMN_ORDER):
+    """Stream records into a UTF-8 (with BOM) CSV in the professional column order."""
+    with open(csv_filename, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore', lineterminator='\n')
+        writer.writeheader()
+        for job_data in records:
+            writer.writerow(job_data)
+
+
+def write_json(records, json_filename):
+    """Stream records into a JSON array, formatted like json.dump(..., indent=2)."""
+    with open(json_filename, 'w', encoding='utf-8') as f:
+        f.write('[')
+        empty = True
+        for job_data in records:
+            f.write('\n  ' if empty else ',\n  ')
+            f.write(json.dumps(job_data, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+            empty = False
+        f.write(']' if empty else '\n]')
+
+
+def export_jobs(checkpoint, total_jobs, options=None):
+    """
+    Write the professionally formatted Excel, CSV and JSON exports from the checkpoint.
+    options.export_layout, options.changes and options.parquet add the
+    companies files, the change feed and the Parquet files (see ScrapeOptions).
+    """
+    options = options or ScrapeOptions()
+    metrics, changes, parquet = options.metrics, options.changes, options.parquet
+    normalized = options.export_layout == 'normalized'
+    columns = job_columns() if normalized else COLUMN_ORDER
+    company_table = CompanyTable()
+
+    # ============================================================
+    # STEP 3: Export to PROFESSIONALLY FORMATTED files
+    # ============================================================
+
+    if checkpoint.count:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+        print("\n" + "=" * 80)
+        print("💾 CREATING PROFESSIONAL EXPORTS")
+        print("=" * 80 + "\n")
+
+        def records():
+            # Checkpointed records plus the structured salary columns
+            return with_salary(checkpoint.records())
+
+        def job_rows(records):
+            # Normalized JSON keeps only the job columns
+            for job_data in records:
+                yield {key: value for key, value in job_data.items() if key in columns} if normalized else job_data
+
+        # ============================================================
+        # 1. PROFESSIONAL EXCEL with FORMATTING
+        # ============================================================
+
+        excel_filename = f'WeWorkRemotely_Jobs_{timestamp}.xlsx'
+        with metrics.stage('export.excel'):
+            write_excel(company_table.collect(records()), excel_filename, columns=columns)
+        print(f"✅ Professional Excel saved: {excel_filename}")
+        print(f"   • Header: Dark blue with white bold text")
+        print(f"   • Borders: Clean professional borders")
+        print(f"   • Frozen header row for easy scrolling")
+        print(f"   • Auto-filter enabled")
+        print(f"   • Alternating row colors")
+        print(f"   • Optimized column widths")
+
+        # ============================================================
+        # 2. PROFESSIONAL CSV
+        # ============================================================
+
+        csv_filename = f'WeWorkRemotely_Jobs_{timestamp}.csv'
+        job_types = Counter()
+        categories = Counter()
+        regions = Counter()
+
+        def counted(records):
+            # Collect summary statistics during the CSV pass
+            for job_data in records:
+                job_types[job_data.get('Job Type')] += 1
+                categories[job_data.get('Job Category')] += 1
+                regions[job_data.get('Region')] += 1
+                yield job_data
+
+        with metrics.stage('export.csv'):
+            write_csv(counted(records()), csv_filename, columns=columns)  # UTF-8 with BOM for Excel compatibility
+        print(f"\n✅ Professional CSV saved: {csv_filename}")
+        print(f"   • UTF-8 encoded with BOM (Excel compatible)")
+        print(f"   • Clean, consistent formatting")
+
+        # ============================================================
+        # 3. CLEAN JSON (for backup/API use)
+        # ============================================================
+
+        json_filename = f'WeWorkRemotely_Jobs_{timestamp}.json'
+        changes_filename = f'WeWorkRemotely_Changes_{timestamp}.jsonl'
+        with metrics.stage('export.json'):
+            json_records = changes.collect(records(), changes_filename) if changes else records()
+            write_json(job_rows(json_records), json_filename)
+        print(f"\n✅ JSON saved: {json_filename}")
+
+        # ============================================================
+        # 4. TYPED PARQUET (for analytics)
+        # ============================================================
+
+        if parquet:
+            parquet_filename = f'WeWorkRemotely_Jobs_{timestamp}.parquet'
+            with metrics.stage('export.parquet'):
+                write_parquet(records(), parquet_filename, columns)
+            print(f"\n✅ Parquet saved: {parquet_filename}")
+            print(f"   • Typed columns: nullable ints, parsed dates, dictionary-encoded categories")
+
+        # ============================================================
+        # 5. COMPANIES (normalized layout only)
+        # ============================================================
+
+        if normalized:
+            companies_filename = f'WeWorkRemotely_Companies_{timestamp}'
+            with metrics.stage('export.companies'):
+                write_excel(company_table.records(), companies_filename + '.xlsx', columns=COMPANY_COLUMNS,
+                            sheet_name='Companies')
+                write_csv(company_table.records(), companies_filename + '.csv', columns=COMPANY_COLUMNS)
+                write_json(company_table.records(), companies_filename + '.json')
+                if parquet:
+                    write_parquet(company_table.records(), companies_filename + '.parquet', COMPANY_COLUMNS)
+            extensions = '.xlsx / .csv / .json' + (' / .parquet' if parquet else '')
+            print(f"\n✅ Companies saved: {companies_filename}{extensions} "
+                  f"({len(company_table.rows)} companies, keyed by Company Profile URL or Company Name)")
+
+        # ============================================================
+        # 6. CHANGE FEED (delta mode only)
+        # ============================================================
+
+        if changes:
+            with metrics.stage('export.changes'):
+                counts = changes.commit()
+            print(f"\n✅ Change feed saved: {changes_filename}" + (" (first run: baseline)" if changes.baseline else ''))
+            print(f"   • {counts['added']} added, {counts['updated']} updated, {counts['removed']} removed, "
+                  f"{counts['unchanged']} unchanged")
+
+        # ============================================================
+        # 7. Summary Statistics
+        # ============================================================
+
+        print("\n" + "=" * 80)
+        print("📊 SCRAPING SUMMARY")
+        print("=" * 80)
+        print(f"Total jobs found: {total_jobs}")
+        print(f"Successfully scraped: {checkpoint.count}")
+        if total_jobs:
+            print(f"Success rate: {checkpoint.count / total_jobs * 100:.1f}%")
+
+        # Job types breakdown
+        print(f"\nJob Types:")
+        for jtype, count in job_types.most_common():
+            print(f"  • {jtype}: {count}")
+
+        # Job categories breakdown
+        print(f"\nTop 5 Categories:")
+        for cat, count in categories.most_common(5):
+            print(f"  • {cat}: {count}")
+
+        # Regions breakdown
+        print(f"\nTop 5 Regions:")
+        for region, count in regions.most_common(5):
+            print(f"  • {region}: {count}")
+
+        print(f"\n⏰ Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print("=" * 80)
+        print("\n🎉 SCRAPING COMPLETE - Professional files ready for presentation!")
+        print("=" * 80)
+
+    else:
+        print("\n❌ No jobs were scraped successfully")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Professional WeWorkRemotely scraper')
+    parser.add_argument('--engine', choices=['sync', 'async', 'http', 'crawl', 'reparse'], default='sync',
+                        help='sync: classic one-page-at-a-time loop; async: worker pool of reusable pages; '
+                             'http: browserless detail pages with Playwright fallback; '
+                             'crawl: homepage plus every category page, sharded across processes; '
+                             'reparse: re-extract the --archive offline, no browser or network')
+    parser.add_argument('--workers', type=int, default=4,
+                        help='Reusable detail pages (async) or HTTP connections (http)')
+    parser.add_argument('--processes', type=int, default=4,
+                        help='Worker processes, each with its own browser (crawl engine)')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH,
+                        help='Shared SQLite store the crawl workers write to')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST_LIMIT,
+                        help='Maximum concurrent detail pages against one host (async engine)')
+    parser.add_argument('--load-profile', choices=sorted(LOAD_PROFILES), default=DEFAULT_LOAD_PROFILE,
+                        help='full: wait for every resource; lite: block images/fonts/CSS/analytics, '
+                             'wait for domcontentloaded')
+    parser.add_argument('--headed', action='store_true',
+                        help='Show the browser window instead of running headless')
+    parser.add_argument('--base-url', default=BASE_URL,
+                        help='Site root to scrape, e.g. a local fixture server')
+    parser.add_argument('--discovery', choices=['homepage', 'feed'], default='homepage',
+                        help='homepage: render the main page for its cards; feed: read the RSS feeds instead, '
+                             'falling back to the homepage (sync, async and http engines)')
+    parser.add_argument('--feed', action='append', metavar='URL',
+                        help=f'Feed to discover from, absolute or relative to --base-url; repeatable '
+                             f'(default {DEFAULT_FEED_PATH}, e.g. /categories/remote-programming-jobs.rss)')
+    parser.add_argument('--cache', default=DEFAULT_CACHE_PATH,
+                        help='SQLite job cache used for incremental re-scrapes')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Disable the job cache entirely')
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL_HOURS,
+                        help='Hours a cached detail page stays fresh')
+    parser.add_argument('--cache-max-age', type=float, default=DEFAULT_MAX_AGE_DAYS,
+                        help='Evict cached jobs not seen on the site for this many days')
+    parser.add_argument('--company-ttl', type=float, default=DEFAULT_COMPANY_TTL_HOURS,
+                        help='Hours company details stay fresh in the company registry')
+    parser.add_argument('--export-layout', choices=EXPORT_LAYOUTS, default='denormalized',
+                        help='denormalized: company details on every job row; '
+                             'normalized: jobs files plus separate companies files')
+    parser.add_argument('--archive', nargs='?', const=DEFAULT_ARCHIVE_PATH, metavar='PATH',
+                        help=f'Keep every fetched listing and detail page in a compressed archive '
+                             f'(default {DEFAULT_ARCHIVE_PATH}); read by --engine reparse')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Also export typed, zstd-compressed Parquet (pip install pyarrow)')
+    parser.add_argument('--index', default=DEFAULT_INDEX_PATH,
+                        help='Full-text search index updated with every record (query it with wwr_search.py)')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Do not update the search index')
+    parser.add_argument('--delta', action='store_true',
+                        help='Also write a change feed of jobs added, updated and removed since the last run')
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT_PATH,
+                        help='SQLite file holding the previous run for --delta')
+    parser.add_argument('--full-refresh', action='store_true',
+                        help='Re-fetch every detail page, ignoring cached records')
+    parser.add_argument('--checkpoint',
+                        help=f'JSONL file every finished job is appended to (default {DEFAULT_CHECKPOINT_PATH}, '
+                             f'or {DEFAULT_REPARSE_CHECKPOINT_PATH} for --engine reparse)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Keep the existing checkpoint (or crawl store) and skip jobs already in it')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help='Starting request rate (pages/second) of the adaptive rate limiter')
+    parser.add_argument('--min-rate', type=float, default=DEFAULT_MIN_RATE,
+                        help='The limiter never slows below this rate, however often it is throttled')
+    parser.add_argument('--max-rate', type=float, default=DEFAULT_MAX_RATE,
+                        help='The limiter never speeds up past this rate, however healthy responses are')
+    parser.add_argument('--metrics', default=DEFAULT_METRICS_PATH,
+                        help='Write stage timings and counters to <path>.json and <path>.prom')
+    parser.add_argument('--trace', metavar='PATH',
+                        help='Also write a Chrome trace (chrome://tracing, ui.perfetto.dev) to PATH')
+    args = parser.parse_args()
+    if args.parquet:
+        # Fail before scraping, not halfway through the exports
+        try:
+            require_pyarrow()
+        except ImportError as e:
+            parser.error(str(e))
+    # crawl reads category pages and reparse replays archived feeds, so only these engines download feeds
+    reads_feeds = args.discovery == 'feed' and args.engine in ('sync', 'async', 'http')
+    if args.engine in ('http', 'reparse') or reads_feeds:
+        # Static parsing, the pooled client and feed downloads need optional packages
+        try:
+            if args.engine == 'http' or reads_feeds:
+                wwr_http.require_httpx()
+            if args.engine in ('http', 'reparse'):
+                require_selectolax()
+        except ImportError as e:
+            parser.error(str(e))
+    feeds = (args.feed or [DEFAULT_FEED_PATH]) if args.discovery == 'feed' else None
+
+    # Browser engines write to the archive, the reparse engine reads it back
+    archive = None
+    if args.archive or args.engine == 'reparse':
+        archive = PageArchive(args.archive or DEFAULT_ARCHIVE_PATH)
+
+    cache = None
+    companies = None
+    # The reparse engine re-extracts every archived detail page, so it never reads the job cache,
+    # and its pages may be months old, so it never stamps their company details as fresh either
+    if not args.no_cache and args.engine != 'reparse':
+        cache = JobCache(args.cache, ttl_hours=args.cache_ttl, full_refresh=args.full_refresh)
+        # Company registry lives next to the job cache; a full refresh re-extracts companies too
+        companies = CompanyRegistry(args.cache, ttl_hours=0 if args.full_refresh else args.company_ttl)
+    changes = ChangeFeed(args.snapshot) if args.delta else None
+
+    metrics = Metrics(trace=bool(args.trace))
+    limiter = RateLimiter(rate=args.rate, min_rate=args.min_rate, max_rate=args.max_rate)
+
+    options = ScrapeOptions(base_url=args.base_url.rstrip('/'), cache=cache, headless=not args.headed,
+                            load_profile=args.load_profile, metrics=metrics, limiter=limiter, companies=companies,
+                            export_layout=args.export_layout, changes=changes, archive=archive,
+                            parquet=args.parquet, feeds=feeds)
+
+    # Every record is indexed for wwr_search.py as soon as it's checkpointed
+    search = None if args.no_index else SearchIndex(args.index)
+
+    # The crawl engine keeps its progress in the shared store instead of the checkpoint
+    if args.engine == 'crawl':
+        checkpoint = JobStore(args.store, resume=args.resume, search=search)
+    else:
+        default_path = DEFAULT_REPARSE_CHECKPOINT_PATH if args.engine == 'reparse' else DEFAULT_CHECKPOINT_PATH
+        checkpoint = Checkpoint(args.checkpoint or default_path, resume=args.resume, search=search)
+    if args.resume:
+        print(f"⏩ Resuming from {checkpoint.path}: {checkpoint.count} jobs already done")
+
+    try:
+        if args.engine == 'reparse':
+            return reparse_archive(checkpoint=checkpoint, options=options)
+        if args.engine == 'crawl':
+            return scrape_wwr_crawl(processes=args.processes, store=checkpoint, options=options)
+        if args.engine == 'async':
+            return asyncio.run(scrape_wwr_async(workers=args.workers, per_host_limit=args.per_host,
+                                                checkpoint=checkpoint, options=options))
+        if args.engine == 'http':
+            return scrape_wwr_http(workers=args.workers, checkpoint=checkpoint, options=options)
+        return scrape_wwr_professional(checkpoint=checkpoint, options=options)
+
+    finally:
+        checkpoint.close()
+        if cache:
+            evicted = cache.evict(max_age_days=args.cache_max_age)
+            print(f"💾 Cache: {cache.hits} hits, {cache.misses} misses, {evicted} evicted ({cache.path})")
+            cache.close()
+        if companies:
+            print(f"🏢 Company registry: {companies.hits} hits, {companies.misses} misses")
+            companies.close()
+        if changes:
+            changes.close()
+        if search:
+            print(f"🔎 Search index: {search.added} jobs indexed, {search.count} total ({search.path})")
+            search.close()
+        if archive:
+            if archive.stored or archive.deduplicated:
+                print(f"🗄️  Archive: {archive.stored} pages stored, {archive.deduplicated} unchanged ({archive.path})")
+            archive.close()
+
+        metrics.count('throttled', limiter.throttled)
+        metrics.print_summary()
+        json_path, prom_path = metrics.write(args.metrics)
+        print(f"📈 Metrics saved: {json_path}, {prom_path}")
+        if args.trace:
+            print(f"📈 Trace saved: {metrics.write_trace(args.trace)}")
+
+
+if __name__ == "__main__":
+    jobs = main()
@@ -0,0 +1,119 @@
+"""
+Raw-page archive for offline re-parsing
+- Every fetched listing and detail page can be kept as raw HTML, so a
+  selector change on the site costs a re-parse instead of a re-crawl
+- One indexed pack file (SQLite): pages maps URL -> content digest, blobs
+  holds each distinct page once, compressed (zstd when installed, else zlib)
+- Listing pages and RSS feeds are read back in the order they were first
+  archived (homepage, then categories), so re-parsed exports keep website order
+"""
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # Optional - zlib is always there
+    zstandard = None
+
+DEFAULT_ARCHIVE_PATH = 'wwr_archive.sqlite3'
+
+LISTING = 'listing'
+FEED = 'feed'
+DETAIL = 'detail'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    codec  TEXT NOT NULL,
+    data   BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    url        TEXT PRIMARY KEY,
+    kind       TEXT NOT NULL,
+    digest     TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_kind ON pages (kind);
+"""
+
+
+def compress(raw):
+    """(codec, data) for raw bytes."""
+    if zstandard is not None:
+        return 'zstd', zstandard.ZstdCompressor(level=10).compress(raw)
+    return 'zlib', zlib.compress(raw, 6)
+
+
+def decompress(codec, data):
+    if codec == 'zstd':
+        if zstandard is None:
+            raise ImportError("This archive was written with zstd: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+class PageArchive:
+    """
+    Content-addressed store of raw pages, safe to share between threads
+    (and between processes, each with its own PageArchive on the same file).
+    """
+
+    def __init__(self, path=DEFAULT_ARCHIVE_PATH):
+        self.path = path
+        self.stored = 0
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def put(self, url, kind, html):
+        """Archive the latest HTML of url; identical pages share one blob."""
+        raw = html.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._lock:
+            known = self.conn.execute('SELECT 1 FROM blobs WHERE digest = ?', (digest,)).fetchone()
+            with self.conn:
+                if known:
+                    self.deduplicated += 1
+                else:
+                    codec, data = compress(raw)
+                    self.conn.execute('INSERT OR IGNORE INTO blobs (digest, codec, data) VALUES (?, ?, ?)',
+                                      (digest, codec, data))
+                    self.stored += 1
+                # Upsert keeps the rowid, so a page keeps its first-archived position
+                self.conn.execute(
+                    """
+                    INSERT INTO pages (url, kind, digest, fetched_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (url) DO UPDATE SET kind = excluded.kind, digest = excluded.digest,
+                                                    fetched_at = excluded.fetched_at
+                    """,
+                    (url, kind, digest, time.time())
+                )
+
+    def get(self, url):
+        """Archived HTML of url, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                'SELECT codec, data FROM pages JOIN blobs USING (digest) WHERE url = ?', (url,)).fetchone()
+        return decompress(*row).decode('utf-8') if row else None
+
+    def pages(self, *kinds):
+        """Generator over (url, kind, html) of the given kinds, in first-archived order."""
+        with self._lock:
+            rows = self.conn.execute(
+                f'SELECT url, kind, codec, data FROM pages JOIN blobs USING (digest) '
+                f'WHERE kind IN ({", ".join("?" * len(kinds))}) ORDER BY pages.rowid',
+                kinds).fetchall()
+        for url, kind, codec, data in rows:
+            yield url, kind, decompress(codec, data).decode('utf-8')
+
+    def count(self, *kinds):
+        return self.conn.execute(f'SELECT COUNT(*) FROM pages WHERE kind IN ({", ".join("?" * len(kinds))})',
+                                 kinds).fetchone()[0]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,153 @@
+"""
+Persistent SQLite job cache for incremental re-scrapes
+- One row per Job URL: full job_data record, content hash, fetch timestamps
+- Detail pages younger than the TTL are served from the cache, with the
+  relative Date Posted moved on by the time since they were fetched
+- Rows not seen on the site for a while are evicted, and the file is
+  vacuumed once enough space is free
+"""
+import hashlib
+import json
+import sqlite3
+import time
+from datetime import datetime
+
+from wwr_dates import RELATIVE_DATE_PATTERN, parse_posted
+from wwr_extract import LOCKED_DEFAULTS
+
+DEFAULT_CACHE_PATH = 'wwr_cache.sqlite3'
+DEFAULT_TTL_HOURS = 24
+DEFAULT_MAX_AGE_DAYS = 30
+
+# Fields that come from the detail page (same set locked listings default)
+DETAIL_COLUMNS = list(LOCKED_DEFAULTS)
+
+# VACUUM once this share of the file is free pages
+COMPACT_FREE_RATIO = 0.25
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    url          TEXT PRIMARY KEY,
+    record       TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    first_seen   REAL NOT NULL,
+    fetched_at   REAL NOT NULL,
+    changed_at   REAL NOT NULL,
+    last_seen    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+"""
+
+
+def content_hash(job_data):
+    """Stable hash of a job record."""
+    payload = json.dumps(job_data, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _ago(count, unit):
+    return f"Posted {count} {unit}{'' if count == 1 else 's'} ago"
+
+
+def refresh_posted(text, fetched_at, now):
+    """
+    Date Posted of a cached record as the site would show it at `now`.
+    "Posted 1 hour ago" was true at fetched_at, so the posted time is
+    resolved against fetched_at and written out again relative to now.
+    Absolute dates and anything unparseable are returned unchanged.
+    """
+    if not text or not RELATIVE_DATE_PATTERN.search(text):
+        return text
+    posted = parse_posted(text, datetime.fromtimestamp(fetched_at))
+    minutes = max(0, int((datetime.fromtimestamp(now) - posted).total_seconds() // 60))
+    if minutes < 60:
+        return _ago(minutes, 'minute')
+    if minutes < 24 * 60:
+        return _ago(minutes // 60, 'hour')
+    return _ago(minutes // (24 * 60), 'day')
+
+
+class JobCache:
+    """
+    SQLite store keyed by Job URL.
+    full_refresh=True still records every fetch but never serves from the cache.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl_hours=DEFAULT_TTL_HOURS, full_refresh=False):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.full_refresh = full_refresh
+        self.hits = 0
+        self.misses = 0
+        # Crawl worker processes share this file: wait on busy writers, let readers through
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+
+    def fill(self, job_data):
+        """
+        Fill detail fields from a fresh cached record.
+        Card fields already in job_data are kept - they come from the live page.
+        Date Posted is aged by the time since the record was fetched.
+        Returns True on a cache hit.
+        """
+        now = time.time()
+        row = None
+        if not self.full_refresh:
+            row = self.conn.execute(
+                'SELECT record, fetched_at FROM jobs WHERE url = ? AND fetched_at >= ?',
+                (job_data['Job URL'], now - self.ttl)
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return False
+
+        cached = json.loads(row[0])
+        for field in DETAIL_COLUMNS:
+            job_data[field] = cached.get(field, 'N/A')
+        job_data['Date Posted'] = refresh_posted(job_data['Date Posted'], row[1], now)
+
+        with self.conn:
+            self.conn.execute('UPDATE jobs SET last_seen = ? WHERE url = ?', (now, job_data['Job URL']))
+        self.hits += 1
+        return True
+
+    def put(self, job_data):
+        """Store a freshly fetched record."""
+        now = time.time()
+        digest = content_hash(job_data)
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO jobs (url, record, content_hash, first_seen, fetched_at, changed_at, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    record = excluded.record,
+                    changed_at = CASE WHEN jobs.content_hash = excluded.content_hash
+                                      THEN jobs.changed_at ELSE excluded.changed_at END,
+                    content_hash = excluded.content_hash,
+                    fetched_at = excluded.fetched_at,
+                    last_seen = excluded.last_seen
+                """,
+                (job_data['Job URL'], json.dumps(job_data, ensure_ascii=False), digest, now, now, now, now)
+            )
+
+    def evict(self, max_age_days=DEFAULT_MAX_AGE_DAYS):
+        """
+        Drop jobs not seen on the site for max_age_days, then VACUUM if
+        enough of the file is free. Returns the number of evicted rows.
+        """
+        cutoff = time.time() - max_age_days * 86400
+        with self.conn:
+            evicted = self.conn.execute('DELETE FROM jobs WHERE last_seen < ?', (cutoff,)).rowcount
+
+        page_count = self.conn.execute('PRAGMA page_count').fetchone()[0]
+        free_pages = self.conn.execute('PRAGMA freelist_count').fetchone()[0]
+        if page_count and free_pages / page_count >= COMPACT_FREE_RATIO:
+            self.conn.execute('VACUUM')
+
+        return evicted
+
+    def close(self):
+        self.conn.close()
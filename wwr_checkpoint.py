@@ -0,0 +1,132 @@
+"""
+Streaming JSONL checkpoint for crash-resume
+- Every finished job_data is appended (and flushed) as soon as it's ready
+- Out-of-order results from concurrent engines are held back until the
+  jobs before them are done, so the file stays in website order
+- resume=True keeps the file and skips URLs already in it; on close the
+  file is put back in this run's card order, so jobs that only finished
+  on resume don't trail behind the ones before them
+- Exporters read records back lazily, one line at a time
+- An optional SearchIndex is updated with every record as it's written
+"""
+import json
+import os
+
+DEFAULT_CHECKPOINT_PATH = 'WeWorkRemotely_Jobs_checkpoint.jsonl'
+# Re-parsing starts its own file, so it never truncates a live scrape's --resume progress
+DEFAULT_REPARSE_CHECKPOINT_PATH = 'WeWorkRemotely_Jobs_reparse_checkpoint.jsonl'
+
+
+class Checkpoint:
+
+    def __init__(self, path=DEFAULT_CHECKPOINT_PATH, resume=False, search=None):
+        self.path = path
+        self.search = search
+        self.done_urls = set()
+        self.count = 0
+        self._pending = {}
+        self._next_index = 1
+        self._resumed = False
+        self._positions = {}  # Job URL -> card index this run, to reorder a resumed file
+
+        if resume and os.path.exists(path):
+            for job_data in self.records():
+                self.done_urls.add(job_data['Job URL'])
+                self.count += 1
+            self._resumed = self.count > 0
+
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        if resume and self._file.tell() > 0:
+            # Make sure a torn last line can't swallow the next record
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._file.write('\n')
+
+    def has(self, url):
+        """True if the job was checkpointed by an earlier (resumed) run."""
+        return url in self.done_urls
+
+    def submit(self, index, job_data):
+        """
+        Hand over the result for card `index` (1-based); None means the card
+        produced no record. Records are written as soon as every earlier card
+        has been submitted.
+        """
+        self._pending[index] = job_data
+        while self._next_index in self._pending:
+            self._write(self._next_index, self._pending.pop(self._next_index))
+            self._next_index += 1
+
+    def keep(self, index, url):
+        """Card `index` was checkpointed by the resumed run: nothing is written, but it sorts there on close."""
+        if self._resumed:
+            self._positions[url] = index
+        self.submit(index, None)
+
+    def flush_pending(self):
+        """Write anything still held back (cards that never reported in)."""
+        for index in sorted(self._pending):
+            self._write(index, self._pending.pop(index))
+
+    def _write(self, index, job_data):
+        if job_data is None:
+            return
+        if self._resumed:
+            self._positions[job_data['Job URL']] = index
+        self._file.write(json.dumps(job_data, ensure_ascii=False) + '\n')
+        self._file.flush()
+        self.done_urls.add(job_data['Job URL'])
+        self.count += 1
+        if self.search:
+            self.search.add(job_data)
+
+    def close(self):
+        if not self._file.closed:
+            self.flush_pending()
+            self._file.close()
+            if self._resumed:
+                self._reorder()
+
+    def _reorder(self):
+        """
+        Rewrite a resumed file in card order. Only (position, offset) pairs are
+        held in memory; jobs no longer listed keep their order at the end and
+        a torn line from the crash is dropped.
+        """
+        lines = []
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                try:
+                    url = json.loads(line)['Job URL']
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    url = None
+                if url is not None:
+                    lines.append((self._positions.get(url, float('inf')), offset))
+                offset += len(line)
+
+        order = sorted(lines)
+        if order == lines:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(self.path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            for _, offset in order:
+                src.seek(offset)
+                dst.write(src.readline())
+        os.replace(tmp_path, self.path)
+
+    def records(self):
+        """Generator over every checkpointed record, in file order."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash mid-write
+                    continue
@@ -0,0 +1,163 @@
+"""
+Company registry keyed by Company Profile URL (Company Name when a job has
+no profile link, e.g. feed-discovered jobs)
+- Company Description and Company Total Jobs Posted are stored once per
+  company (own table in the job cache file) and refreshed after a TTL
+- Filled lazily: the first job of a company extracts them from its detail
+  page; while they're fresh, later jobs skip those fields in extraction and
+  are filled from the registry instead - locked listings included
+- CompanyTable + job_columns() split exports into a normalized jobs file
+  and a companies file
+"""
+import json
+import sqlite3
+import threading
+import time
+
+from wwr_extract import COLUMN_ORDER, DETAIL_FIELDS, JOB_DETAIL_FIELDS
+
+DEFAULT_COMPANY_TTL_HOURS = 24 * 7
+
+COMPANY_KEY = 'Company Profile URL'
+
+# Feed-discovered jobs carry no profile link; their company is keyed by name instead
+FALLBACK_COMPANY_KEY = 'Company Name'
+
+# Columns of the companies file in a normalized export
+COMPANY_COLUMNS = [
+    'Company Profile URL',
+    'Company Name',
+    'Company Headquarters',
+    'Company Logo URL',
+    'Company Description',
+    'Company Total Jobs Posted',
+]
+
+# Company fields that come from the detail page - the ones worth registering
+REGISTRY_FIELDS = ['Company Description', 'Company Total Jobs Posted']
+
+# Kept on every job row of a normalized export so it still reads on its own
+JOB_COMPANY_COLUMNS = ['Company Name', 'Company Profile URL']
+
+EXPORT_LAYOUTS = ['denormalized', 'normalized']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    url        TEXT PRIMARY KEY,
+    record     TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+def job_columns(columns=COLUMN_ORDER):
+    """Job columns of a normalized export: company details move to the companies file."""
+    return [column for column in columns if column not in COMPANY_COLUMNS or column in JOB_COMPANY_COLUMNS]
+
+
+def company_key(job_data):
+    """The job's company key: its Company Profile URL, else its Company Name, else None."""
+    for field in (COMPANY_KEY, FALLBACK_COMPANY_KEY):
+        if job_data.get(field) not in (None, 'N/A', ''):
+            return job_data[field]
+    return None
+
+
+class CompanyRegistry:
+    """
+    SQLite registry of company details keyed by company_key().
+    Safe to share between threads; lookups are memoized for the run.
+    """
+
+    def __init__(self, path, ttl_hours=DEFAULT_COMPANY_TTL_HOURS):
+        self.path = path
+        self.ttl = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self._known = {}  # url -> (fetched_at, record), loaded lazily
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+
+    def _lookup(self, url):
+        if url not in self._known:
+            row = self.conn.execute('SELECT fetched_at, record FROM companies WHERE url = ?', (url,)).fetchone()
+            self._known[url] = (row[0], json.loads(row[1])) if row else None
+        return self._known[url]
+
+    def _fresh(self, url):
+        known = self._lookup(url)
+        return known if known and known[0] >= time.time() - self.ttl else None
+
+    def fill(self, job_data):
+        """Copy fresh company details into job_data. Returns True on a hit."""
+        key = company_key(job_data)
+        if key is None:
+            return False
+
+        with self._lock:
+            known = self._fresh(key)
+            if known is None:
+                self.misses += 1
+                return False
+            self.hits += 1
+
+        for field in REGISTRY_FIELDS:
+            job_data[field] = known[1].get(field, 'N/A')
+        return True
+
+    def put(self, job_data):
+        """Register the company details just extracted for job_data (no-op while still fresh)."""
+        url = company_key(job_data)
+        if url is None or all(job_data.get(field, 'N/A') == 'N/A' for field in REGISTRY_FIELDS):
+            return
+
+        record = {field: job_data.get(field, 'N/A') for field in REGISTRY_FIELDS}
+        now = time.time()
+        with self._lock:
+            if self._fresh(url):
+                return
+            self._known[url] = (now, record)
+            with self.conn:
+                self.conn.execute(
+                    """
+                    INSERT INTO companies (url, record, fetched_at) VALUES (?, ?, ?)
+                    ON CONFLICT (url) DO UPDATE SET record = excluded.record, fetched_at = excluded.fetched_at
+                    """,
+                    (url, json.dumps(record, ensure_ascii=False), now)
+                )
+
+    def close(self):
+        self.conn.close()
+
+
+def detail_fields(companies, job_data):
+    """
+    Field spec for job_data's detail page: without the company fields when
+    the registry already has them fresh (and has filled them in).
+    """
+    if companies and companies.fill(job_data):
+        return JOB_DETAIL_FIELDS
+    return DETAIL_FIELDS
+
+
+class CompanyTable:
+    """One row per company, gathered from job records as they stream past."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def collect(self, records):
+        """Generator passing records through while recording their companies."""
+        for job_data in records:
+            key = company_key(job_data)
+            if key is not None:
+                row = self.rows.setdefault(key, {})
+                for column in COMPANY_COLUMNS:
+                    # Locked listings only know the card fields; keep the first real value
+                    if row.get(column) in (None, 'N/A'):
+                        row[column] = job_data.get(column, 'N/A')
+            yield job_data
+
+    def records(self):
+        return iter(self.rows.values())
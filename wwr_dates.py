@@ -0,0 +1,57 @@
+"""
+Date parsing shared by the cache and the exports
+- Date Posted ("Posted 3 days ago", "yesterday") is counted back from a
+  given time; absolute dates work too
+- Apply Deadline ("Nov 21th, 2025") becomes a date, whatever the ordinal
+  suffix says
+- No third-party imports, so the cache can use it without pyarrow
+"""
+import re
+from datetime import datetime, timedelta
+
+RELATIVE_DATE_PATTERN = re.compile(
+    r'(?P<n>\d+|an?|one)\s+(?P<unit>minute|min|hour|hr|day|week|month|year)s?\s+ago', re.IGNORECASE)
+
+UNIT_DELTAS = {
+    'minute': timedelta(minutes=1), 'min': timedelta(minutes=1),
+    'hour': timedelta(hours=1), 'hr': timedelta(hours=1),
+    'day': timedelta(days=1), 'week': timedelta(weeks=1),
+    'month': timedelta(days=30), 'year': timedelta(days=365),
+}
+
+DATE_FORMATS = ('%b %d, %Y', '%B %d, %Y', '%Y-%m-%d', '%d %b %Y', '%d %B %Y')
+
+# The site writes day numbers with an ordinal suffix, not always the right one: "Nov 21th, 2025"
+ORDINAL_PATTERN = re.compile(r'\b(\d+)(st|nd|rd|th)\b', re.IGNORECASE)
+
+
+def parse_date(text):
+    """Absolute date like 'Nov 21th, 2025' or 'Dec 31, 2026', or None."""
+    if not text or text == 'N/A':
+        return None
+    text = re.sub(r'^(Posted|Apply by|Deadline:?)\s+(on\s+)?', '', text.strip(), flags=re.IGNORECASE)
+    text = ORDINAL_PATTERN.sub(r'\1', text)
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_posted(text, now):
+    """Date Posted as a datetime: 'Posted 3 days ago' counts back from now; absolute dates work too."""
+    if not text or text == 'N/A':
+        return None
+    lowered = text.lower()
+    if 'today' in lowered or 'just now' in lowered:
+        return now
+    if 'yesterday' in lowered:
+        return now - timedelta(days=1)
+    match = RELATIVE_DATE_PATTERN.search(text)
+    if match:
+        n = match.group('n').lower()
+        count = int(n) if n.isdigit() else 1
+        return now - count * UNIT_DELTAS[match.group('unit').lower()]
+    date = parse_date(text)
+    return datetime(date.year, date.month, date.day) if date else None
@@ -0,0 +1,137 @@
+"""
+Run-to-run change feed
+- The last exported snapshot is kept as one row per Job URL with a content
+  hash of its record (SQLite)
+- Each export streams the new records past it: unknown URLs are added,
+  a different hash means updated (with the changed fields); both are
+  written to the feed as they stream, so memory stays flat
+- Removed means no longer listed on the site: only URLs missing from this
+  run's discovered cards count, so a job whose detail fetch failed keeps
+  its snapshot row instead of churning as removed, then added
+- The feed is JSON Lines, one change per line, so hourly runs that touch a
+  handful of jobs produce a file of a few KB
+- Date Posted ("Posted 1 hour ago") is relative and left out of the hash
+"""
+import json
+import sqlite3
+
+from wwr_cache import content_hash
+
+DEFAULT_SNAPSHOT_PATH = 'wwr_snapshot.sqlite3'
+
+# Fields that change on every run without the job changing
+VOLATILE_FIELDS = ('Date Posted',)
+
+# Kept on removed entries so the feed reads without a lookup
+REMOVED_FIELDS = ('Job Title', 'Company Name')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshot (
+    url          TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    record       TEXT NOT NULL
+);
+"""
+
+
+def record_hash(job_data):
+    """Content hash of a record, ignoring VOLATILE_FIELDS."""
+    return content_hash({key: value for key, value in job_data.items() if key not in VOLATILE_FIELDS})
+
+
+def changed_fields(old, new):
+    """{field: {'old': ..., 'new': ...}} for every non-volatile field that differs."""
+    return {
+        field: {'old': old.get(field), 'new': new.get(field)}
+        for field in sorted(set(old) | set(new))
+        if field not in VOLATILE_FIELDS and old.get(field) != new.get(field)
+    }
+
+
+class ChangeFeed:
+    """
+    Diffs one export against the previous snapshot and rolls the snapshot forward.
+    discover() takes the Job URLs seen on the site this run; collect() is a
+    pass-through generator, so it rides along an export pass.
+    """
+
+    def __init__(self, path=DEFAULT_SNAPSHOT_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.executescript(SCHEMA)
+        self.baseline = self.conn.execute('SELECT COUNT(*) FROM snapshot').fetchone()[0] == 0
+        self.discovered = set()
+        self.added = 0
+        self.updated = 0
+        self.removed = 0
+        self.unchanged = 0
+        self._seen = set()
+        self._feed = None
+
+    def discover(self, urls):
+        """Record Job URLs listed on the site this run, exported or not."""
+        self.discovered.update(urls)
+
+    def collect(self, records, feed_filename):
+        """Generator passing records through while writing their changes to feed_filename (JSON Lines)."""
+        self._feed = open(feed_filename, 'w', encoding='utf-8')
+        for job_data in records:
+            self._compare(job_data)
+            yield job_data
+
+    def _write(self, change):
+        self._feed.write(json.dumps(change, ensure_ascii=False) + '\n')
+
+    def _compare(self, job_data):
+        url = job_data['Job URL']
+        if url in self._seen:
+            return
+        self._seen.add(url)
+
+        digest = record_hash(job_data)
+        row = self.conn.execute('SELECT content_hash, record FROM snapshot WHERE url = ?', (url,)).fetchone()
+        if row and row[0] == digest:
+            self.unchanged += 1
+            return
+
+        if row is None:
+            self._write({'change': 'added', 'Job URL': url, 'hash': digest, 'record': job_data})
+            self.added += 1
+        else:
+            self._write({'change': 'updated', 'Job URL': url, 'hash': digest,
+                         'fields': changed_fields(json.loads(row[1]), job_data)})
+            self.updated += 1
+        # Held in the open transaction until commit(); each URL is compared once, so reads stay correct
+        self.conn.execute(
+            """
+            INSERT INTO snapshot (url, content_hash, record) VALUES (?, ?, ?)
+            ON CONFLICT (url) DO UPDATE SET content_hash = excluded.content_hash, record = excluded.record
+            """,
+            (url, digest, json.dumps(job_data, ensure_ascii=False))
+        )
+
+    def commit(self):
+        """Append the removed jobs, close the feed and make this export the new snapshot. Returns the counts."""
+        removed = []
+        # Nothing discovered (the listing never loaded) says nothing about what left the site
+        if self.discovered:
+            for url, record in self.conn.execute('SELECT url, record FROM snapshot').fetchall():
+                if url not in self.discovered:
+                    record = json.loads(record)
+                    self._write({'change': 'removed', 'Job URL': url,
+                                 **{field: record.get(field) for field in REMOVED_FIELDS}})
+                    removed.append((url,))
+        self.removed = len(removed)
+        self._feed.close()
+
+        with self.conn:
+            self.conn.executemany('DELETE FROM snapshot WHERE url = ?', removed)
+        return self.counts()
+
+    def counts(self):
+        return {'added': self.added, 'updated': self.updated, 'removed': self.removed, 'unchanged': self.unchanged}
+
+    def close(self):
+        if self._feed and not self._feed.closed:
+            self._feed.close()
+        self.conn.close()
@@ -0,0 +1,117 @@
+"""
+Single-pass professional Excel writer
+- openpyxl write-only workbook: rows are streamed straight to disk
+- Every cell gets a pre-registered named style as it is written, so there
+  is no reload-and-restyle pass and no second save
+- Same look as before: dark blue header, light borders, alternating row
+  fill, frozen header, auto-filter and fixed column widths
+"""
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+from wwr_extract import COLUMN_ORDER
+
+SHEET_NAME = 'Remote Jobs'
+
+# Adjust column widths professionally
+COLUMN_WIDTHS = {
+    'Job Title': 35,
+    'Company Name': 25,
+    'Company Headquarters': 20,
+    'Date Posted': 15,
+    'Apply Deadline': 15,
+    'Job Type': 12,
+    'Job Category': 20,
+    'Region': 25,
+    'Salary': 20,
+    'Salary Min': 12,
+    'Salary Max': 12,
+    'Salary Currency': 10,
+    'Salary Period': 10,
+    'Tags': 30,
+    'Company Description': 50,
+    'Job Description': 60,
+    'Job URL': 40,
+    'Application URL': 40,
+    'Company Profile URL': 35,
+    'Company Logo URL': 35,
+    'Company Total Jobs Posted': 15
+}
+
+HEADER_ROW_HEIGHT = 25
+
+
+def _named_styles():
+    """Header, data and alternating-row styles."""
+
+    # Border style
+    thin_border = Border(
+        left=Side(style='thin', color='D3D3D3'),
+        right=Side(style='thin', color='D3D3D3'),
+        top=Side(style='thin', color='D3D3D3'),
+        bottom=Side(style='thin', color='D3D3D3')
+    )
+
+    header = NamedStyle(
+        name='wwr_header',
+        fill=PatternFill(start_color='1F4E78', end_color='1F4E78', fill_type='solid'),  # Professional dark blue
+        font=Font(name='Calibri', size=11, bold=True, color='FFFFFF'),  # White bold text
+        alignment=Alignment(horizontal='center', vertical='center'),
+        border=thin_border,
+    )
+
+    cell_font = Font(name='Calibri', size=10)
+    cell_alignment = Alignment(horizontal='left', vertical='top', wrap_text=True)
+
+    cell = NamedStyle(name='wwr_cell', font=cell_font, alignment=cell_alignment, border=thin_border)
+
+    # Alternate row coloring for better readability
+    cell_alt = NamedStyle(
+        name='wwr_cell_alt',
+        fill=PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid'),
+        font=cell_font,
+        alignment=cell_alignment,
+        border=thin_border,
+    )
+
+    return header, cell, cell_alt
+
+
+def write_excel(records, excel_filename, columns=COLUMN_ORDER, column_widths=COLUMN_WIDTHS, sheet_name=SHEET_NAME):
+    """Stream records into a formatted workbook. Returns the number of data rows."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name)
+
+    header_style, cell_style, alt_style = _named_styles()
+    for style in (header_style, cell_style, alt_style):
+        wb.add_named_style(style)
+
+    # Sheet layout has to be set before rows are streamed
+    for idx, column in enumerate(columns, 1):
+        ws.column_dimensions[get_column_letter(idx)].width = column_widths.get(column, 15)
+    ws.row_dimensions[1].height = HEADER_ROW_HEIGHT
+
+    # Freeze header row
+    ws.freeze_panes = 'A2'
+
+    def styled(value, style):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+
+    ws.append([styled(column, header_style.name) for column in columns])
+
+    rows = 0
+    for job_data in records:
+        rows += 1
+        # Every other row starting from row 3
+        style = alt_style.name if rows % 2 == 0 else cell_style.name
+        ws.append([styled(job_data.get(column), style) for column in columns])
+
+    # Add auto-filter
+    ws.auto_filter.ref = f"A1:{get_column_letter(len(columns))}{rows + 1}"
+
+    wb.save(excel_filename)
+    return rows
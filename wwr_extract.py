@@ -0,0 +1,348 @@
+"""
+Extraction rules shared by every WeWorkRemotely engine
+- Site constants, selectors and default values
+- Declarative field specs, run in one page.evaluate() per page in the browser
+  or against parsed HTML by the static parser
+- Payload -> job_data post-processing shared by both
+"""
+import re
+from urllib.parse import urljoin
+
+from wwr_salary import job_salary_text
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional - only the browserless engine needs it
+    LexborHTMLParser = None
+
+
+BASE_URL = 'https://weworkremotely.com'
+
+# Detail page is considered rendered once this is present
+DETAIL_READY_SELECTOR = '.lis-container__header__hero__company-info'
+
+# Default values for locked listings (require login)
+LOCKED_DEFAULTS = {
+    'Date Posted': 'N/A',
+    'Apply Deadline': 'N/A',
+    'Job Type': 'N/A',
+    'Job Category': 'N/A',
+    'Region': 'N/A',
+    'Salary': 'N/A',
+    'Company Description': 'N/A',
+    'Job Description': 'N/A',
+    'Application URL': 'N/A',
+    'Company Total Jobs Posted': 'N/A',
+}
+
+# Professional column order for every export
+COLUMN_ORDER = [
+    'Job Title',
+    'Company Name',
+    'Company Headquarters',
+    'Date Posted',
+    'Apply Deadline',
+    'Job Type',
+    'Job Category',
+    'Region',
+    'Salary',
+    'Salary Min',
+    'Salary Max',
+    'Salary Currency',
+    'Salary Period',
+    'Tags',
+    'Company Description',
+    'Job Description',
+    'Job URL',
+    'Application URL',
+    'Company Profile URL',
+    'Company Logo URL',
+    'Company Total Jobs Posted'
+]
+
+EXTERNAL_APPLY_SELECTOR = (
+    '.lis-container__job__content__description a[href*="apply"], '
+    '.lis-container__job__content__description a[href*="jobs"], '
+    '.lis-container__job__content__description a[href*="careers"]'
+)
+
+# Sidebar label -> (field, value selector inside the sidebar item)
+SIDEBAR_FIELDS = [
+    ('Apply before', 'Apply Deadline', 'span'),
+    ('Job type', 'Job Type', '.box--jobType'),
+    ('Category', 'Job Category', '.box--blue'),
+    ('Region', 'Region', '.box--region'),
+]
+
+# ============================================================
+# Declarative field specs
+# ============================================================
+# field -> [selector, kind] where kind is:
+#   'text'      innerText of the first match (None if missing)
+#   'attr:name' attribute of the first match (None if missing)
+#   'exists'    True if the selector matches anything
+#   'texts'     innerText of every match
+#   'items'     one sub-payload per match, using a nested spec
+# An empty selector means the scope element itself.
+
+CARD_ROOT_SELECTOR = 'li.feature'
+
+CARD_FIELDS = {
+    'href': ['a[href^="/remote-jobs/"]', 'attr:href'],
+    'link_class': ['a[href^="/remote-jobs/"]', 'attr:class'],
+    'Job Title': ['.new-listing__header__title', 'text'],
+    'Company Name': ['.new-listing__company-name', 'text'],
+    'Company Headquarters': ['.new-listing__company-headquarters', 'text'],
+    'logo_style': ['.tooltip--flag-logo__flag-logo', 'attr:style'],
+    'company_href': ['a[href^="/company/"]', 'attr:href'],
+    'categories': ['.new-listing__categories__category', 'texts'],
+}
+
+# Category listing pages linked from the homepage (crawl mode)
+CATEGORY_LINK_SELECTOR = 'a[href^="/categories/"]'
+
+CATEGORY_LINK_FIELDS = {
+    'href': ['', 'attr:href'],
+}
+
+DETAIL_FIELDS = {
+    'Date Posted': ['.lis-container__header__hero__company-info__icons__item span', 'text'],
+    'Company Description': ['.lis-container__header__hero__company-info__description', 'text'],
+    'Job Description': ['.lis-container__job__content__description', 'text'],
+    'apply_btn': ['a.apply-btn:not(.apply-btn--locked)', 'exists'],
+    'apply_href': ['a.apply-btn:not(.apply-btn--locked)', 'attr:href'],
+    'external_apply_href': [EXTERNAL_APPLY_SELECTOR, 'attr:href'],
+    'sidebar': ['.lis-container__job__sidebar__job-about__list__item', 'items', dict(
+        [['text', ['', 'text']]] + [[selector, [selector, 'text']] for _, _, selector in SIDEBAR_FIELDS]
+    )],
+    'jobs_posted': ['.lis-container__job__sidebar__companyDetails__info__jobs-posted', 'text'],
+}
+
+# Detail fields that describe the company rather than the job (see wwr_companies.py)
+COMPANY_DETAIL_FIELDS = ('Company Description', 'jobs_posted')
+
+# Detail spec for jobs whose company details are already known
+JOB_DETAIL_FIELDS = {field: rule for field, rule in DETAIL_FIELDS.items() if field not in COMPANY_DETAIL_FIELDS}
+
+# Runs a field spec inside the page; one IPC round-trip returns every scope
+EXTRACT_JS = """
+({root, fields}) => {
+    const pick = (scope, [selector, kind, sub]) => {
+        if (kind === 'texts') {
+            return Array.from(scope.querySelectorAll(selector), el => el.innerText.trim());
+        }
+        if (kind === 'items') {
+            return Array.from(scope.querySelectorAll(selector), el => extract(el, sub));
+        }
+        const el = selector ? scope.querySelector(selector) : scope;
+        if (!el) return kind === 'exists' ? false : null;
+        if (kind === 'exists') return true;
+        if (kind === 'text') return el.innerText.trim();
+        return el.getAttribute(kind.slice(5));
+    };
+    const extract = (scope, spec) =>
+        Object.fromEntries(Object.entries(spec).map(([field, rule]) => [field, pick(scope, rule)]));
+    const scopes = root ? Array.from(document.querySelectorAll(root)) : [document];
+    return scopes.map(scope => extract(scope, fields));
+}
+"""
+
+# Elements that start a new line in the browser's innerText
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+    'figcaption', 'figure', 'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table',
+    'tr', 'ul',
+}
+
+
+def logo_from_style(style):
+    """Pull the logo URL out of an inline background-image style."""
+    if style and 'url(' in style:
+        return style.split('url(')[1].split(')')[0]
+    return 'N/A'
+
+
+def jobs_posted_count(jobs_posted_text):
+    """Extract number from "Jobs posted: 174"."""
+    match = re.search(r'\d+', jobs_posted_text)
+    return match.group(0) if match else 'N/A'
+
+
+def category_urls(payloads, base_url=BASE_URL):
+    """Unique category listing URLs, in the order the homepage links them."""
+    urls = []
+    for raw in payloads:
+        href = (raw.get('href') or '').split('#')[0].split('?')[0].rstrip('/')
+        if not href.startswith('/categories/') or href.endswith('.rss'):
+            continue
+        url = urljoin(base_url, href)
+        if url not in urls:
+            urls.append(url)
+    return urls
+
+
+# ============================================================
+# Static (browserless) detail page parser
+# ============================================================
+
+def node_text(node):
+    """Approximate the browser's innerText for a parsed node."""
+    if node is None:
+        return 'N/A'
+
+    # \x00 marks a line break, \x01 a paragraph break (blank line)
+    parts = []
+
+    def walk(parent):
+        for child in parent.iter(include_text=True):
+            if child.tag == '-text':
+                parts.append((child.text_content or '').replace('\n', ' '))
+            elif child.tag in BLOCK_TAGS:
+                marker = '\x01' if child.tag == 'p' else '\x00'
+                parts.append(marker)
+                walk(child)
+                parts.append(marker)
+            else:
+                walk(child)
+
+    walk(node)
+    text = re.sub(r'[\x00\x01][\x00\x01\s]*', lambda m: '\n\n' if '\x01' in m.group(0) else '\n', ''.join(parts))
+    return '\n'.join(' '.join(line.split()) for line in text.split('\n')).strip()
+
+
+def extract_static(scope, fields):
+    """Run a field spec against a parsed selectolax node, mirroring EXTRACT_JS."""
+    payload = {}
+    for field, (selector, kind, *sub) in fields.items():
+        if kind == 'texts':
+            payload[field] = [node_text(el) for el in scope.css(selector)]
+        elif kind == 'items':
+            payload[field] = [extract_static(el, sub[0]) for el in scope.css(selector)]
+        else:
+            el = scope.css_first(selector) if selector else scope
+            if kind == 'exists':
+                payload[field] = el is not None
+            elif el is None:
+                payload[field] = None
+            elif kind == 'text':
+                payload[field] = node_text(el)
+            else:
+                payload[field] = el.attributes.get(kind[5:])
+    return payload
+
+
+def require_selectolax():
+    """Raise ImportError unless selectolax is installed; the CLI checks this before scraping starts."""
+    if LexborHTMLParser is None:
+        raise ImportError("Parsing raw pages needs selectolax: pip install selectolax")
+
+
+def parse_detail_html(html, job_data, base_url=BASE_URL, fields=DETAIL_FIELDS):
+    """
+    Fill job_data from raw detail page HTML using the browser engine's field specs.
+    Returns None when the page doesn't look like a rendered job detail page,
+    so callers can fall back to Playwright.
+    """
+    require_selectolax()
+
+    tree = LexborHTMLParser(html)
+    if tree.css_first(DETAIL_READY_SELECTOR) is None:
+        return None
+    tree.strip_tags(['script', 'style', 'noscript', 'template'])
+
+    return detail_from_payload(extract_static(tree.root, fields), job_data, base_url)
+
+
+def parse_cards_html(html, base_url=BASE_URL):
+    """Static twin of extract_cards(): every li.feature card of a listing page, in order."""
+    require_selectolax()
+
+    tree = LexborHTMLParser(html)
+    return [card_from_payload(extract_static(card, CARD_FIELDS), base_url) for card in tree.css(CARD_ROOT_SELECTOR)]
+
+
+# ============================================================
+# Payload -> job_data
+# ============================================================
+
+def _or_na(value):
+    return value if value is not None else 'N/A'
+
+
+def card_from_payload(raw, base_url=BASE_URL):
+    """
+    Turn one CARD_FIELDS payload into listing card fields.
+    Returns (job_data, is_locked), or None when the card has no job link.
+    """
+    if not raw['href']:
+        return None
+
+    job_data = {}
+
+    # Job URL
+    job_data['Job URL'] = urljoin(base_url, raw['href'])
+
+    # Job Title, Company Name, Company Location/Headquarters
+    job_data['Job Title'] = _or_na(raw['Job Title'])
+    job_data['Company Name'] = _or_na(raw['Company Name'])
+    job_data['Company Headquarters'] = _or_na(raw['Company Headquarters'])
+
+    # Company Logo URL
+    job_data['Company Logo URL'] = logo_from_style(raw['logo_style'])
+
+    # Company Profile URL
+    job_data['Company Profile URL'] = urljoin(base_url, raw['company_href']) if raw['company_href'] else 'N/A'
+
+    # Categories/Tags (Featured, Top 100, Full-Time, etc.)
+    job_data['Tags'] = ', '.join(raw['categories']) if raw['categories'] else 'N/A'
+
+    # Check if listing is locked (requires login)
+    is_locked = 'listing-link--locked' in (raw['link_class'] or '')
+
+    return job_data, is_locked
+
+
+def detail_from_payload(raw, job_data, base_url=BASE_URL):
+    """
+    Fill job_data from one DETAIL_FIELDS payload.
+    Company fields left out of the spec (JOB_DETAIL_FIELDS) are left untouched.
+    """
+
+    # Date Posted, Company Description
+    job_data['Date Posted'] = _or_na(raw['Date Posted'])
+    if 'Company Description' in raw:
+        job_data['Company Description'] = _or_na(raw['Company Description'])
+
+    # Job Description (Full Text) + salary from the card tags or, failing that, the description
+    job_data['Job Description'] = _or_na(raw['Job Description'])
+    job_data['Salary'] = job_salary_text(job_data)
+
+    # Application URL (Apply Button)
+    if raw['apply_btn']:
+        apply_href = raw['apply_href']
+        if apply_href and 'register' not in apply_href:
+            job_data['Application URL'] = urljoin(base_url, apply_href)
+        elif raw['external_apply_href'] is not None:
+            # External apply link in description
+            job_data['Application URL'] = raw['external_apply_href']
+        else:
+            job_data['Application URL'] = 'See Job Description'
+    else:
+        job_data['Application URL'] = 'See Job Description'
+
+    # Sidebar Details
+    for _, field, _ in SIDEBAR_FIELDS:
+        job_data[field] = 'N/A'
+
+    for item in raw['sidebar']:
+        for label, field, selector in SIDEBAR_FIELDS:
+            if label in (item['text'] or ''):
+                job_data[field] = _or_na(item[selector])
+                break
+
+    # Company Total Jobs Posted
+    if 'jobs_posted' in raw:
+        job_data['Company Total Jobs Posted'] = jobs_posted_count(raw['jobs_posted']) if raw['jobs_posted'] is not None else 'N/A'
+
+    return job_data
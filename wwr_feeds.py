@@ -0,0 +1,165 @@
+"""
+Feed-based listing discovery (no browser)
+- Reads WeWorkRemotely's RSS feeds (all jobs, or /categories/<slug>.rss)
+  over the pooled HTTP client and parses them as they stream in
+  (XMLPullParser), one <item> at a time
+- Every item becomes a (job_data, is_locked) card tuple like the ones
+  extract_cards() returns, in feed order; a job in several feeds keeps
+  its first position
+- Feed cards are not identical to homepage cards: Tags are the item's
+  type, category and salary band (when its description states one) - no
+  "Featured"; Company Profile URL is N/A, so companies are keyed by name
+  (see wwr_companies.py); and feeds carry no locked flag, so every item
+  counts as unlocked and gets a detail fetch
+- Returns None on any failure so callers fall back to the rendered homepage
+- Raw feeds go to the optional PageArchive, so --engine reparse can replay them
+"""
+import html
+import re
+import time
+from urllib.parse import urljoin
+from xml.etree.ElementTree import XMLPullParser
+
+from wwr_archive import FEED
+from wwr_extract import BASE_URL
+import wwr_http
+from wwr_metrics import Metrics
+from wwr_ratelimit import RateLimiter
+from wwr_salary import salary_text
+
+DEFAULT_FEED_PATH = '/remote-jobs.rss'
+
+MEDIA_CONTENT = '{http://search.yahoo.com/mrss/}content'
+
+# The item description starts with the company's details
+HEADQUARTERS_PATTERN = re.compile(r'<strong>\s*Headquarters:\s*</strong>\s*([^<]+)', re.IGNORECASE)
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+
+def _text(value):
+    value = (value or '').strip()
+    return value or 'N/A'
+
+
+def card_from_item(item, base_url=BASE_URL):
+    """
+    Turn one parsed <item> ({tag: text}) into listing card fields.
+    Returns (job_data, is_locked), or None when the item has no job link.
+    """
+    link = (item.get('link') or item.get('guid') or '').strip()
+    if '/remote-jobs/' not in link:
+        return None
+
+    # "Company: Job Title"
+    company, _, title = (item.get('title') or '').partition(': ')
+    if not title:
+        company, title = '', company
+
+    description = item.get('description') or ''
+    headquarters = HEADQUARTERS_PATTERN.search(description)
+
+    # Same tag order as a card (job type, then salary band) so the card-tag salary rule still applies
+    salary = salary_text(html.unescape(TAG_PATTERN.sub(' ', description)))
+    tags = [tag.strip() for tag in (item.get('type'), item.get('category'), salary)
+            if tag and tag.strip() and tag != 'N/A']
+
+    job_data = {
+        'Job URL': urljoin(base_url, link),
+        'Job Title': _text(title),
+        'Company Name': _text(company),
+        'Company Headquarters': _text(headquarters.group(1) if headquarters else None),
+        'Company Logo URL': _text(item.get('media')),
+        'Company Profile URL': 'N/A',
+        'Tags': ', '.join(tags) if tags else 'N/A',
+    }
+    return job_data, False
+
+
+def parse_feed(chunks, base_url=BASE_URL):
+    """Generator over the card tuples of an RSS feed, fed as an iterable of byte chunks."""
+    parser = XMLPullParser(events=('end',))
+
+    def cards():
+        for _, element in parser.read_events():
+            if element.tag != 'item':
+                continue
+            item = {}
+            for child in element:
+                if child.tag == MEDIA_CONTENT:
+                    item['media'] = child.get('url')
+                else:
+                    item[child.tag.split('}')[-1]] = child.text
+            element.clear()
+            yield card_from_item(item, base_url)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from cards()
+    parser.close()
+    yield from cards()
+
+
+def fetch_feed(client, url, base_url=BASE_URL, retries=3, metrics=None, limiter=None, archive=None):
+    """Stream one feed into card tuples, with the same retry budget as fetch_html()."""
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+    for attempt in range(retries):
+        try:
+            with metrics.stage('rate_limit_wait'):
+                limiter.wait()
+            start = time.perf_counter()
+            with metrics.stage('feed.get'), client.stream('GET', url) as response:
+                limiter.response(response.status_code, response.headers, time.perf_counter() - start)
+                response.raise_for_status()
+                raw = []
+
+                def chunks():
+                    for chunk in response.iter_bytes():
+                        if archive:
+                            raw.append(chunk)
+                        yield chunk
+
+                cards = list(parse_feed(chunks(), base_url))
+            if archive:
+                archive.put(url, FEED, b''.join(raw).decode('utf-8'))
+            return cards
+        except Exception as e:
+            metrics.failure(e, retrying=attempt < retries - 1)
+            limiter.failure(e)
+            if attempt == retries - 1:
+                raise
+            with metrics.stage('retry_backoff'):
+                time.sleep(limiter.backoff(attempt, e))
+
+
+def discover_cards(feed_urls, user_agent, base_url=BASE_URL, metrics=None, limiter=None, archive=None):
+    """
+    Card tuples from every feed, deduplicated by Job URL in feed order.
+    Returns None when a feed fails or nothing was found, so the caller can
+    fall back to the rendered homepage.
+    """
+    metrics = metrics or Metrics()
+    cards = []
+    seen = set()
+    try:
+        with wwr_http.make_client(user_agent) as client:
+            for url in feed_urls:
+                feed_cards = fetch_feed(client, urljoin(base_url + '/', url), base_url, metrics=metrics,
+                                        limiter=limiter, archive=archive)
+                print(f"📡 {url}: {len(feed_cards)} items")
+                for card_data in feed_cards:
+                    if card_data is not None:
+                        if card_data[0]['Job URL'] in seen:
+                            metrics.count('duplicates')
+                            continue
+                        seen.add(card_data[0]['Job URL'])
+                    cards.append(card_data)
+    except Exception as e:
+        print(f"⚠️  Feed discovery failed, falling back to the homepage: {e}")
+        return None
+
+    if not cards:
+        print("⚠️  Feeds listed no jobs, falling back to the homepage")
+        return None
+    return cards
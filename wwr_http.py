@@ -0,0 +1,115 @@
+"""
+Browserless HTTP fast path for job detail pages
+- One pooled keep-alive client shared by every fetch
+- Pages are parsed statically with wwr_extract.parse_detail_html()
+- Anything that doesn't parse is handed back for a Playwright fallback
+- Requests are paced by the run's shared wwr_ratelimit.RateLimiter
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from wwr_archive import DETAIL
+from wwr_companies import detail_fields
+from wwr_extract import BASE_URL, parse_detail_html
+from wwr_metrics import Metrics
+from wwr_ratelimit import RateLimiter
+
+try:
+    import httpx
+except ImportError:  # Optional - only the browserless engine needs it
+    httpx = None
+
+
+def require_httpx():
+    """Raise ImportError unless httpx is installed; the CLI checks this before scraping starts."""
+    if httpx is None:
+        raise ImportError("The browserless engine needs httpx: pip install httpx")
+
+
+def make_client(user_agent, max_connections=8, timeout=30.0):
+    """Pooled keep-alive HTTP client for detail pages."""
+    require_httpx()
+
+    return httpx.Client(
+        headers={
+            'User-Agent': user_agent,
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Language': 'en-US,en;q=0.9',
+        },
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        timeout=timeout,
+        follow_redirects=True,
+    )
+
+
+def is_client_error(error):
+    """A 4xx other than 429 (the limiter raises those as Throttled): the page is gone or forbidden."""
+    return httpx is not None and isinstance(error, httpx.HTTPStatusError) and 400 <= error.response.status_code < 500
+
+
+def fetch_html(client, url, retries=3, metrics=None, limiter=None):
+    """GET a page with the same retry budget as the browser engine; a 4xx other than 429 fails at once."""
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+    for attempt in range(retries):
+        try:
+            with metrics.stage('rate_limit_wait'):
+                limiter.wait()
+            with metrics.stage('http.get'):
+                response = client.get(url)
+            limiter.response(response.status_code, response.headers, response.elapsed.total_seconds())
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            final = attempt == retries - 1 or is_client_error(e)
+            metrics.failure(e, retrying=not final)
+            limiter.failure(e)
+            if final:
+                raise
+            with metrics.stage('retry_backoff'):
+                time.sleep(limiter.backoff(attempt, e))
+
+
+def fetch_details(client, jobs, workers=4, limiter=None, base_url=BASE_URL, metrics=None, companies=None,
+                  archive=None):
+    """
+    Fetch and statically parse detail pages for [(index, job_data), ...].
+    Yields (index, job_data, parsed) in input order as results arrive;
+    parsed is False when the page needs the browser fallback, and None when
+    the server answered 4xx (e.g. a removed job), which the browser can't fix.
+    Company fields come from / go to the optional CompanyRegistry.
+    Raw pages go to the optional PageArchive.
+    """
+    metrics = metrics or Metrics()
+    limiter = limiter or RateLimiter()
+
+    def fetch_one(job):
+        index, job_data = job
+        start = time.perf_counter()
+        try:
+            html = fetch_html(client, job_data['Job URL'], metrics=metrics, limiter=limiter)
+            if archive:
+                archive.put(job_data['Job URL'], DETAIL, html)
+            fields = detail_fields(companies, job_data)
+            with metrics.stage('extract.detail_static'):
+                parsed = parse_detail_html(html, job_data, base_url=base_url, fields=fields) is not None
+            if parsed:
+                if companies:
+                    companies.put(job_data)
+                metrics.job(index, 'http', time.perf_counter() - start)
+            return index, job_data, parsed
+        except ImportError:
+            # A missing parser is a setup problem, not a page the browser should retry
+            raise
+        except Exception as e:
+            if is_client_error(e):
+                print(f"[{index}] ❌ HTTP {e.response.status_code}, skipped: {job_data['Job URL']}")
+                return index, job_data, None
+            print(f"[{index}] ⚠️  HTTP fetch failed, will use browser: {e}")
+            return index, job_data, False
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for index, job_data, parsed in pool.map(fetch_one, jobs):
+            if parsed:
+                print(f"[{index}] ⚡ {job_data['Job Title']} @ {job_data['Company Name']}")
+            yield index, job_data, parsed
@@ -0,0 +1,139 @@
+"""
+Page-load profiles for the browser engines
+- full: wait for the `load` event with every resource (original behaviour)
+- lite: abort images, media, fonts, CSS and known analytics/CDN hosts via
+  context.route, and only wait for `domcontentloaded` + the usual selectors
+Every profile records load latency and bytes transferred per page, summed
+from the Performance API's transferSize in one page.evaluate() per page.
+"""
+import time
+from urllib.parse import urlparse
+
+# Hosts we never read anything from
+BLOCKED_HOSTS = (
+    'we-work-remotely.imgix.net',
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'fonts.googleapis.com',
+    'fonts.gstatic.com',
+    'facebook.net',
+    'connect.facebook.net',
+    'hotjar.com',
+    'segment.com',
+    'segment.io',
+    'clarity.ms',
+    'carbonads.com',
+    'carbonads.net',
+    'buysellads.com',
+    'intercom.io',
+    'sentry.io',
+)
+
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+LOAD_PROFILES = {
+    'full': {'wait_until': 'load', 'block_types': set(), 'block_hosts': ()},
+    'lite': {'wait_until': 'domcontentloaded', 'block_types': BLOCKED_RESOURCE_TYPES, 'block_hosts': BLOCKED_HOSTS},
+}
+
+DEFAULT_LOAD_PROFILE = 'full'
+
+
+# Bytes on the wire (headers + compressed body) for the document and every
+# subresource it loaded, as [bytes, requests], read in one page.evaluate()
+TRANSFER_JS = """
+() => performance.getEntriesByType('navigation')
+    .concat(performance.getEntriesByType('resource'))
+    .reduce(([bytes, requests], entry) => [bytes + (entry.transferSize || 0), requests + 1], [0, 0])
+"""
+
+
+class LoadProfile:
+    """A named load profile plus the per-page stats collected under it."""
+
+    def __init__(self, name=DEFAULT_LOAD_PROFILE):
+        settings = LOAD_PROFILES[name]
+        self.name = name
+        self.wait_until = settings['wait_until']
+        self.block_types = settings['block_types']
+        self.block_hosts = settings['block_hosts']
+        self.pages = []  # (url, seconds, bytes, requests)
+        self.blocked = 0
+
+    # ============================================================
+    # Request blocking
+    # ============================================================
+
+    def should_block(self, request):
+        if request.resource_type in self.block_types:
+            return True
+        host = urlparse(request.url).hostname or ''
+        return any(host == blocked or host.endswith('.' + blocked) for blocked in self.block_hosts)
+
+    def install(self, context):
+        """Route every request of the context through the profile's block list."""
+        if not self.block_types and not self.block_hosts:
+            return
+
+        def handle(route):
+            if self.should_block(route.request):
+                self.blocked += 1
+                route.abort()
+            else:
+                route.continue_()
+
+        context.route('**/*', handle)
+
+    async def install_async(self, context):
+        """Async twin of install()."""
+        if not self.block_types and not self.block_hosts:
+            return
+
+        async def handle(route):
+            if self.should_block(route.request):
+                self.blocked += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route('**/*', handle)
+
+    # ============================================================
+    # Measurement
+    # ============================================================
+
+    def measure(self, page, url, load):
+        """Run load() and record its latency and bytes transferred for page."""
+        start = time.perf_counter()
+        load()
+        elapsed = time.perf_counter() - start
+
+        transferred, requests = page.evaluate(TRANSFER_JS)
+        self.pages.append((url, elapsed, transferred, requests))
+        return elapsed, transferred
+
+    async def measure_async(self, page, url, load):
+        """Async twin of measure(); load is a coroutine function."""
+        start = time.perf_counter()
+        await load()
+        elapsed = time.perf_counter() - start
+
+        transferred, requests = await page.evaluate(TRANSFER_JS)
+        self.pages.append((url, elapsed, transferred, requests))
+        return elapsed, transferred
+
+    def print_summary(self):
+        if not self.pages:
+            return
+
+        total_bytes = sum(page[2] for page in self.pages)
+        avg_latency = sum(page[1] for page in self.pages) / len(self.pages)
+        avg_bytes = total_bytes / len(self.pages)
+
+        print(f"\n🚦 Load profile '{self.name}' (wait_until={self.wait_until})")
+        print(f"   • Pages loaded: {len(self.pages)}")
+        print(f"   • Avg load latency: {avg_latency:.2f}s")
+        print(f"   • Avg transferred: {avg_bytes / 1024:.0f} KB per page ({total_bytes / 1024 / 1024:.1f} MB total)")
+        print(f"   • Requests blocked: {self.blocked}")
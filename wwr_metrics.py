@@ -0,0 +1,215 @@
+"""
+Per-stage timing instrumentation
+- metrics.stage('detail.goto') times a block (sync or async code alike)
+- Latencies are kept per stage and per job, so runs can be broken down
+  into goto, wait_for_selector, extraction, rate-limit waits, retries, exports
+- Counters for retries, timeouts, locked listings, cache hits, errors...
+- write() saves a JSON summary plus a Prometheus text-format file;
+  write_trace() saves a Chrome trace (chrome://tracing, ui.perfetto.dev)
+"""
+import asyncio
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+DEFAULT_METRICS_PATH = 'wwr_metrics'
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+def is_timeout(error):
+    """Playwright TimeoutError, httpx ReadTimeout/ConnectTimeout, asyncio/socket timeouts..."""
+    return isinstance(error, TimeoutError) or 'Timeout' in type(error).__name__
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(values):
+    """count/sum/mean/p50/p95/max plus cumulative histogram buckets."""
+    values = sorted(values)
+    buckets = {str(bound): sum(1 for v in values if v <= bound) for bound in LATENCY_BUCKETS}
+    buckets['+Inf'] = len(values)
+    return {
+        'count': len(values),
+        'sum': sum(values),
+        'mean': sum(values) / len(values) if values else None,
+        'p50': percentile(values, 50),
+        'p95': percentile(values, 95),
+        'max': values[-1] if values else None,
+        'buckets': buckets,
+    }
+
+
+def _lane():
+    """Trace lane for the caller: the asyncio task if there is one, else the thread."""
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return task.get_name() if task else threading.current_thread().name
+
+
+class Metrics:
+    """Stage latencies, per-job latencies and counters for one run."""
+
+    def __init__(self, trace=False):
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self.stages = defaultdict(list)  # stage -> [seconds]
+        self.jobs = []  # (index, source, seconds)
+        self.counters = Counter()
+        self.events = [] if trace else None  # (name, lane, start, seconds, args)
+
+    # ============================================================
+    # Recording
+    # ============================================================
+
+    @contextmanager
+    def stage(self, name, **args):
+        """Time the enclosed block as one observation of `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, start, time.perf_counter() - start, **args)
+
+    def observe(self, name, start, seconds, **args):
+        with self._lock:
+            self.stages[name].append(seconds)
+            if self.events is not None:
+                self.events.append((name, _lane(), start, seconds, args))
+
+    def job(self, index, source, seconds):
+        """Record the end-to-end latency of one job (source: detail, http, browser, cached, locked, archive)."""
+        with self._lock:
+            self.jobs.append((index, source, seconds))
+
+    def count(self, name, n=1):
+        with self._lock:
+            self.counters[name] += n
+
+    def failure(self, error, retrying=False):
+        """Count a failed attempt: a retry if another one follows, and a timeout if it timed out."""
+        if retrying:
+            self.count('retries')
+        if is_timeout(error):
+            self.count('timeouts')
+
+    def snapshot(self):
+        """Raw samples and counters as plain data, e.g. to send back from a worker process."""
+        with self._lock:
+            return {'stages': dict(self.stages), 'jobs': list(self.jobs), 'counters': dict(self.counters)}
+
+    def merge(self, snapshot):
+        """Fold another collector's snapshot() into this one."""
+        with self._lock:
+            for name, values in snapshot['stages'].items():
+                self.stages[name].extend(values)
+            self.jobs.extend(snapshot['jobs'])
+            self.counters.update(snapshot['counters'])
+
+    # ============================================================
+    # Reporting
+    # ============================================================
+
+    def summary(self):
+        with self._lock:
+            by_source = defaultdict(list)
+            for _, source, seconds in self.jobs:
+                by_source[source].append(seconds)
+            return {
+                'started_at': self.started_at.isoformat(timespec='seconds'),
+                'wall_seconds': time.perf_counter() - self._start,
+                'counters': dict(self.counters),
+                'stages': {name: summarize(values) for name, values in sorted(self.stages.items())},
+                'jobs': {source: summarize(values) for source, values in sorted(by_source.items())},
+                'job_latencies': [{'index': index, 'source': source, 'seconds': seconds}
+                                  for index, source, seconds in sorted(self.jobs)],
+            }
+
+    def prometheus(self, summary=None):
+        """Prometheus text exposition format (e.g. for node_exporter's textfile collector)."""
+        summary = summary or self.summary()
+        lines = [
+            '# HELP wwr_run_seconds Wall-clock duration of the scrape.',
+            '# TYPE wwr_run_seconds gauge',
+            f"wwr_run_seconds {summary['wall_seconds']:.6f}",
+        ]
+
+        for name, value in sorted(summary['counters'].items()):
+            metric = f'wwr_{name}_total'
+            lines += [f'# TYPE {metric} counter', f'{metric} {value}']
+
+        for metric, label, histograms, help_text in (
+                ('wwr_stage_seconds', 'stage', summary['stages'], 'Latency of each scrape stage.'),
+                ('wwr_job_seconds', 'source', summary['jobs'], 'End-to-end latency of each job.')):
+            lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} histogram']
+            for key, stats in histograms.items():
+                for bound, count in stats['buckets'].items():
+                    lines.append(f'{metric}_bucket{{{label}="{key}",le="{bound}"}} {count}')
+                lines.append(f'{metric}_sum{{{label}="{key}"}} {stats["sum"]:.6f}')
+                lines.append(f'{metric}_count{{{label}="{key}"}} {stats["count"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path=DEFAULT_METRICS_PATH):
+        """Write <path>.json and <path>.prom. Returns both filenames."""
+        summary = self.summary()
+        json_path, prom_path = f'{path}.json', f'{path}.prom'
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        with open(prom_path, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus(summary))
+        return json_path, prom_path
+
+    def write_trace(self, trace_path):
+        """Chrome trace-event JSON with one complete ('X') event per timed stage."""
+        with self._lock:
+            events = list(self.events or ())
+
+        lanes = {}
+        trace = []
+        for name, lane, start, seconds, args in events:
+            if lane not in lanes:
+                lanes[lane] = len(lanes) + 1
+                trace.append({'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': lanes[lane],
+                              'args': {'name': lane}})
+            trace.append({
+                'name': name,
+                'cat': name.split('.')[0],
+                'ph': 'X',
+                'ts': (start - self._start) * 1e6,
+                'dur': seconds * 1e6,
+                'pid': 1,
+                'tid': lanes[lane],
+                'args': args,
+            })
+
+        with open(trace_path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f)
+        return trace_path
+
+    def print_summary(self):
+        summary = self.summary()
+        if not summary['stages']:
+            return
+
+        print(f"\n⏱️  Stage timings ({summary['wall_seconds']:.1f}s wall clock)")
+        for name, stats in summary['stages'].items():
+            print(f"   • {name}: {stats['count']}× total {stats['sum']:.2f}s, "
+                  f"p50 {stats['p50']:.3f}s, p95 {stats['p95']:.3f}s")
+        for source, stats in summary['jobs'].items():
+            print(f"   • jobs ({source}): {stats['count']}× p50 {stats['p50']:.3f}s, p95 {stats['p95']:.3f}s")
+        if summary['counters']:
+            print("   • " + ", ".join(f"{name}: {value}" for name, value in sorted(summary['counters'].items())))
@@ -0,0 +1,105 @@
+"""
+Typed columnar export (Parquet)
+- Records are converted straight into typed Arrow columns, batch by batch,
+  as they stream out of the checkpoint - no DataFrame of 'N/A' strings
+- 'N/A' becomes null; counts and salary bounds are nullable int64
+- Date Posted ("Posted 3 days ago") is resolved against the export time,
+  Apply Deadline ("Nov 21th, 2025") becomes a date
+- Job Type, Job Category, Region and Tags are dictionary-encoded
+- zstd-compressed Parquet, so months of history load fast and stay small
+"""
+import re
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional - only the Parquet export needs it
+    pa = None
+    pq = None
+
+from wwr_dates import parse_date, parse_posted
+
+DEFAULT_BATCH_SIZE = 10000
+
+INT_COLUMNS = ['Company Total Jobs Posted', 'Salary Min', 'Salary Max']
+TIMESTAMP_COLUMNS = ['Date Posted']
+DATE_COLUMNS = ['Apply Deadline']
+CATEGORICAL_COLUMNS = ['Job Type', 'Job Category', 'Region', 'Tags']
+
+
+def parse_int(value):
+    if value is None or value == 'N/A' or value == '':
+        return None
+    if isinstance(value, int):
+        return value
+    digits = re.sub(r'[^\d]', '', str(value))
+    return int(digits) if digits else None
+
+
+def column_type(column):
+    if column in INT_COLUMNS:
+        return pa.int64()
+    if column in TIMESTAMP_COLUMNS:
+        return pa.timestamp('s')
+    if column in DATE_COLUMNS:
+        return pa.date32()
+    if column in CATEGORICAL_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    return pa.string()
+
+
+def schema(columns):
+    return pa.schema([pa.field(column, column_type(column)) for column in columns])
+
+
+def typed_value(column, value, now):
+    """One field converted for its column type; 'N/A' and missing values become None."""
+    if column in INT_COLUMNS:
+        return parse_int(value)
+    if column in TIMESTAMP_COLUMNS:
+        return parse_posted(value, now)
+    if column in DATE_COLUMNS:
+        return parse_date(value)
+    if value is None or value == 'N/A':
+        return None
+    return str(value)
+
+
+def _batch(buffers, table_schema):
+    arrays = []
+    for field in table_schema:
+        if pa.types.is_dictionary(field.type):
+            arrays.append(pa.array(buffers[field.name], pa.string()).dictionary_encode())
+        else:
+            arrays.append(pa.array(buffers[field.name], field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=table_schema)
+
+
+def require_pyarrow():
+    """Raise ImportError unless pyarrow is installed; the CLI checks this before scraping starts."""
+    if pa is None:
+        raise ImportError("The Parquet export needs pyarrow: pip install pyarrow")
+
+
+def write_parquet(records, parquet_filename, columns, batch_size=DEFAULT_BATCH_SIZE, now=None):
+    """Stream records into a typed, zstd-compressed Parquet file. Returns the row count."""
+    require_pyarrow()
+
+    now = (now or datetime.now()).replace(microsecond=0)
+    table_schema = schema(columns)
+    buffers = {column: [] for column in columns}
+    rows = 0
+
+    with pq.ParquetWriter(parquet_filename, table_schema, compression='zstd') as writer:
+        for job_data in records:
+            for column in columns:
+                buffers[column].append(typed_value(column, job_data.get(column), now))
+            rows += 1
+            if rows % batch_size == 0:
+                writer.write_batch(_batch(buffers, table_schema))
+                buffers = {column: [] for column in columns}
+        if rows % batch_size or not rows:
+            writer.write_batch(_batch(buffers, table_schema))
+
+    return rows
@@ -0,0 +1,150 @@
+"""
+Adaptive rate limiter shared by every fetch path
+- Token bucket: requests start no faster than `rate` per second (with a
+  small burst), across all threads, workers and asyncio tasks of a run
+- Additive increase: every fast, healthy response raises the rate a little,
+  up to max_rate
+- Multiplicative decrease: timeouts, 429s and 5xx responses cut the rate,
+  down to min_rate, and a Retry-After header pauses every request until it expires
+- backoff() gives jittered exponential delays for retries
+"""
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from wwr_metrics import is_timeout
+
+# Same starting pace as the old fixed 1.5s delay after every job
+DEFAULT_RATE = 1 / 1.5
+DEFAULT_MIN_RATE = 0.1
+DEFAULT_MAX_RATE = 4.0
+
+# Responses slower than this don't earn a speed-up
+SLOW_RESPONSE_SECONDS = 3.0
+
+
+class Throttled(Exception):
+    """The server answered 429/5xx; retry_after is in seconds, if it said."""
+
+    def __init__(self, status, retry_after=None):
+        super().__init__(f"HTTP {status}" + (f", retry after {retry_after:.0f}s" if retry_after else ''))
+        self.status = status
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """Retry-After as seconds: either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def is_throttle_status(status):
+    """429 Too Many Requests or any 5xx."""
+    return status == 429 or status >= 500
+
+
+class RateLimiter:
+    """Token bucket with AIMD rate control; thread- and asyncio-safe."""
+
+    def __init__(self, rate=DEFAULT_RATE, min_rate=DEFAULT_MIN_RATE, max_rate=DEFAULT_MAX_RATE, burst=1,
+                 increase=0.1, decrease=0.5, backoff_base=1.0, backoff_cap=60.0):
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+
+        self.requests = 0
+        self.throttled = 0
+        self.peak_rate = self.rate
+
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+
+    # ============================================================
+    # Pacing
+    # ============================================================
+
+    def _reserve(self):
+        """Take a token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            self.requests += 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._blocked_until - now)
+
+    def wait(self):
+        """Block until the next request may start."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """Async twin of wait()."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    # ============================================================
+    # Feedback
+    # ============================================================
+
+    def response(self, status, headers=None, elapsed=None):
+        """
+        Feed back a response. Fast 2xx/3xx responses speed the limiter up;
+        429/5xx slow it down and raise Throttled so the caller retries.
+        """
+        if is_throttle_status(status):
+            retry_after = parse_retry_after((headers or {}).get('retry-after'))
+            self._slow_down(retry_after)
+            raise Throttled(status, retry_after)
+
+        if status < 400 and (elapsed is None or elapsed <= SLOW_RESPONSE_SECONDS):
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+                self.peak_rate = max(self.peak_rate, self.rate)
+
+    def failure(self, error):
+        """Feed back a failed attempt; timeouts slow the limiter down."""
+        if is_timeout(error):
+            self._slow_down()
+
+    def _slow_down(self, retry_after=None):
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+    def backoff(self, attempt, error=None):
+        """Full-jitter exponential delay before retry number attempt + 1, never shorter than Retry-After."""
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        retry_after = getattr(error, 'retry_after', None)
+        return max(delay, retry_after or 0.0)
+
+    def print_summary(self):
+        if not self.requests:
+            return
+        print(f"\n🚦 Rate limiter: {self.requests} requests, {self.throttled} throttled, "
+              f"now {self.rate:.2f} req/s (peak {self.peak_rate:.2f}, range {self.min_rate}-{self.max_rate})")
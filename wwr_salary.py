@@ -0,0 +1,192 @@
+"""
+Structured salary parsing
+- One precompiled pattern for bands like "$25,000 - $48,999 USD",
+  "$100,000 or more USD", "€60k-€75k per year" or "$45/hour"
+- The salary band in the card Tags wins, the job description is the fallback
+- The raw Salary column is the same match, as written in its source
+- Bare small amounts with no period or range ("Backed by $5 million") are
+  not salaries
+- Emits Salary Min / Salary Max (annualized where the period is known),
+  Salary Currency and Salary Period (the period the source was quoted in)
+- salary_fields() works per record for streaming exports;
+  add_salary_columns() does a whole DataFrame with one regex pass per column
+"""
+import re
+
+SALARY_COLUMNS = ['Salary Min', 'Salary Max', 'Salary Currency', 'Salary Period']
+
+_AMOUNT = r'(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?'
+
+# A "k" only counts as thousands when it ends the word ("$40 Kubernetes" is $40)
+STRUCTURED_SALARY_PATTERN = re.compile(
+    r'(?P<sym>[$€£])\s?(?P<min>' + _AMOUNT + r')(?:\s?(?P<mink>[kK])\b)?'
+    r'(?:\s*(?:-|–|—|to)\s*[$€£]?\s?(?P<max>' + _AMOUNT + r')(?:\s?(?P<maxk>[kK])\b)?)?'
+    r'(?P<more>\s*(?:or more|\+))?'
+    r'(?:\s*(?P<code>USD|EUR|GBP|CAD|AUD)\b)?'
+    r'(?:\s*(?:per|/|an?|each)\s*(?P<period>year|yr|annum|hour|hr|month|mo|week|wk|day)\b'
+    r'|\s*(?P<adverb>annually|yearly|hourly|monthly|weekly|daily)\b)?',
+    re.IGNORECASE)
+
+# Same pattern with the whole match as a group, for str.extractall() in add_salary_columns()
+SALARY_TEXT_PATTERN = re.compile('(?P<text>' + STRUCTURED_SALARY_PATTERN.pattern + ')', re.IGNORECASE)
+
+CURRENCY_SYMBOLS = {'$': 'USD', '€': 'EUR', '£': 'GBP'}
+
+# Normalized period names and how many of them make a working year
+PERIOD_ALIASES = {
+    'year': 'year', 'yr': 'year', 'annum': 'year', 'annually': 'year', 'yearly': 'year',
+    'month': 'month', 'mo': 'month', 'monthly': 'month',
+    'week': 'week', 'wk': 'week', 'weekly': 'week',
+    'day': 'day', 'daily': 'day',
+    'hour': 'hour', 'hr': 'hour', 'hourly': 'hour',
+}
+PERIODS_PER_YEAR = {'year': 1, 'month': 12, 'week': 52, 'day': 260, 'hour': 2080}
+
+# Amounts this large with no stated period are annual
+ANNUAL_THRESHOLD = 10000
+
+
+def _amount(digits, k):
+    value = float(digits.replace(',', ''))
+    return value * 1000 if k else value
+
+
+def _whole(value):
+    if value is None:
+        return None
+    return int(round(value))
+
+
+def _is_salary(match):
+    """A match with a period or a range, or one that is big enough to be a yearly figure."""
+    if match['max'] or match['more'] or match['period'] or match['adverb']:
+        return True
+    return _amount(match['min'], match['mink']) >= ANNUAL_THRESHOLD
+
+
+def find_salary(text):
+    """First match in text that reads as a salary, or None."""
+    if not text or text == 'N/A':
+        return None
+    for match in STRUCTURED_SALARY_PATTERN.finditer(text):
+        if _is_salary(match):
+            return match
+    return None
+
+
+def job_salary(job_data):
+    """The salary match for one record: card Tags first, then the Job Description."""
+    return find_salary(job_data.get('Tags')) or find_salary(job_data.get('Job Description'))
+
+
+def salary_text(text):
+    """The first salary in text as written, or 'N/A'."""
+    match = find_salary(text)
+    return match.group(0).strip() if match else 'N/A'
+
+
+def job_salary_text(job_data):
+    """The raw Salary column for one record, from the same source as salary_fields()."""
+    match = job_salary(job_data)
+    return match.group(0).strip() if match else 'N/A'
+
+
+def parse_salary(text):
+    """
+    Parse the first salary in text.
+    Returns {'Salary Min', 'Salary Max', 'Salary Currency', 'Salary Period'}
+    or None when nothing salary-like is found.
+    """
+    return _parse_match(find_salary(text))
+
+
+def _parse_match(match):
+    """
+    Structured salary from one pattern match - a re.Match or any mapping of
+    its group names, so add_salary_columns() shares every rule below.
+    """
+    if not match:
+        return None
+
+    low = _amount(match['min'], match['mink'])
+    if match['more']:
+        high = None
+    elif match['max']:
+        high = _amount(match['max'], match['maxk'])
+        # "$60-75k": the k belongs to both ends
+        if match['maxk'] and not match['mink'] and low < high / 1000:
+            low *= 1000
+    else:
+        high = low
+
+    period = PERIOD_ALIASES.get((match['period'] or match['adverb'] or '').lower())
+    if period is None and low >= ANNUAL_THRESHOLD:
+        period = 'year'
+
+    if period:
+        low *= PERIODS_PER_YEAR[period]
+        high = high * PERIODS_PER_YEAR[period] if high is not None else None
+
+    currency = (match['code'] or '').upper() or CURRENCY_SYMBOLS[match['sym']]
+
+    return {
+        'Salary Min': _whole(low),
+        'Salary Max': _whole(high),
+        'Salary Currency': currency,
+        'Salary Period': period,
+    }
+
+
+def salary_fields(job_data):
+    """Structured salary for one record: card Tags first, then the Job Description."""
+    return _parse_match(job_salary(job_data)) or dict.fromkeys(SALARY_COLUMNS)
+
+
+def with_salary(records):
+    """Generator setting the raw Salary column and the structured salary columns of each record."""
+    for job_data in records:
+        job_data['Salary'] = job_salary_text(job_data)
+        job_data.update(salary_fields(job_data))
+        yield job_data
+
+
+def add_salary_columns(df):
+    """
+    with_salary() for a whole DataFrame with Tags/Job Description columns:
+    one str.extractall() pass per column finds the matches, and each row's
+    match goes through the same rules as salary_fields().
+    Returns df with the raw Salary column set and the four salary columns added.
+    """
+    import pandas as pd
+
+    columns = list(SALARY_TEXT_PATTERN.groupindex)
+
+    def groups(frame):
+        # NaN -> None, so the group mappings read like re.Match groups
+        return frame.astype(object).where(frame.notna(), None)
+
+    def extract(column):
+        # First match per row that passes _is_salary()
+        if column not in df:
+            return pd.DataFrame(index=df.index, columns=columns, dtype=object)
+        matches = groups(df[column].fillna('').astype(str).str.extractall(SALARY_TEXT_PATTERN))
+        salary = pd.Series([_is_salary(match) for match in matches.to_dict('records')], index=matches.index,
+                           dtype=bool)
+        first = matches[salary].groupby(level=0).head(1).droplevel(-1)
+        return first.reindex(index=df.index, columns=columns)
+
+    # Card tag wins over description text, row by row
+    parts = extract('Tags')
+    from_text = extract('Job Description')
+    parts = groups(parts.where(parts['min'].notna(), from_text, axis=0))
+
+    matches = parts.to_dict('records')
+    fields = [_parse_match(match) if match['min'] else dict.fromkeys(SALARY_COLUMNS) for match in matches]
+
+    df = df.copy()
+    df['Salary'] = [match['text'].strip() if match['text'] else 'N/A' for match in matches]
+    for column in SALARY_COLUMNS:
+        df[column] = [row[column] for row in fields]
+    df['Salary Min'] = df['Salary Min'].astype('Int64')
+    df['Salary Max'] = df['Salary Max'].astype('Int64')
+    return df
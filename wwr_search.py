@@ -0,0 +1,224 @@
+"""
+Local full-text search over scraped jobs (SQLite FTS5)
+- Every record is indexed the moment it is checkpointed, so the index
+  grows run by run; a Job URL seen again replaces its older version
+- Job Title, Job Description and the card tags / Job Type are searchable
+  (porter stemming), ranked with BM25 and title matches weighted higher
+- Filters on Region, Job Type and Job Category (case-insensitive substring)
+- Query syntax is FTS5's: AND / OR / NOT, parentheses, "quoted phrases",
+  prefix* - terms like part-time are quoted automatically (part-tim* stays
+  a prefix) and -term excludes, so python -java means python NOT java
+- --add indexes existing JSON / JSONL exports to backfill history
+
+Usage: python wwr_search.py "python AND (contract OR part-time)" --region USA --job-type Contract
+       python wwr_search.py --add WeWorkRemotely_Jobs_20251028_193043.json
+"""
+import argparse
+import json
+import re
+import sqlite3
+import threading
+import time
+
+DEFAULT_INDEX_PATH = 'wwr_search.sqlite3'
+DEFAULT_LIMIT = 20
+
+# BM25 column weights: (Job Title, Job Description, Tags + Job Type)
+TITLE_WEIGHT = 5.0
+DESCRIPTION_WEIGHT = 1.0
+TAGS_WEIGHT = 2.0
+
+# Memory-map the index for reads; BM25 over broad matches is I/O bound otherwise
+MMAP_BYTES = 1 << 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    id           INTEGER PRIMARY KEY,
+    url          TEXT NOT NULL UNIQUE,
+    title        TEXT,
+    company      TEXT,
+    region       TEXT,
+    job_type     TEXT,
+    job_category TEXT,
+    date_posted  TEXT,
+    indexed_at   REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS postings_fts USING fts5(
+    title, description, tags, tokenize = 'porter unicode61'
+);
+"""
+
+QUERY_TOKEN_PATTERN = re.compile(r'"[^"]*"|\(|\)|[^\s()"]+')
+
+OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+def fts_query(text):
+    """
+    Make a user query safe for FTS5 MATCH: operators, parentheses, phrases
+    and prefix* terms pass through; anything else (part-time, c++, node.js)
+    becomes a quoted phrase, keeping a trailing * outside the quotes.
+    A leading - excludes the term: "python -java" is "python NOT java".
+    Raises ValueError for a -term with nothing before it to exclude from.
+    """
+    terms = []
+    for token in QUERY_TOKEN_PATTERN.findall(text):
+        if token.startswith('-'):
+            if not terms or terms[-1] in ('(', 'OR', 'NOT'):
+                raise ValueError(f"{token} needs a term before it to exclude from, e.g. python {token}")
+            terms.append('NOT')
+            token = token[1:]
+            if not token:
+                continue
+        if token in OPERATORS or token in '()' or token.startswith('"'):
+            terms.append(token)
+        elif re.fullmatch(r'\w+\*?', token):
+            terms.append(token)
+        else:
+            # "full-stack"* matches full-stack, full-stacked...: FTS5 prefixes the phrase's last token
+            phrase = token.rstrip('*').replace('"', '')
+            if phrase:
+                terms.append('"' + phrase + '"' + ('*' if token.endswith('*') else ''))
+    # FTS5's NOT is binary ("a NOT b"), so "a AND NOT b" means the same thing
+    return re.sub(r'\bAND NOT\b', 'NOT', ' '.join(terms))
+
+
+def _na(value):
+    return None if value in (None, 'N/A') else value
+
+
+class SearchIndex:
+    """Incremental FTS5 index of job records; safe to share between threads."""
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.added = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(f'PRAGMA mmap_size={MMAP_BYTES}')
+        self.conn.executescript(SCHEMA)
+
+    def add(self, job_data):
+        """Index one record, replacing any earlier version of the same Job URL."""
+        with self._lock, self.conn:
+            self._add(job_data)
+
+    def _add(self, job_data):
+        row = (
+            job_data['Job URL'],
+            _na(job_data.get('Job Title')),
+            _na(job_data.get('Company Name')),
+            _na(job_data.get('Region')),
+            _na(job_data.get('Job Type')),
+            _na(job_data.get('Job Category')),
+            _na(job_data.get('Date Posted')),
+            time.time(),
+        )
+        rowid = self.conn.execute(
+            """
+            INSERT INTO postings (url, title, company, region, job_type, job_category, date_posted, indexed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (url) DO UPDATE SET
+                title = excluded.title, company = excluded.company, region = excluded.region,
+                job_type = excluded.job_type, job_category = excluded.job_category,
+                date_posted = excluded.date_posted, indexed_at = excluded.indexed_at
+            RETURNING id
+            """,
+            row
+        ).fetchone()[0]
+        self.conn.execute('DELETE FROM postings_fts WHERE rowid = ?', (rowid,))
+        tags = ' '.join(value for value in (_na(job_data.get('Tags')), row[4]) if value)
+        self.conn.execute('INSERT INTO postings_fts (rowid, title, description, tags) VALUES (?, ?, ?, ?)',
+                          (rowid, row[1], _na(job_data.get('Job Description')), tags))
+        self.added += 1
+
+    def add_file(self, path):
+        """Index a JSON array or JSONL export in one transaction. Returns the number of records."""
+        with open(path, encoding='utf-8') as f:
+            if path.endswith('.jsonl'):
+                records = (json.loads(line) for line in f if line.strip())
+            else:
+                records = json.load(f)
+            count = 0
+            with self._lock, self.conn:
+                for job_data in records:
+                    self._add(job_data)
+                    count += 1
+        return count
+
+    def search(self, query, region=None, job_type=None, job_category=None, limit=DEFAULT_LIMIT):
+        """
+        Ranked matches for query, best first. Each hit is a dict with the
+        posting's fields, its score (higher is better) and a description snippet.
+        """
+        sql = f"""
+            SELECT p.url, p.title, p.company, p.region, p.job_type, p.job_category, p.date_posted,
+                   -bm25(postings_fts, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT}, {TAGS_WEIGHT}) AS score,
+                   snippet(postings_fts, 1, '[', ']', '…', 12) AS snippet
+            FROM postings_fts JOIN postings p ON p.id = postings_fts.rowid
+            WHERE postings_fts MATCH ?
+        """
+        params = [fts_query(query)]
+        for column, value in (('region', region), ('job_type', job_type), ('job_category', job_category)):
+            if value:
+                sql += f" AND p.{column} LIKE '%' || ? || '%'"
+                params.append(value)
+        sql += f" ORDER BY bm25(postings_fts, {TITLE_WEIGHT}, {DESCRIPTION_WEIGHT}, {TAGS_WEIGHT}) LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            cursor = self.conn.execute(sql, params)
+            columns = [description[0] for description in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    @property
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM postings').fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search scraped WeWorkRemotely jobs')
+    parser.add_argument('query', nargs='?', help='e.g. "python AND (contract OR part-time)"')
+    parser.add_argument('--index', default=DEFAULT_INDEX_PATH, help='SQLite search index')
+    parser.add_argument('--region', help='Only jobs whose Region contains this')
+    parser.add_argument('--job-type', help='Only jobs whose Job Type contains this')
+    parser.add_argument('--job-category', help='Only jobs whose Job Category contains this')
+    parser.add_argument('--limit', type=int, default=DEFAULT_LIMIT)
+    parser.add_argument('--add', nargs='+', metavar='FILE', help='Index existing .json / .jsonl exports first')
+    args = parser.parse_args()
+
+    index = SearchIndex(args.index)
+    try:
+        for path in args.add or ():
+            print(f"📥 Indexed {index.add_file(path)} jobs from {path}")
+        if not args.query:
+            print(f"🔎 {index.count} jobs in {index.path}")
+            return
+
+        start = time.perf_counter()
+        try:
+            hits = index.search(args.query, region=args.region, job_type=args.job_type,
+                                job_category=args.job_category, limit=args.limit)
+        except (sqlite3.OperationalError, ValueError) as e:
+            print(f"❌ Invalid query {args.query!r} ({e}) - join terms with AND / OR / NOT and close "
+                  f"every ( and \", e.g. \"python NOT java\"")
+            raise SystemExit(2)
+        elapsed = time.perf_counter() - start
+
+        print(f"🔎 {len(hits)} results for {args.query!r} in {elapsed * 1000:.1f} ms ({index.count} jobs indexed)\n")
+        for rank, hit in enumerate(hits, 1):
+            print(f"{rank:>3}. {hit['title']} @ {hit['company']}  ({hit['score']:.3f})")
+            print(f"     {hit['region'] or 'N/A'} • {hit['job_type'] or 'N/A'} • {hit['job_category'] or 'N/A'}")
+            print(f"     {hit['url']}")
+            if hit['snippet']:
+                print(f"     {' '.join(hit['snippet'].split())}")
+    finally:
+        index.close()
+
+
+if __name__ == '__main__':
+    main()
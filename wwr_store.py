@@ -0,0 +1,85 @@
+"""
+Shared, deduplicated job store for multi-process crawls
+- One SQLite row per Job URL, so a job listed under several categories is
+  stored once, whichever worker process finishes it
+- Every row carries the position it was discovered at; records() reads them
+  back in that order, so the merge is deterministic however shards finish
+- Exposes the same count / records() / has() surface as Checkpoint, so
+  export_jobs() can read straight from it
+- An optional SearchIndex is updated with every record put
+"""
+import json
+import sqlite3
+
+DEFAULT_STORE_PATH = 'wwr_crawl.sqlite3'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    url      TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    record   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_position ON jobs (position);
+"""
+
+
+class JobStore:
+    """
+    SQLite store keyed by Job URL, safe to share between processes.
+    resume=False starts from an empty store; resume=True keeps finished jobs.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, resume=False, search=None):
+        self.path = path
+        self.search = search
+        self.conn = sqlite3.connect(path, timeout=60)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        if not resume:
+            with self.conn:
+                self.conn.execute('DELETE FROM jobs')
+
+    def has(self, url):
+        """True if the job is already stored (e.g. by an earlier, resumed crawl)."""
+        return self.conn.execute('SELECT 1 FROM jobs WHERE url = ?', (url,)).fetchone() is not None
+
+    def put(self, position, job_data):
+        """Store a finished record; a duplicate URL keeps its earliest position."""
+        with self.conn:
+            self.conn.execute(
+                """
+                INSERT INTO jobs (url, position, record) VALUES (?, ?, ?)
+                ON CONFLICT (url) DO UPDATE SET
+                    position = MIN(jobs.position, excluded.position),
+                    record = excluded.record
+                """,
+                (job_data['Job URL'], position, json.dumps(job_data, ensure_ascii=False))
+            )
+        if self.search:
+            self.search.add(job_data)
+
+    def submit(self, position, job_data):
+        """Checkpoint.submit() twin, so the same card sorting works on both; None stores nothing."""
+        if job_data is not None:
+            self.put(position, job_data)
+
+    def keep(self, position, url):
+        """Checkpoint.keep() twin: a job stored by the resumed crawl moves to this run's position."""
+        with self.conn:
+            self.conn.execute('UPDATE jobs SET position = ? WHERE url = ?', (position, url))
+
+    @property
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM jobs').fetchone()[0]
+
+    def records(self):
+        """Generator over every stored record in discovery order; like Checkpoint, it still reads after close()."""
+        conn = sqlite3.connect(self.path, timeout=60)
+        try:
+            for record, in conn.execute('SELECT record FROM jobs ORDER BY position, url'):
+                yield json.loads(record)
+        finally:
+            conn.close()
+
+    def close(self):
+        self.conn.close()